@@ -0,0 +1,137 @@
+# ==========================================
+# 카페 단위 묶음 조회 벤치마크
+# 한 카페의 게시판 여러 개를 감시할 때, 게시판마다 요청하는 방식과
+# 카페 전체 글목록 한 번으로 나눠 쓰는 방식(CafeAggregateFetchBackend)의 요청 수를 비교한다.
+# 대역 서버가 감시 중에도 여러 게시판에 글을 계속 올리고, 놓친 글이 없는지도 확인한다.
+# --busy-boards 를 주면 감시 중 새 글은 앞쪽 게시판 몇 개에만 올라가고 나머지는 조용한 게시판이 된다.
+#
+#   python benchmarks/bench_cafe_aggregation.py --boards 12 --seconds 15
+#   python benchmarks/bench_cafe_aggregation.py --boards 12 --busy-boards 2 --post-rate 5
+# ==========================================
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import DEFAULT_SETTINGS, DriverPool, HttpConnectionPool, MonitorScheduler, create_fetch_backend
+
+
+class SyntheticCafe:
+    # 게시판(menuid) 여러 개에 글이 올라가는 카페 하나
+    def __init__(self, menus, seed=1):
+        self.menus = menus
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.posts = []
+        self.next_id = 10000
+        for _ in range(200):
+            self.add_post()
+
+    def add_post(self, menus=None):
+        with self.lock:
+            self.next_id += self.rng.choice((1, 1, 2))
+            post = {"articleId": self.next_id, "menuId": self.rng.randint(1, menus or self.menus),
+                    "subject": f"글 {self.next_id}", "writerNickname": "작성자"}
+            self.posts.append(post)
+            return post
+
+    def listing(self, menuid, per_page):
+        with self.lock:
+            posts = [p for p in reversed(self.posts) if menuid == 0 or p["menuId"] == menuid]
+            return posts[:per_page]
+
+
+class CafeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        menuid = int(query.get("search.menuid", ["0"])[0])
+        per_page = int(query.get("search.perPage", ["50"])[0])
+        self.server.hits[menuid == 0] += 1
+        body = json.dumps({"message": {"status": "200", "result": {
+            "articleList": self.server.cafe.listing(menuid, per_page)}}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_once(label, aggregation, args):
+    cafe = SyntheticCafe(args.boards)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CafeHandler)
+    server.daemon_threads = True
+    server.cafe = cafe
+    server.hits = {False: 0, True: 0}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    settings = dict(DEFAULT_SETTINGS, naver_api_base=base, naver_web_base=base, selenium_fallback=False,
+                    cafe_aggregation=aggregation, cafe_aggregation_ttl=args.interval / 2)
+    http_pool = HttpConnectionPool(settings["http_pool_per_host"], settings["http_timeout"])
+    fetcher = create_fetch_backend(settings, DriverPool(1), http_pool)
+
+    found = set()
+    ready = threading.Event()
+    baselines = []
+
+    def on_init(item_id, last_id):
+        baselines.append(item_id)
+        if len(baselines) == args.boards:
+            ready.set()
+
+    scheduler = MonitorScheduler(fetcher, max_concurrency=4, callback_init=on_init,
+                                 callback_found=lambda item_id, row: found.add(row.article_id),
+                                 callback_error=lambda item_id, msg: print(f"  [{item_id}] 오류: {msg}"))
+    for menu in range(1, args.boards + 1):
+        scheduler.add_board(f"menu{menu}", f"{base}/cafes/1/menus/{menu}", args.interval)
+    scheduler.start()
+    ready.wait(30)
+
+    posted = []
+    deadline = time.monotonic() + args.seconds
+    while time.monotonic() < deadline:
+        posted.append(cafe.add_post(args.busy_boards)["articleId"])
+        time.sleep(1.0 / args.post_rate)
+    time.sleep(args.interval * 2)
+    scheduler.stop()
+    http_pool.close()
+    server.shutdown()
+
+    missed = len(set(posted) - found)
+    total = server.hits[False] + server.hits[True]
+    print(f"{label:<12} requests={total:<5} (board={server.hits[False]}, cafe={server.hits[True]}) "
+          f"posts={len(posted)} detected={len(found & set(posted))} missed={missed}")
+    if hasattr(fetcher, "stats"):
+        print(f"{'':<12} {fetcher.stats()}")
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카페 단위 묶음 조회와 게시판별 조회의 요청 수 비교")
+    parser.add_argument("--boards", type=int, default=12, help="같은 카페에서 감시할 게시판 수")
+    parser.add_argument("--interval", type=float, default=2.0, help="게시판 감시 주기(초)")
+    parser.add_argument("--seconds", type=float, default=15.0)
+    parser.add_argument("--post-rate", type=float, default=2.0, help="초당 새 글 수")
+    parser.add_argument("--busy-boards", type=int, default=0, help="새 글이 올라가는 게시판 수 (0이면 전체)")
+    args = parser.parse_args()
+
+    print(f"boards={args.boards} interval={args.interval}s seconds={args.seconds} post_rate={args.post_rate}/s")
+    per_board = run_once("per-board", False, args)
+    combined = run_once("cafe", True, args)
+    print(f"요청 수 {per_board / max(combined, 1):.1f}배 감소")
+
+
+if __name__ == "__main__":
+    main()
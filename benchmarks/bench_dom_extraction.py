@@ -0,0 +1,97 @@
+# ==========================================
+# DOM 행 추출 벤치마크
+# 녹화된 게시판 HTML(fixtures/board_list.html)을 헤드리스 크롬으로 열고,
+# 예전 방식(행마다 find_element)과 execute_script 한 번으로 읽는 방식의
+# WebDriver 왕복 횟수와 소요 시간을 비교한다.
+#
+#   python benchmarks/bench_dom_extraction.py --repeat 20
+# ==========================================
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.webdriver.common.by import By
+
+from nCafePostAlarm import DriverPool, SeleniumFetchBackend, PostRow
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "board_list.html"
+
+
+def extract_rows_per_element(driver):
+    # 변경 전 MonitorThread.check_new_posts 와 같은 방식
+    result = []
+    for row in driver.find_elements(By.CSS_SELECTOR, "div.article-board table tbody tr"):
+        try:
+            num_txt = row.find_element(By.CSS_SELECTOR, "td.type_articleNumber").text.strip()
+        except Exception:
+            continue
+        if not num_txt.isdigit():
+            continue
+
+        writer_text = ""
+        try:
+            writer_text = row.find_element(By.CSS_SELECTOR, "td.td_name").text.strip()
+        except Exception:
+            pass
+
+        title_text = ""
+        try:
+            title_text = row.find_element(By.CSS_SELECTOR, "a.article").text.strip()
+        except Exception:
+            pass
+        result.append(PostRow(int(num_txt), writer_text, title_text))
+    return result
+
+
+class RoundTripCounter:
+    # driver.execute 를 감싸서 WebDriver 명령(HTTP 왕복) 수를 센다.
+    def __init__(self, driver):
+        self.count = 0
+        self._execute = driver.execute
+        driver.execute = self._counting_execute
+
+    def _counting_execute(self, driver_command, params=None):
+        self.count += 1
+        return self._execute(driver_command, params)
+
+
+def measure(name, func, driver, counter, repeat):
+    counter.count = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        rows = func(driver)
+    elapsed = time.perf_counter() - started
+    print(f"{name:<14} rows={len(rows):<4} round-trips/poll={counter.count / repeat:<8.1f} "
+          f"time/poll={elapsed / repeat * 1000:.1f}ms")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DOM 행 추출 방식 비교")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pool = DriverPool(1)
+    backend = SeleniumFetchBackend(pool)
+    try:
+        with pool.lease() as driver:
+            driver.get(FIXTURE.as_uri())
+            counter = RoundTripCounter(driver)
+
+            legacy = measure("per-element", extract_rows_per_element, driver, counter, args.repeat)
+            batched = measure("execute_script", backend.extract_rows, driver, counter, args.repeat)
+
+            # 예전 방식은 작성 시각을 읽지 않으므로 번호/작성자/제목만 비교한다.
+            if [r[:3] for r in legacy] != [r[:3] for r in batched]:
+                print("결과 불일치: 두 방식이 서로 다른 행을 돌려주었습니다.")
+                sys.exit(1)
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
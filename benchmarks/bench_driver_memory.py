@@ -0,0 +1,77 @@
+# ==========================================
+# 크롬 드라이버 메모리 장시간 측정 (크롬 필요)
+# replay_server.py 의 게시판들을 Selenium 으로 계속 감시하면서, 일정 간격마다
+# 드라이버 풀의 크롬 메모리(RSS)와 재시작 횟수를 출력한다.
+# 기본 옵션(예전 방식)과 driver_lean + 메모리/사용 기한 재시작을 켠 방식을 차례로 돌려 비교한다.
+#
+#   python benchmarks/bench_driver_memory.py --minutes 30 --max-rss-mb 300
+# ==========================================
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import DEFAULT_SETTINGS, DriverPool, HttpConnectionPool, MonitorScheduler, create_fetch_backend
+from replay_server import ReplayCafe, replay_stream, start_replay_server
+
+
+def run_once(label, pool_options, args):
+    cafe = ReplayCafe(args.boards)
+    server = start_replay_server(cafe)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    stop = threading.Event()
+    threading.Thread(target=replay_stream, args=(cafe, args.post_rate, 0.05, float("inf"), stop), daemon=True).start()
+
+    settings = dict(DEFAULT_SETTINGS, fetch_backend="selenium", naver_api_base=base, naver_web_base=base)
+    driver_pool = DriverPool(args.pool_size, **pool_options)
+    http_pool = HttpConnectionPool(1, settings["http_timeout"])
+    scheduler = MonitorScheduler(create_fetch_backend(settings, driver_pool, http_pool), max_concurrency=args.pool_size,
+                                 callback_error=lambda item_id, msg: print(f"  [{item_id}] 오류: {msg}"))
+    for menuid in range(1, args.boards + 1):
+        scheduler.add_board(f"m{menuid}", f"{base}/ArticleList.nhn?search.clubid=1&search.menuid={menuid}", args.interval)
+    scheduler.start()
+
+    started = time.monotonic()
+    samples = []
+    try:
+        while time.monotonic() - started < args.minutes * 60:
+            time.sleep(args.sample)
+            stats = driver_pool.stats()
+            samples.append(stats["rss"])
+            print(f"{label:<8} t={(time.monotonic() - started) / 60:6.1f}m rss={stats['rss'] / 1048576:7.1f}MB "
+                  f"recycled={stats['recycled']} (rss={stats['recycled_rss']}, age={stats['recycled_age']}) "
+                  f"polls={scheduler.polls}", flush=True)
+    finally:
+        stop.set()
+        scheduler.stop()
+        driver_pool.shutdown()
+        http_pool.close()
+        server.shutdown()
+    samples = [s for s in samples if s]
+    if samples:
+        print(f"{label:<8} rss 처음={samples[0] / 1048576:.1f}MB 마지막={samples[-1] / 1048576:.1f}MB "
+              f"최대={max(samples) / 1048576:.1f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="장시간 감시 중 크롬 메모리 변화 비교")
+    parser.add_argument("--boards", type=int, default=10)
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--interval", type=float, default=5.0, help="게시판 감시 주기(초)")
+    parser.add_argument("--post-rate", type=float, default=1.0, help="카페 전체 초당 새 글 수")
+    parser.add_argument("--minutes", type=float, default=10.0, help="방식별 측정 시간(분)")
+    parser.add_argument("--sample", type=float, default=30.0, help="출력 간격(초)")
+    parser.add_argument("--max-rss-mb", type=float, default=DEFAULT_SETTINGS["driver_max_rss_mb"])
+    parser.add_argument("--max-age-min", type=float, default=DEFAULT_SETTINGS["driver_max_age_min"])
+    args = parser.parse_args()
+
+    run_once("plain", {"lean": False}, args)
+    run_once("managed", {"lean": True, "max_rss_mb": args.max_rss_mb, "max_age_min": args.max_age_min,
+                         "rss_check_interval": 0}, args)
+
+
+if __name__ == "__main__":
+    main()
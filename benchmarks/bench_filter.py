@@ -0,0 +1,100 @@
+# ==========================================
+# 글 필터 벤치마크
+# 규칙(작성자/제목 키워드/정규식) 수를 늘려 가며 합성 글 스트림을 검사하는 시간을 잰다.
+#   - naive    : 규칙마다 `in` / re.search 를 반복하는 방식
+#   - compiled : PostFilter (Aho-Corasick + 합친 정규식)
+# 두 방식의 통과 결과가 같은지도 확인한다.
+#
+#   python benchmarks/bench_filter.py --rules 100 1000 5000 --posts 5000
+# ==========================================
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import PostFilter, PostRow, normalize_filters
+
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후"
+WORDS = ["공지", "후기", "질문", "판매", "구매", "나눔", "이벤트", "정보", "인증", "모집", "event", "sale", "qna"]
+
+
+def random_word(rng, length):
+    return "".join(rng.choice(SYLLABLES) for _ in range(length))
+
+
+def make_rules(rng, count):
+    # 규칙의 대부분은 작성자/키워드 목록이고, 정규식은 일부만 둔다.
+    per_list = max(1, count // 5)
+    return normalize_filters({
+        "include_writers": [random_word(rng, 3) for _ in range(per_list)],
+        "exclude_writers": [random_word(rng, 3) for _ in range(per_list)],
+        "include_keywords": WORDS[:4] + [random_word(rng, 2) for _ in range(per_list)],
+        "exclude_keywords": [random_word(rng, 4) for _ in range(per_list)],
+        "include_regex": [r"\[%s\]" % random_word(rng, 2) for _ in range(max(1, per_list // 20))] + [r"#\d+"],
+        "exclude_regex": [r"^%s\d" % random_word(rng, 2) for _ in range(max(1, per_list // 20))],
+    })
+
+
+def make_posts(rng, count, rules):
+    writers = rules["include_writers"] + [random_word(rng, 3) for _ in range(50)]
+    posts = []
+    for i in range(count):
+        title = f"{rng.choice(WORDS)} {random_word(rng, rng.randint(2, 8))} {random_word(rng, 3)} #{i}"
+        posts.append(PostRow(100000 + i, rng.choice(writers) + random_word(rng, 1), title))
+    return posts
+
+
+def naive_matches(rules, row):
+    writer, title = row.writer.casefold(), row.title.casefold()
+    if any(p.casefold() in writer for p in rules.get("exclude_writers", [])):
+        return False
+    if any(p.casefold() in title for p in rules.get("exclude_keywords", [])):
+        return False
+    if any(re.search(p, row.title, re.IGNORECASE) for p in rules.get("exclude_regex", [])):
+        return False
+    if rules.get("include_writers") and not any(p.casefold() in writer for p in rules["include_writers"]):
+        return False
+    if rules.get("include_keywords") and not any(p.casefold() in title for p in rules["include_keywords"]):
+        return False
+    if rules.get("include_regex") and not any(re.search(p, row.title, re.IGNORECASE) for p in rules["include_regex"]):
+        return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="규칙 수에 따른 글 필터 비용 비교")
+    parser.add_argument("--rules", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'rules':>7}{'compile (ms)':>14}{'naive (us/post)':>18}{'compiled (us/post)':>21}{'passed':>9}")
+    for count in args.rules:
+        rng = random.Random(args.seed)
+        rules = make_rules(rng, count)
+        posts = make_posts(rng, args.posts, rules)
+
+        started = time.perf_counter()
+        post_filter = PostFilter(rules)
+        compile_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        naive = [naive_matches(rules, row) for row in posts]
+        naive_us = (time.perf_counter() - started) / len(posts) * 1e6
+
+        started = time.perf_counter()
+        compiled = [post_filter.matches(row) for row in posts]
+        compiled_us = (time.perf_counter() - started) / len(posts) * 1e6
+
+        if naive != compiled:
+            print("결과 불일치: 두 방식이 서로 다른 글을 통과시켰습니다.")
+            sys.exit(1)
+        print(f"{post_filter.rule_count:>7}{compile_ms:>14.1f}{naive_us:>18.1f}{compiled_us:>21.1f}{sum(compiled):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# ==========================================
+# 항목 조회 벤치마크
+# 항목 1,000개 기준으로 UI 스레드에서 반복되는 작업의 비용을 비교한다.
+#   - tick   : 울리고 있는 알람마다 항목 설정(반복/볼륨)을 찾는 작업 (알람 상태 확인 1회분)
+#   - lookup : 감지 이벤트 하나를 처리할 때 항목을 찾는 작업
+#   - remove : 항목 하나 삭제
+# 예전 방식(리스트 선형 탐색)과 ItemRegistry(ID 키 dict)를 비교한다.
+#
+#   python benchmarks/bench_item_registry.py --items 1000 --alarms 100
+# ==========================================
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import ItemRegistry
+
+
+def make_items(count):
+    return [{
+        "id": str(uuid.uuid4()),
+        "name": f"항목 {i + 1}",
+        "url": "https://cafe.naver.com/ArticleList.nhn?search.clubid=1&search.menuid=1",
+        "interval": 30,
+        "loop": i % 2 == 0,
+        "volume": 70,
+        "nickname_filter": "",
+    } for i in range(count)]
+
+
+def tick_list(items_data, active_alarms):
+    # 변경 전 AppLogic.check_alarm_status 의 조회 부분
+    should_loop = False
+    for item_id in active_alarms:
+        item_data = next((item for item in items_data if item['id'] == item_id), None)
+        if item_data and item_data['loop']:
+            should_loop = True
+    return should_loop
+
+
+def tick_registry(items, active_alarms):
+    should_loop = False
+    for item_id in active_alarms:
+        item_data = items.get(item_id)
+        if item_data and item_data['loop']:
+            should_loop = True
+    return should_loop
+
+
+def timeit(func, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="항목 조회 비용 비교")
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--alarms", type=int, default=100, help="동시에 울리고 있는 알람 수")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    data = make_items(args.items)
+    registry = ItemRegistry(data)
+    active = set(random.sample([d['id'] for d in data], min(args.alarms, len(data))))
+    target = data[-1]['id']
+
+    results = [
+        ("tick", timeit(lambda: tick_list(data, active), args.repeat),
+         timeit(lambda: tick_registry(registry, active), args.repeat)),
+        ("lookup", timeit(lambda: next(d for d in data if d['id'] == target), args.repeat),
+         timeit(lambda: registry.get(target), args.repeat)),
+        ("remove", timeit(lambda: [d for d in data if d['id'] != target], args.repeat),
+         timeit(lambda: (registry.remove(target), registry.add(data[-1])), args.repeat)),
+    ]
+
+    print(f"items={args.items} active_alarms={len(active)}")
+    print(f"{'작업':<8}{'list (us)':>14}{'registry (us)':>16}{'배수':>10}")
+    for name, list_us, registry_us in results:
+        print(f"{name:<8}{list_us:>14.1f}{registry_us:>16.2f}{list_us / max(registry_us, 1e-9):>10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# ==========================================
+# 알림 전달 벤치마크
+# 빠른 웹훅, 느린 웹훅, 가끔 실패하는 웹훅(standin_sink.py)과 파일로 동시에 알림을 보내면서
+#   - 감지 쪽에서 publish() 한 번에 걸리는 시간 (느린 대상이 있어도 늘지 않아야 함)
+#   - 대상별 전달 수/묶음 수/재시도/버림/지연 시간
+# 을 출력한다.
+#
+#   python benchmarks/bench_notifier.py --events 200 --rate 50
+# ==========================================
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import NotifierHub
+from standin_sink import start_sink
+
+
+def main():
+    parser = argparse.ArgumentParser(description="알림 전달 지연/처리량 측정")
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=50.0, help="초당 감지 이벤트 수")
+    parser.add_argument("--slow-delay", type=float, default=1.0, help="느린 웹훅의 응답 지연(초)")
+    parser.add_argument("--queue-size", type=int, default=100)
+    args = parser.parse_args()
+
+    fast = start_sink()
+    slow = start_sink(delay=args.slow_delay)
+    flaky = start_sink(fail_every=3)
+    out_path = os.path.join(tempfile.mkdtemp(), "notify.ndjson")
+
+    def hook(server):
+        return f"http://127.0.0.1:{server.server_address[1]}/hook"
+
+    hub = NotifierHub([
+        {"type": "webhook", "name": "fast", "url": hook(fast), "queue_size": args.queue_size},
+        {"type": "webhook", "name": "slow", "url": hook(slow), "queue_size": args.queue_size},
+        {"type": "webhook", "name": "flaky", "url": hook(flaky), "queue_size": args.queue_size, "backoff": 0.1},
+        {"type": "file", "name": "file", "path": out_path, "queue_size": args.queue_size},
+    ])
+    hub.start()
+
+    publish_max = 0.0
+    publish_total = 0.0
+    for i in range(args.events):
+        event = {"type": "post", "item_id": "bench", "name": "벤치", "article_id": 1000 + i,
+                 "writer": "작성자", "title": f"글 {i}", "time": time.time()}
+        started = time.perf_counter()
+        hub.publish(event)
+        elapsed = time.perf_counter() - started
+        publish_total += elapsed
+        publish_max = max(publish_max, elapsed)
+        time.sleep(1.0 / args.rate)
+
+    time.sleep(1.0)
+    hub.stop(timeout=args.slow_delay * 3)
+
+    print(f"events={args.events} rate={args.rate}/s publish avg={publish_total / args.events * 1e6:.1f}us "
+          f"max={publish_max * 1e6:.1f}us")
+    print(f"{'sink':<8}{'delivered':>10}{'batches':>9}{'retried':>9}{'failed':>8}{'dropped':>9}{'queued':>8}"
+          f"{'lat avg':>10}{'lat max':>10}")
+    for name, stats in hub.stats().items():
+        print(f"{name:<8}{stats['delivered']:>10}{stats['batches']:>9}{stats['retried']:>9}{stats['failed']:>8}"
+              f"{stats['dropped']:>9}{stats['queued']:>8}{stats['latency_avg']:>9.2f}s{stats['latency_max']:>9.2f}s")
+
+
+if __name__ == "__main__":
+    main()
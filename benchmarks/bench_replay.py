@@ -0,0 +1,141 @@
+# ==========================================
+# 감지 경로 재현(replay) 벤치마크
+# replay_server.py 가 게시판 N개에 합성 글 흐름(공지, 삭제, 번호 건너뜀 포함)을 흘려 보내는 동안
+# 실제 스케줄러/백엔드/check_new_posts 로 감시하고, 백엔드별로 다음을 비교한다.
+#   - 처리량      : 초당 폴링 수, 서버 요청 수(304 포함)
+#   - 감지 지연   : 글을 올린 시각 -> 알림(callback_found) 시각
+#   - 놓친/중복 알림 : 삭제되지 않은 새 글 중 알림이 없었던 것 / 같은 글에 두 번 이상 울린 것
+#   - 메모리       : 감시 전후 프로세스(+크롬 자식 프로세스) RSS 증가량을 게시판 수로 나눈 값 (psutil 필요)
+#
+#   python benchmarks/bench_replay.py --boards 20 --post-rate 5 --seconds 20
+#   python benchmarks/bench_replay.py --backends http-json selenium   (selenium 은 크롬 필요)
+# ==========================================
+import argparse
+import gc
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import DEFAULT_SETTINGS, DriverPool, HttpConnectionPool, MonitorScheduler, create_fetch_backend, psutil
+from replay_server import ReplayCafe, replay_stream, start_replay_server
+
+BACKENDS = {
+    "http-json": {"fetch_backend": "http", "http_mode": "json", "cafe_aggregation": False},
+    "http-html": {"fetch_backend": "http", "http_mode": "html", "cafe_aggregation": False},
+    "cafe": {"fetch_backend": "http", "http_mode": "json", "cafe_aggregation": True},
+    "selenium": {"fetch_backend": "selenium"},
+}
+
+
+def process_rss():
+    # 이 프로세스와 자식(크롬드라이버/크롬) 프로세스의 RSS 합
+    if psutil is None:
+        return None
+    proc = psutil.Process()
+    total = proc.memory_info().rss
+    for child in proc.children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            pass
+    return total
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def run_once(name, args):
+    cafe = ReplayCafe(args.boards, seed=args.seed, gap_rate=args.gap_rate)
+    server = start_replay_server(cafe)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    settings = dict(DEFAULT_SETTINGS, naver_api_base=base, naver_web_base=base, selenium_fallback=False,
+                    cafe_aggregation_ttl=args.interval / 2, **BACKENDS[name])
+
+    gc.collect()
+    rss_before = process_rss()
+    driver_pool = DriverPool(settings["driver_pool_size"])
+    http_pool = HttpConnectionPool(settings["http_pool_per_host"], settings["http_timeout"])
+    fetcher = create_fetch_backend(settings, driver_pool, http_pool)
+
+    alarms = {}
+    lock = threading.Lock()
+    ready = threading.Event()
+    baselines = set()
+    errors = []
+
+    def on_init(item_id, last_id):
+        baselines.add(item_id)
+        if len(baselines) == args.boards:
+            ready.set()
+
+    def on_found(item_id, row):
+        now = time.time()
+        with lock:
+            alarms.setdefault(row.article_id, []).append(now)
+
+    scheduler = MonitorScheduler(fetcher, max_concurrency=settings["max_concurrent_fetches"], callback_init=on_init,
+                                 callback_found=on_found, callback_error=lambda item_id, msg: errors.append(msg),
+                                 startup_concurrency=settings["startup_concurrency"], startup_ramp=settings["startup_ramp"])
+    for menuid in range(1, args.boards + 1):
+        scheduler.add_board(f"m{menuid}", f"{base}/ArticleList.nhn?search.clubid=1&search.menuid={menuid}", args.interval)
+    scheduler.start()
+    if not ready.wait(120):
+        print(f"{name:<10} 기준 글을 확인하지 못한 게시판이 있습니다 ({len(baselines)}/{args.boards}) 오류: {errors[:1]}")
+        scheduler.stop()
+        driver_pool.shutdown()
+        http_pool.close()
+        server.shutdown()
+        return
+
+    polls_before, hits_before = scheduler.polls, server.hits
+    started = time.monotonic()
+    posted = replay_stream(cafe, args.post_rate, args.delete_rate, args.seconds)
+    # 마지막 글까지 감지할 수 있도록 주기 두 번만큼 더 감시한다.
+    time.sleep(args.interval * 2 + 1)
+    elapsed = time.monotonic() - started
+    polls, hits = scheduler.polls - polls_before, server.hits - hits_before
+    rss_after = process_rss()
+
+    scheduler.stop()
+    driver_pool.shutdown()
+    http_pool.close()
+    server.shutdown()
+
+    expected = {p["id"]: p["at"] for p in posted if p["id"] not in cafe.deleted}
+    latencies = [alarms[i][0] - at for i, at in expected.items() if i in alarms]
+    missed = len(expected) - len(latencies)
+    duplicates = sum(len(times) - 1 for times in alarms.values())
+    mem = f"{(rss_after - rss_before) / args.boards / 1024:8.0f}KB" if rss_before is not None else "       -"
+    print(f"{name:<10} polls/s={polls / elapsed:6.1f} requests={hits:<6} posts={len(expected):<5} "
+          f"missed={missed:<4} dup={duplicates:<3} lag p50={percentile(latencies, 0.5):5.2f}s "
+          f"p95={percentile(latencies, 0.95):5.2f}s max={max(latencies, default=0.0):5.2f}s mem/board={mem} "
+          f"errors={len(errors)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 글 흐름으로 백엔드별 감지 성능 비교")
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=["http-json", "http-html", "cafe"])
+    parser.add_argument("--boards", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=2.0, help="게시판 감시 주기(초)")
+    parser.add_argument("--seconds", type=float, default=20.0, help="글을 올리는 시간(초)")
+    parser.add_argument("--post-rate", type=float, default=5.0, help="카페 전체 초당 새 글 수")
+    parser.add_argument("--delete-rate", type=float, default=0.05, help="새 글 하나당 최근 글을 지울 확률")
+    parser.add_argument("--gap-rate", type=float, default=0.2, help="글 번호가 건너뛸 확률")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"boards={args.boards} interval={args.interval}s seconds={args.seconds} post_rate={args.post_rate}/s "
+          f"delete_rate={args.delete_rate} gap_rate={args.gap_rate}")
+    for name in args.backends:
+        run_once(name, args)
+
+
+if __name__ == "__main__":
+    main()
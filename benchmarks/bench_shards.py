@@ -0,0 +1,97 @@
+# ==========================================
+# 다중 프로세스 분할 감시 벤치마크
+# 게시판 수백 개를 짧은 주기로 감시할 때, 한 프로세스(shard_workers=0)와
+# 작업 프로세스 N개로 나눈 경우의 초당 폴링 수와 감지 지연을 비교한다.
+# 대역 서버(replay_server.py)는 감시 쪽과 GIL 을 나눠 쓰지 않도록 별도 프로세스에서 돌린다.
+#
+#   python benchmarks/bench_shards.py --boards 300 --workers 0 2 4 --seconds 20
+# ==========================================
+import argparse
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import DEFAULT_SETTINGS, MonitorEngine
+from replay_server import ReplayCafe, replay_stream, make_server
+
+
+def serve(boards, post_rate, seconds, ready):
+    # 대역 서버 프로세스: 주소를 알려 주고, 글 흐름을 재생한 뒤 올린 글 (번호, 시각) 목록을 돌려준다.
+    cafe = ReplayCafe(boards, initial_posts=60)
+    server = make_server(cafe)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    ready.put(server.server_address[1])
+    ready.get()
+    posted = replay_stream(cafe, post_rate, 0.0, seconds)
+    ready.put([(p["id"], p["at"]) for p in posted])
+    ready.get()
+    server.shutdown()
+
+
+def run_once(workers, args):
+    ctx = multiprocessing.get_context("spawn")
+    channel = ctx.Queue()
+    server = ctx.Process(target=serve, args=(args.boards, args.post_rate, args.seconds, channel), daemon=True)
+    server.start()
+    base = f"http://127.0.0.1:{channel.get()}"
+
+    settings = dict(DEFAULT_SETTINGS, naver_api_base=base, naver_web_base=base, http_mode=args.http_mode,
+                    selenium_fallback=False, rate_limit=False, request_budget_per_min=0, state_store=False,
+                    max_concurrent_fetches=args.concurrency, http_pool_per_host=args.concurrency,
+                    startup_concurrency=args.concurrency, startup_ramp=0.0, shard_workers=workers)
+    items = [{"id": f"m{menuid}", "name": f"m{menuid}", "interval": args.interval, "loop": False, "volume": 0,
+              "nickname_filter": "",
+              # 같은 카페로 두면 한 프로세스에 모이므로 게시판마다 다른 카페로 둔다.
+              "url": f"https://cafe.naver.com/ArticleList.nhn?search.clubid={menuid}&search.menuid={menuid}"}
+             for menuid in range(1, args.boards + 1)]
+    engine = MonitorEngine(settings, items)
+    found = {}
+    engine.subscribe(lambda event: found.setdefault(event["article_id"], event["time"]) if event["type"] == "post" else None)
+    engine.start()
+
+    deadline = time.monotonic() + 120
+    while engine.stats()["scheduler"]["startup_pending"] or engine.stats()["scheduler"]["polls"] < args.boards:
+        if time.monotonic() > deadline:
+            break
+        time.sleep(0.5)
+    polls_before = engine.stats()["scheduler"]["polls"]
+    started = time.monotonic()
+    channel.put("go")
+    posted = channel.get()
+    time.sleep(args.interval * 2)
+    elapsed = time.monotonic() - started
+    polls = engine.stats()["scheduler"]["polls"] - polls_before
+    engine.stop()
+    channel.put("done")
+    server.join(5)
+
+    latencies = sorted(found[i] - at for i, at in posted if i in found)
+    p50 = latencies[len(latencies) // 2] if latencies else 0.0
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else 0.0
+    label = f"workers={workers}" if workers else "in-process"
+    print(f"{label:<12} polls/s={polls / elapsed:7.1f} posts={len(posted):<5} missed={len(posted) - len(latencies):<4} "
+          f"lag p50={p50:5.2f}s p95={p95:5.2f}s", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="한 프로세스와 분할 감시의 처리량 비교")
+    parser.add_argument("--boards", type=int, default=300)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2, 4])
+    parser.add_argument("--interval", type=float, default=1.0, help="게시판 감시 주기(초)")
+    parser.add_argument("--concurrency", type=int, default=8, help="프로세스별 동시 폴링 수")
+    parser.add_argument("--http-mode", choices=["json", "html"], default="html")
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--post-rate", type=float, default=5.0, help="카페 전체 초당 새 글 수")
+    args = parser.parse_args()
+
+    print(f"boards={args.boards} interval={args.interval}s http_mode={args.http_mode} cpus={os.cpu_count()}")
+    for workers in args.workers:
+        run_once(workers, args)
+
+
+if __name__ == "__main__":
+    main()
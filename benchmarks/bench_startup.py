@@ -0,0 +1,132 @@
+# ==========================================
+# 시작 소요 시간 벤치마크
+# 대역 서버(standin_server.py)를 띄우고 게시판 N개를 한꺼번에 등록한 뒤,
+# 게시판마다 첫 기준 글을 확인하기까지 걸린 시간(time-to-first-baseline)을 잰다.
+# 동시 요청이 많을수록 느려지는 서버를 흉내 내어(--load-penalty),
+# 한꺼번에 시작하는 방식(burst)과 간격을 두고 나눠 시작하는 방식(staggered)을 비교한다.
+#
+#   python benchmarks/bench_startup.py --boards 30
+#   python benchmarks/bench_startup.py --boards 10 --backend selenium   (크롬 필요)
+# ==========================================
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import (DEFAULT_SETTINGS, DriverPool, HttpConnectionPool, MonitorScheduler,
+                            create_fetch_backend)
+from standin_server import StandinHandler, start_server
+
+
+class LoadedHandler(StandinHandler):
+    # 동시에 처리 중인 요청 수에 비례해 응답이 늦어지는 서버
+    base_delay = 0.05
+    load_penalty = 0.05
+
+    def do_GET(self):
+        with self.server.active_lock:
+            self.server.active += 1
+            active = self.server.active
+        try:
+            time.sleep(self.base_delay + self.load_penalty * (active - 1))
+            super().do_GET()
+        finally:
+            with self.server.active_lock:
+                self.server.active -= 1
+
+
+def run_once(label, settings, boards, base):
+    driver_pool = DriverPool(settings["driver_pool_size"])
+    http_pool = HttpConnectionPool(settings["http_pool_per_host"], settings["http_timeout"])
+    fetcher = create_fetch_backend(settings, driver_pool, http_pool)
+
+    done = threading.Event()
+    baselines = {}
+
+    def on_init(item_id, last_id):
+        baselines[item_id] = time.monotonic()
+        if len(baselines) >= boards:
+            done.set()
+
+    scheduler = MonitorScheduler(
+        fetcher,
+        max_concurrency=settings["max_concurrent_fetches"],
+        callback_init=on_init,
+        callback_error=lambda item_id, msg: print(f"  [{item_id}] 오류: {msg}"),
+        startup_concurrency=settings["startup_concurrency"],
+        startup_ramp=settings["startup_ramp"],
+    )
+    if settings["fetch_backend"] == "selenium" and settings["driver_warmup"]:
+        driver_pool.warm_up()
+
+    started = time.monotonic()
+    for i in range(boards):
+        scheduler.add_board(f"b{i:03d}", f"{base}/ArticleList.nhn?search.clubid=1&search.menuid={i}", 3600)
+    scheduler.start()
+    done.wait(600)
+    scheduler.stop()
+    driver_pool.shutdown()
+    http_pool.close()
+
+    ttfb = sorted(
+        (scheduler.board_stats(item_id)["time_to_baseline"] for item_id in baselines),
+    )
+    if not ttfb:
+        print(f"{label:<10} 기준 글을 확인한 게시판이 없습니다")
+        return
+    total = max(baselines.values()) - started
+    p50 = ttfb[len(ttfb) // 2]
+    p95 = ttfb[min(len(ttfb) - 1, int(len(ttfb) * 0.95))]
+    print(f"{label:<10} boards={len(ttfb):<4} first={ttfb[0]:6.2f}s p50={p50:6.2f}s p95={p95:6.2f}s "
+          f"max={ttfb[-1]:6.2f}s all-ready={total:6.2f}s")
+    return ttfb
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시판별 첫 기준 글 확인 시간 측정")
+    parser.add_argument("--boards", type=int, default=30)
+    parser.add_argument("--backend", choices=["http", "selenium"], default="http")
+    parser.add_argument("--base-delay", type=float, default=0.05, help="요청 하나의 기본 응답 지연(초)")
+    parser.add_argument("--load-penalty", type=float, default=0.05, help="동시 요청 하나당 추가 지연(초)")
+    parser.add_argument("--per-board", action="store_true", help="게시판별 시간을 모두 출력")
+    args = parser.parse_args()
+
+    LoadedHandler.base_delay = args.base_delay
+    LoadedHandler.load_penalty = args.load_penalty
+    server = start_server(handler=LoadedHandler)
+    server.active = 0
+    server.active_lock = threading.Lock()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    settings = dict(DEFAULT_SETTINGS)
+    settings.update({
+        "fetch_backend": args.backend,
+        "http_mode": "html",
+        "selenium_fallback": False,
+        "naver_api_base": base,
+        "naver_web_base": base,
+    })
+
+    # 예전 방식: 모든 게시판이 동시에 첫 조회를 시작
+    burst = dict(settings, max_concurrent_fetches=args.boards, startup_concurrency=args.boards,
+                 startup_ramp=0.0, driver_warmup=False, http_pool_per_host=args.boards)
+    staggered = dict(settings)
+
+    print(f"boards={args.boards} backend={args.backend} base_delay={args.base_delay}s load_penalty={args.load_penalty}s")
+    results = [
+        ("burst", run_once("burst", burst, args.boards, base)),
+        ("staggered", run_once("staggered", staggered, args.boards, base)),
+    ]
+    server.shutdown()
+
+    if args.per_board:
+        for label, ttfb in results:
+            if ttfb:
+                print(f"{label}: " + " ".join(f"{t:.2f}" for t in ttfb))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+# ==========================================
+# 글이 계속 올라오는 네이버 카페 대역(replay) 서버
+# standin_server.py 는 녹화한 페이지를 그대로 돌려주지만, 이 서버는 녹화한 페이지의 틀(공지 영역/행 모양)에
+# 합성 글 흐름을 채워 넣는다. 게시판 N개에 설정한 속도로 새 글이 올라오고,
+# 일부는 삭제되며, 글 번호는 카페 전체가 나눠 쓰므로 게시판 안에서는 중간이 비어 있다.
+#
+#   python benchmarks/replay_server.py --port 8800 --boards 5 --post-rate 1
+#
+# 게시판 주소: http://127.0.0.1:8800/ArticleList.nhn?search.clubid=1&search.menuid=<1..N>
+# ==========================================
+import argparse
+import hashlib
+import html
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+WRITERS = ["하늘정원", "달빛고양이", "초코우유", "운영자보조", "새벽감성", "paper_moon"]
+SUBJECTS = ["팬아트 올려요", "오늘 후기", "인증합니다", "이벤트 참여", "질문 있어요", "나눔합니다"]
+
+# 녹화한 board_list.html 의 일반 글 한 줄과 같은 모양
+ROW_TEMPLATE = """<tr>
+<td class="type_articleNumber">{id}</td>
+<td class="td_article">
+<div class="board-list"><div class="inner_list">
+<a class="article" href="/ArticleRead.nhn?clubid={clubid}&amp;articleid={id}">
+{title}
+</a>
+<a href="/ArticleRead.nhn?clubid={clubid}&amp;articleid={id}&amp;commentFocus=true" class="cmt">[<em>{comments}</em>]</a>
+</div></div>
+</td>
+<td class="td_name">
+<div class="pers_nick_area"><table role="presentation" cellspacing="0"><tbody><tr><td class="p-nick"><a href="#" class="m-tcol-c">{writer}</a></td></tr></tbody></table></div>
+</td>
+<td class="td_date">{date}</td>
+<td class="td_view">{views}</td>
+</tr>
+"""
+
+
+def load_page_frame():
+    # 녹화한 페이지에서 공지 영역까지의 앞부분과, 글 목록 뒤의 꼬리(페이지 이동 등)를 떼어 온다.
+    with open(os.path.join(FIXTURE_DIR, "board_list.html"), encoding="utf-8") as f:
+        text = f.read()
+    marker = '<span class="blind">게시물 목록</span></caption>\n<tbody>\n'
+    start = text.index(marker) + len(marker)
+    end = text.rindex("</tbody>\n</table>\n</div>\n<div class=\"prev-next\">")
+    return text[:start], text[end:]
+
+
+class ReplayCafe:
+    # 게시판(menuid) 여러 개가 글 번호를 나눠 쓰는 카페 하나
+    def __init__(self, boards, seed=1, gap_rate=0.2, initial_posts=120):
+        self.boards = boards
+        self.gap_rate = gap_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.next_id = 50000
+        self.posts = {menuid: [] for menuid in range(1, boards + 1)}   # 게시판별, 오래된 글부터
+        self.created = {}                                              # article_id -> (menuid, 올린 시각)
+        self.deleted = set()
+        for _ in range(initial_posts * boards):
+            self.add_post(at=time.time() - 3600)
+
+    def add_post(self, menuid=None, at=None):
+        with self.lock:
+            menuid = menuid or self.rng.randint(1, self.boards)
+            self.next_id += 1
+            if self.rng.random() < self.gap_rate:
+                # 비공개/다른 카페 글 등으로 번호가 건너뛴 경우
+                self.next_id += self.rng.randint(1, 20)
+            post = {
+                "id": self.next_id,
+                "menuid": menuid,
+                "writer": self.rng.choice(WRITERS),
+                "title": f"{self.rng.choice(SUBJECTS)} #{self.next_id}",
+                "at": time.time() if at is None else at,
+            }
+            self.posts[menuid].append(post)
+            self.created[post["id"]] = (menuid, post["at"])
+            return post
+
+    def delete_recent(self, window=10):
+        # 최근 글 중 하나를 지운다. (작성자가 올리자마자 지우는 경우)
+        with self.lock:
+            menuid = self.rng.randint(1, self.boards)
+            recent = self.posts[menuid][-window:]
+            if not recent:
+                return None
+            post = self.rng.choice(recent)
+            self.posts[menuid].remove(post)
+            self.deleted.add(post["id"])
+            return post["id"]
+
+    def listing(self, menuid, page=1, per_page=50):
+        with self.lock:
+            if menuid == 0:
+                posts = sorted((p for board in self.posts.values() for p in board[-per_page * page:]),
+                               key=lambda p: p["id"])
+            else:
+                posts = self.posts.get(menuid, [])
+            newest_first = posts[::-1]
+            return newest_first[(page - 1) * per_page:page * per_page]
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        menuid = int(query.get("search.menuid", ["0"])[0] or 0)
+        page = int(query.get("search.page", ["1"])[0] or 1)
+        if parts.path == "/ArticleList.nhn":
+            per_page = int(query.get("userDisplay", ["50"])[0])
+            body = self.render_html(self.server.cafe.listing(menuid, page, per_page), query)
+            content_type = "text/html; charset=UTF-8"
+        elif parts.path == "/cafe-web/cafe2/ArticleListV2dot1.json":
+            per_page = int(query.get("search.perPage", ["50"])[0])
+            body = self.render_json(self.server.cafe.listing(menuid, page, per_page))
+            content_type = "application/json; charset=UTF-8"
+        else:
+            self.send_body(404, b"not found", "text/plain")
+            return
+
+        with self.server.stats_lock:
+            self.server.hits += 1
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            with self.server.stats_lock:
+                self.server.not_modified += 1
+            self.send_body(304, b"", None, etag)
+            return
+        self.send_body(200, body, content_type, etag)
+
+    def render_html(self, posts, query):
+        clubid = query.get("search.clubid", ["1"])[0]
+        rows = "".join(ROW_TEMPLATE.format(
+            id=p["id"], clubid=clubid, title=html.escape(p["title"]), writer=html.escape(p["writer"]),
+            date=time.strftime("%H:%M", time.localtime(p["at"])), comments=p["id"] % 7, views=p["id"] % 500,
+        ) for p in posts)
+        head, tail = self.server.frame
+        return (head + rows + tail).encode("utf-8")
+
+    def render_json(self, posts):
+        return json.dumps({"message": {"status": "200", "error": {"code": "", "msg": ""}, "result": {
+            "articleList": [{
+                "articleId": p["id"],
+                "menuId": p["menuid"],
+                "subject": p["title"],
+                "writerNickname": p["writer"],
+                "writeDateTimestamp": int(p["at"] * 1000),
+            } for p in posts],
+            "hasNext": True,
+        }}}, ensure_ascii=False).encode("utf-8")
+
+    def send_body(self, status, body, content_type, etag=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(cafe, host="127.0.0.1", port=0):
+    server = ThreadingHTTPServer((host, port), ReplayHandler)
+    server.daemon_threads = True
+    server.cafe = cafe
+    server.frame = load_page_frame()
+    server.hits = 0
+    server.not_modified = 0
+    server.stats_lock = threading.Lock()
+    return server
+
+
+def start_replay_server(cafe, host="127.0.0.1", port=0):
+    server = make_server(cafe, host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def replay_stream(cafe, post_rate, delete_rate, seconds, stop=None, rng=None):
+    # 평균 post_rate(초당) 로 글을 올리고, 그중 delete_rate 비율만큼 최근 글을 지운다. 올린 글 목록을 돌려준다.
+    rng = rng or random.Random(2)
+    posted = []
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline and not (stop and stop.is_set()):
+        posted.append(cafe.add_post())
+        if rng.random() < delete_rate:
+            cafe.delete_recent()
+        time.sleep(rng.expovariate(post_rate))
+    return posted
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="합성 글 흐름을 돌려주는 네이버 카페 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--boards", type=int, default=5)
+    parser.add_argument("--post-rate", type=float, default=1.0, help="카페 전체 초당 새 글 수")
+    parser.add_argument("--delete-rate", type=float, default=0.05, help="새 글 하나당 최근 글을 지울 확률")
+    args = parser.parse_args()
+
+    cafe = ReplayCafe(args.boards)
+    server = make_server(cafe, args.host, args.port)
+    threading.Thread(target=replay_stream, args=(cafe, args.post_rate, args.delete_rate, float("inf")), daemon=True).start()
+    print(f"replay server: http://{args.host}:{args.port}/ArticleList.nhn?search.clubid=1&search.menuid=1 (~{args.boards})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,99 @@
+# ==========================================
+# 네이버 카페 대역(stand-in) 서버
+# 녹화해 둔 게시판 페이지(fixtures/)를 로컬에서 그대로 돌려준다.
+#
+#   python benchmarks/standin_server.py --port 8800
+#
+# settings.json 에서 아래처럼 지정하면 실제 사이트 대신 이 서버를 감시한다.
+#   "naver_api_base": "http://127.0.0.1:8800",
+#   "naver_web_base": "http://127.0.0.1:8800"
+# ==========================================
+import argparse
+import hashlib
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+ROUTES = {
+    "/ArticleList.nhn": ("board_list", ".html", "text/html; charset=UTF-8"),
+    "/cafe-web/cafe2/ArticleListV2dot1.json": ("article_list", ".json", "application/json; charset=UTF-8"),
+}
+
+
+def load_fixture(prefix, ext, clubid, menuid):
+    # board_list_{clubid}_{menuid}.html 이 있으면 우선 사용하고, 없으면 기본 파일을 쓴다.
+    for name in (f"{prefix}_{clubid}_{menuid}{ext}", f"{prefix}{ext}"):
+        path = os.path.join(FIXTURE_DIR, name)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read()
+    return None
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        route = ROUTES.get(parts.path)
+        if route is None:
+            self.send_body(404, b"not found", "text/plain")
+            return
+
+        prefix, ext, content_type = route
+        clubid = query.get("search.clubid", [""])[0]
+        menuid = query.get("search.menuid", [""])[0]
+        body = load_fixture(prefix, ext, clubid, menuid)
+        if body is None:
+            self.send_body(404, b"no fixture", "text/plain")
+            return
+
+        self.server.hits += 1
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.server.not_modified += 1
+            self.send_body(304, b"", None, etag)
+            return
+        self.send_body(200, body, content_type, etag)
+
+    def send_body(self, status, body, content_type, etag=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(host="127.0.0.1", port=0, handler=StandinHandler):
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.hits = 0
+    server.not_modified = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="네이버 카페 게시판 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), StandinHandler)
+    server.hits = 0
+    server.not_modified = 0
+    print(f"stand-in server: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,85 @@
+# ==========================================
+# 알림 수신 대역(stand-in) 서버
+# 웹훅 알림(POST)을 받아 기록만 하는 로컬 서버. 느린 대상/가끔 실패하는 대상을 흉내 낼 수 있다.
+#
+#   python benchmarks/standin_sink.py --port 8801 --delay 0.5 --fail-every 5
+#
+# settings.json 에서 아래처럼 지정하면 감지된 글이 이 서버로 전달된다.
+#   "notifiers": [{"type": "webhook", "url": "http://127.0.0.1:8801/hook"}]
+# ==========================================
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class SinkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            fail = server.fail_every and server.requests % server.fail_every == 0
+        if server.delay:
+            time.sleep(server.delay)
+        if fail:
+            self.send_body(503, b"unavailable")
+            return
+
+        events = json.loads(body.decode("utf-8")).get("events", [])
+        with server.lock:
+            server.received.extend(events)
+            server.batches += 1
+        if server.verbose:
+            for event in events:
+                print(f"[{event.get('name', '')}] {event.get('article_id')} {event.get('title', '')} - {event.get('writer', '')}")
+        self.send_body(200, b"ok")
+
+    def send_body(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(host="127.0.0.1", port=0, delay=0.0, fail_every=0, verbose=False):
+    server = ThreadingHTTPServer((host, port), SinkHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.delay = delay
+    server.fail_every = fail_every
+    server.verbose = verbose
+    server.requests = 0
+    server.batches = 0
+    server.received = []
+    return server
+
+
+def start_sink(host="127.0.0.1", port=0, delay=0.0, fail_every=0):
+    server = make_server(host, port, delay, fail_every)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="웹훅 알림 수신 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8801)
+    parser.add_argument("--delay", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument("--fail-every", type=int, default=0, help="N번째 요청마다 503 응답 (0 = 실패 없음)")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.delay, args.fail_every, verbose=True)
+    print(f"stand-in sink: http://{args.host}:{args.port}/hook")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
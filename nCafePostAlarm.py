@@ -1,17 +1,61 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
 import json
 import threading
 import time
 import os
-import pygame
 import uuid
 import sys
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import signal
+import argparse
+import queue
+import re
+import heapq
+import hashlib
+import random
+import sqlite3
+import asyncio
+import gzip
+import shutil
+import socket
+import subprocess
+import http.client
+import multiprocessing
+import io
+import cProfile
+import pstats
+from bisect import bisect_left
+from collections import namedtuple, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, unquote
+
+# 서버(데몬)에서는 소리/브라우저가 없을 수 있으므로 선택적으로 불러온다.
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+try:
+    from plyer import notification as desktop_notification
+except ImportError:
+    desktop_notification = None
+
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    from webdriver_manager.chrome import ChromeDriverManager
+except ImportError:
+    webdriver = None
+
+# 크롬 프로세스의 메모리/CPU 측정용 (없으면 측정하지 않는다)
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 # ==========================================
 # [설정] 실행 파일/스크립트 위치 기준 경로 설정
@@ -23,525 +67,4100 @@ else:
 
 ALARM_FILE_PATH = os.path.join(APP_PATH, "alarm.mp3")
 CONFIG_FILE_PATH = os.path.join(APP_PATH, "config.json")
+SETTINGS_FILE_PATH = os.path.join(APP_PATH, "settings.json")
+STATE_DB_PATH = os.path.join(APP_PATH, "state.db")
+DRIVER_CACHE_PATH = os.path.join(APP_PATH, "driver_cache.json")
+PROFILE_DIR = os.path.join(APP_PATH, "profiles")
+
+# settings.json 이 없거나 일부 키가 빠진 경우 사용되는 전역 설정 기본값
+DEFAULT_SETTINGS = {
+    "driver_pool_size": 2,          # 동시에 띄울 크롬 인스턴스 수 (게시판 수와 무관)
+    "driver_lease_timeout": 120,    # 드라이버 대여 대기 최대 시간(초)
+    "driver_health_check_idle": 60, # 이 시간(초) 이상 놀던 드라이버는 대여 전 상태 점검
+    "driver_cache_days": 7,         # 크롬드라이버 경로를 다시 확인하기까지의 기간(일)
+    "driver_warmup": True,          # Selenium 사용 시 시작할 때 드라이버를 미리 하나씩 띄워 둠
+    "selenium_ready_timeout": 10,   # 게시판 프레임(cafe_main)이 준비될 때까지 기다릴 최대 시간(초)
+    "driver_max_rss_mb": 500,       # 크롬(드라이버+브라우저) 메모리가 이보다 커지면 반납할 때 새로 띄움 (0 = 확인 안 함)
+    "driver_max_age_min": 360,      # 이 시간(분)보다 오래 쓴 크롬은 새로 띄움 (0 = 제한 없음)
+    "driver_lean": True,            # 이미지/글꼴/광고·추적 요청을 막고 가벼운 옵션으로 크롬 실행
+    "driver_blocked_urls": [],      # driver_lean 일 때 추가로 막을 주소 패턴 (예: "*.gif")
+    "fetch_backend": "http",        # "http" (브라우저 없이 요청) / "selenium"
+    "http_mode": "json",            # "json" (글목록 API) / "html" (cafe_main iframe 문서)
+    "selenium_fallback": True,      # HTTP 실패 시 Selenium 으로 재시도
+    "cafe_aggregation": True,       # 같은 카페의 게시판들은 카페 전체 글목록 한 번으로 함께 확인 (json 모드)
+    "cafe_aggregation_ttl": 5,      # 카페 전체 글목록을 게시판들이 나눠 쓰는 시간(초)
+    "http_pool_per_host": 4,        # 호스트별로 유지할 keep-alive 연결 수
+    "http_timeout": 10,
+    "naver_api_base": "https://apis.naver.com",
+    "naver_web_base": "https://cafe.naver.com",
+    "max_concurrent_fetches": 4,    # 동시에 진행할 수 있는 폴링 수
+    "rate_limit": True,             # 모든 요청을 호스트/카페별 요청 제한기를 거쳐 보냄
+    "rate_limit_per_host": 5.0,     # 호스트별 초당 요청 수와 순간 허용량
+    "rate_limit_host_burst": 10,
+    "rate_limit_per_cafe": 2.0,     # 카페별 초당 요청 수와 순간 허용량
+    "rate_limit_cafe_burst": 5,
+    "rate_limit_max_wait": 5,       # 이보다 오래 기다려야 하면 폴링을 미루고 다음 차례에 다시 시도(초)
+    "backoff_base": 5,              # 차단(429/403/차단 페이지) 감지 시 호스트 전체 대기 시간(초), 연속될수록 두 배
+    "backoff_max": 300,
+    "breaker_threshold": 5,         # 카페별 연속 실패가 이만큼 쌓이면 해당 카페 감시를 일시 중지
+    "breaker_cooldown": 60,         # 일시 중지 시간(초), 다시 실패할수록 두 배 (최대 30분)
+    "breaker_ramp_steps": 3,        # 재개 후 이만큼 연속 성공하면 정상 속도로 복귀
+    "startup_concurrency": 2,       # 시작 직후 첫 조회(기준 글 확인)를 동시에 진행할 게시판 수
+    "startup_ramp": 0.1,            # 게시판별 첫 조회 시작 간격(초)
+    "request_budget_per_min": 120,  # 모든 항목을 합친 분당 최대 요청 수 (0 = 제한 없음)
+    "adaptive_min_interval": 10,    # 자동 조절 주기의 기본 최소/최대값(초)
+    "adaptive_max_interval": 600,
+    "control_host": "127.0.0.1",    # 로컬 제어 API 주소 (데몬 모드)
+    "control_port": 8765,
+    "control_api_in_gui": False,    # GUI 실행 중에도 제어 API 를 열지 여부
+    "state_store": True,            # 마지막 글 번호를 state.db 에 저장해 재시작 후 이어서 감시
+    "catchup_max_pages": 5,         # 재시작 시 놓친 글을 찾기 위해 거슬러 올라갈 최대 페이지 수
+    "recent_posts_per_board": 200,  # 게시판별로 보관할 최근 글 수
+    "config_save_debounce": 1.0,    # 이 시간(초) 안의 설정 변경은 모아서 한 번에 저장
+    "alarm_backend": "pygame",      # "pygame" / "null" (소리 없음)
+    "alarm_channels": 8,            # 동시에 울릴 수 있는 알람 수
+    "notifiers": [],                # 새 글을 전달할 곳 목록 (webhook / socket / desktop / file)
+    "resource_metrics": True,       # Selenium 폴링마다 크롬 메모리/CPU 를 게시판별로 기록 (psutil 필요)
+    "metrics_dump_path": "",        # 계측 값을 주기적으로 JSON 으로 저장할 파일 ("" = 저장 안 함)
+    "metrics_dump_interval": 60,    # 계측 JSON 저장 주기(초)
+    "shard_workers": 0,             # 게시판을 나눠 감시할 작업 프로세스 수 (0 = 이 프로세스에서 감시)
+    "shard_rebalance_interval": 30, # 작업 프로세스 간 게시판 수를 맞추는 주기(초)
+}
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36"
 
 # ==========================================
 # [데이터 관리 클래스]
 # ==========================================
 class ConfigManager:
     @staticmethod
-    def load_config():
-        if os.path.exists(CONFIG_FILE_PATH):
+    def load_config(retries=3, retry_delay=0.5):
+        if not os.path.exists(CONFIG_FILE_PATH):
+            return []
+        for attempt in range(retries):
             try:
                 with open(CONFIG_FILE_PATH, "r", encoding="utf-8") as f:
                     return json.load(f)
-            except:
+            except ValueError as e:
+                # 내용이 깨진 파일(JSON/인코딩 오류)만 덮어쓰지 않도록 옆에 보관해 두고 빈 목록으로 시작한다.
+                backup_path = f"{CONFIG_FILE_PATH}.corrupt-{int(time.time())}"
+                print(f"Config Error: {e} (보관: {backup_path})")
+                try:
+                    os.replace(CONFIG_FILE_PATH, backup_path)
+                except OSError:
+                    pass
                 return []
+            except OSError as e:
+                # 권한 문제나 다른 프로그램(백신 등)이 잠근 경우: 파일은 멀쩡할 수 있으므로 보관하지 않는다.
+                # 잠시 후 다시 읽어 보고, 끝내 못 읽으면 빈 목록으로 덮어쓰지 않도록 오류를 그대로 올린다.
+                print(f"Config Read Error: {e} ({attempt + 1}/{retries})")
+                if attempt + 1 == retries:
+                    raise
+                time.sleep(retry_delay)
         return []
 
     @staticmethod
     def save_config(data):
-        with open(CONFIG_FILE_PATH, "w", encoding="utf-8") as f:
+        # 임시 파일에 다 쓴 뒤 교체하므로, 쓰는 도중 종료되어도 기존 파일이 남는다.
+        tmp_path = CONFIG_FILE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, CONFIG_FILE_PATH)
+
+    @staticmethod
+    def load_settings():
+        settings = dict(DEFAULT_SETTINGS)
+        if os.path.exists(SETTINGS_FILE_PATH):
+            try:
+                with open(SETTINGS_FILE_PATH, "r", encoding="utf-8") as f:
+                    settings.update(json.load(f))
+            except Exception as e:
+                print(f"Settings Error: {e}")
+        return settings
+
+class ItemRegistry:
+    # 항목 ID -> 항목 데이터. dict 는 삽입 순서를 유지하므로 화면/저장 순서도 그대로 유지된다.
+    def __init__(self, items=()):
+        self._items = {}
+        for data in items:
+            self.add(data)
+
+    def add(self, data):
+        self._items[data['id']] = data
+        return data
+
+    def remove(self, item_id):
+        return self._items.pop(item_id, None)
+
+    def get(self, item_id, default=None):
+        return self._items.get(item_id, default)
+
+    def __contains__(self, item_id):
+        return item_id in self._items
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+    def ids(self):
+        return list(self._items)
+
+    def to_list(self):
+        return list(self._items.values())
+
+
+class ConfigWriter:
+    # 짧은 시간 안에 몰린 저장 요청(볼륨 슬라이더 등)을 모아 한 번만, UI 스레드 밖에서 쓴다.
+    def __init__(self, get_data, debounce=1.0):
+        self.get_data = get_data
+        self.debounce = debounce
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer = None
+        self._dirty = False
+
+        # 통계
+        self.requested = 0
+        self.written = 0
+        self.failed = 0
+
+    def request_save(self):
+        with self._lock:
+            self.requested += 1
+            self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(self.debounce, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+
+        with self._write_lock:
+            for _ in range(3):
+                try:
+                    # 다른 스레드가 목록을 바꾸는 중이면 다시 직렬화한다.
+                    snapshot = json.loads(json.dumps(self.get_data(), ensure_ascii=False))
+                    break
+                except RuntimeError:
+                    continue
+            else:
+                snapshot = None
+
+            try:
+                if snapshot is None:
+                    raise RuntimeError("설정 스냅샷을 만들지 못했습니다")
+                ConfigManager.save_config(snapshot)
+                self.written += 1
+            except Exception as e:
+                self.failed += 1
+                print(f"Config Save Error: {e}")
+                with self._lock:
+                    self._dirty = True
+
+    def stats(self):
+        with self._lock:
+            pending = 1 if self._dirty else 0
+            return {
+                "requested": self.requested,
+                "written": self.written,
+                "failed": self.failed,
+                "coalesced": max(0, self.requested - self.written - pending),
+            }
 
 # ==========================================
-# [개별 감시 스레드 클래스]
+# [크롬드라이버 경로]
+# ChromeDriverManager().install() 은 실행할 때마다 버전 확인(네트워크)을 하므로,
+# 찾은 경로를 driver_cache.json 에 저장해 두고 기간 안에는 그대로 쓴다.
 # ==========================================
-class MonitorThread(threading.Thread):
-    def __init__(self, item_id, url, interval, nickname_filter, callback_init, callback_found, callback_error):
-        super().__init__()
-        self.item_id = item_id
-        self.url = url
-        self.interval = interval
-        self.nickname_filter = nickname_filter
+_driver_path_lock = threading.Lock()
+_driver_path = None
 
-        self.callback_init = callback_init
-        self.callback_found = callback_found
-        self.callback_error = callback_error
 
-        self.is_running = True
-        self.driver = None
-        self.last_article_id = 0
-        self.daemon = True
+def resolve_driver_path(max_age_days=7):
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is not None:
+            return _driver_path
 
-    def run(self):
+        cached = None
+        try:
+            with open(DRIVER_CACHE_PATH, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if not os.path.exists(cached["path"]):
+                cached = None
+        except (OSError, ValueError, KeyError, TypeError):
+            cached = None
+
+        if cached and time.time() - cached.get("resolved_at", 0) < max_age_days * 86400:
+            _driver_path = cached["path"]
+            return _driver_path
+
+        try:
+            path = ChromeDriverManager().install()
+        except Exception as e:
+            # 오프라인 등으로 확인에 실패하면 예전에 찾아 둔 경로라도 쓴다.
+            if cached is None:
+                raise
+            print(f"Driver Resolve Error: {e}")
+            _driver_path = cached["path"]
+            return _driver_path
+
+        try:
+            tmp_path = DRIVER_CACHE_PATH + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"path": path, "resolved_at": time.time()}, f)
+            os.replace(tmp_path, DRIVER_CACHE_PATH)
+        except OSError as e:
+            print(f"Driver Cache Error: {e}")
+        _driver_path = path
+        return _driver_path
+
+# ==========================================
+# [크롬 드라이버 풀]
+# 게시판마다 크롬을 띄우지 않고, 고정된 수의 드라이버를 폴링 때마다 빌려준다.
+# 같은 크롬을 며칠씩 쓰면 메모리가 계속 늘어나므로, 메모리(RSS)나 사용 시간이 기준을 넘은 드라이버는
+# 반납될 때 닫고 다음 대여 때 새로 띄운다. (마지막 글 번호 등 감시 상태는 드라이버와 무관하다)
+# ==========================================
+# driver_lean 일 때 CDP(Network.setBlockedURLs)로 막는 요청. 이미지는 크롬 설정으로 끈다.
+LEAN_BLOCKED_URLS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm",
+    "*veta.naver.com*", "*wcs.naver.net*", "*lcs.naver.com*", "*nlog.naver.com*",
+    "*doubleclick.net*", "*googlesyndication.com*", "*google-analytics.com*", "*googletagmanager.com*",
+]
+
+
+class DriverPool:
+    def __init__(self, size, lease_timeout=120, health_check_idle=60, driver_cache_days=7,
+                 max_rss_mb=0, max_age_min=0, lean=True, blocked_urls=None, rss_check_interval=30):
+        self.size = max(1, int(size))
+        self.lease_timeout = lease_timeout
+        self.health_check_idle = health_check_idle
+        self.driver_cache_days = driver_cache_days
+        self.max_rss = int(max_rss_mb * 1024 * 1024)
+        self.max_age = max_age_min * 60
+        self.lean = lean
+        self.blocked_urls = LEAN_BLOCKED_URLS + list(blocked_urls or [])
+        self.rss_check_interval = rss_check_interval
+
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+        self._warmup_thread = None
+        # 드라이버별 생성 시각과 마지막으로 잰 메모리
+        self._drivers = {}
+
+        # 통계
+        self.in_use = 0
+        self.lease_count = 0
+        self.lease_timeouts = 0
+        self.recycled = 0
+        self.recycled_rss = 0
+        self.recycled_age = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _build_options(self):
         options = Options()
         options.add_argument("--headless")
         options.add_argument("--disable-gpu")
         options.add_argument("--no-sandbox")
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36")
+        options.add_argument(f"user-agent={USER_AGENT}")
+        if self.lean:
+            # 글 목록만 읽으면 되므로 이미지/확장/백그라운드 작업을 끈다.
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_argument("--disable-extensions")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--disable-background-networking")
+            options.add_argument("--disable-component-update")
+            options.add_argument("--disable-features=Translate,MediaRouter,OptimizationHints")
+            options.add_argument("--mute-audio")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.plugins": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+        return options
+
+    def _create_driver(self):
+        if webdriver is None:
+            raise RuntimeError("selenium 이 설치되어 있지 않습니다")
+        service = Service(resolve_driver_path(self.driver_cache_days))
+        driver = webdriver.Chrome(service=service, options=self._build_options())
+        if self.lean:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+            except Exception as e:
+                print(f"Driver Block URLs Error: {e}")
+        with self._lock:
+            self._drivers[driver] = {"born": time.time(), "rss": None, "checked": 0.0}
+        return driver
 
+    def _recycle_reason(self, driver, check_rss=True):
+        # 새로 띄워야 하면 "age"/"rss", 아니면 None
+        info = self._drivers.get(driver)
+        if info is None:
+            return None
+        now = time.time()
+        if self.max_age and now - info["born"] >= self.max_age:
+            return "age"
+        if check_rss and self.max_rss and now - info["checked"] >= self.rss_check_interval:
+            # 폴링마다 재면 psutil 호출이 늘어나므로 드라이버별로 rss_check_interval 에 한 번만 잰다.
+            self.driver_usage(driver)
+        if self.max_rss and info["rss"] is not None and info["rss"] >= self.max_rss:
+            return "rss"
+        return None
+
+    def _is_healthy(self, driver):
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
 
-            self.driver.get(self.url)
-            time.sleep(2)
+    def _quit(self, driver):
+        with self._lock:
+            self._drivers.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
 
-            self.last_article_id = self.get_latest_post_id()
-            self.callback_init(self.item_id, self.last_article_id)
+    def _count_recycle(self, reason):
+        with self._lock:
+            self.recycled += 1
+            if reason == "rss":
+                self.recycled_rss += 1
+            elif reason == "age":
+                self.recycled_age += 1
 
-            while self.is_running:
-                for _ in range(self.interval):
-                    if not self.is_running: break
-                    time.sleep(1)
+    def _acquire(self):
+        deadline = time.time() + self.lease_timeout
+        while True:
+            try:
+                driver, idle_since = self._idle.get_nowait()
+                return driver, idle_since
+            except queue.Empty:
+                pass
 
-                if not self.is_running: break
+            with self._lock:
+                if self._created < self.size:
+                    self._created += 1
+                    return None, None
 
-                try:
-                    self.driver.refresh()
-                    time.sleep(2)
-                    self.check_new_posts()
-                except Exception as e:
-                    if self.is_running:
-                        self.callback_error(self.item_id, str(e))
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutError("드라이버 대기 시간 초과")
+            try:
+                return self._idle.get(timeout=min(remaining, 1.0))
+            except queue.Empty:
+                if self._closed:
+                    raise RuntimeError("드라이버 풀이 종료되었습니다")
 
-        except Exception as e:
-            if self.is_running:
-                self.callback_error(self.item_id, str(e))
-        finally:
-            self.close_driver_safe()
+    def _release(self, driver, broken):
+        with self._lock:
+            self.in_use -= 1
+        reason = None if broken or self._closed else self._recycle_reason(driver)
+        if broken or self._closed or reason:
+            self._quit(driver)
+            with self._lock:
+                self._created -= 1
+            if broken or reason:
+                self._count_recycle(reason)
+            if reason and not self._closed:
+                # 다음 폴링이 크롬 기동을 기다리지 않도록 대신할 드라이버를 미리 띄워 둔다.
+                self.warm_up(1)
+            return
+        self._idle.put((driver, time.time()))
+
+    def warm_up(self, count=None):
+        # 첫 폴링이 크롬 기동을 기다리지 않도록 백그라운드에서 하나씩 미리 띄워 둔다.
+        count = self.size if count is None else min(int(count), self.size)
+        self._warmup_thread = threading.Thread(target=self._warm_up, args=(count,), name="DriverWarmup", daemon=True)
+        self._warmup_thread.start()
+
+    def _warm_up(self, count):
+        for _ in range(count):
+            with self._lock:
+                if self._closed or self._created >= self.size:
+                    return
+                self._created += 1
+            try:
+                driver = self._create_driver()
+            except Exception as e:
+                with self._lock:
+                    self._created -= 1
+                print(f"Driver Warmup Error: {e}")
+                return
+            if self._closed:
+                self._quit(driver)
+                return
+            self._idle.put((driver, time.time()))
+
+    @contextmanager
+    def lease(self):
+        if self._closed:
+            raise RuntimeError("드라이버 풀이 종료되었습니다")
 
-    def get_latest_post_id(self):
+        started = time.time()
         try:
-            self.driver.switch_to.frame("cafe_main")
-        except: pass
+            driver, idle_since = self._acquire()
+        except TimeoutError:
+            with self._lock:
+                self.lease_timeouts += 1
+            raise
 
         try:
-            rows = self.driver.find_elements(By.CSS_SELECTOR, "div.article-board table tbody tr")
-            for row in rows:
-                try:
-                    num_txt = row.find_element(By.CSS_SELECTOR, "td.type_articleNumber").text.strip()
-                    if num_txt.isdigit():
-                        return int(num_txt)
-                except: continue
-        except: pass
-        return 0
+            # 오래 놀던 드라이버는 크래시 여부를 확인하고, 죽었으면 새로 띄운다.
+            if driver is not None and time.time() - idle_since >= self.health_check_idle:
+                if not self._is_healthy(driver):
+                    self._quit(driver)
+                    self._count_recycle(None)
+                    driver = None
+            # 노는 동안 사용 기한이 지난 드라이버도 빌려주기 전에 새로 띄운다.
+            if driver is not None and self._recycle_reason(driver, check_rss=False) == "age":
+                self._quit(driver)
+                self._count_recycle("age")
+                driver = None
+            if driver is None:
+                driver = self._create_driver()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+        waited = time.time() - started
+        with self._lock:
+            self.in_use += 1
+            self.lease_count += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
 
-    def check_new_posts(self):
+        broken = False
         try:
-            self.driver.switch_to.frame("cafe_main")
-        except: pass
+            yield driver
+        except Exception:
+            # 사용 중 오류가 난 드라이버는 상태를 확인해 재사용 여부를 결정한다.
+            broken = not self._is_healthy(driver)
+            raise
+        finally:
+            self._release(driver, broken)
 
-        rows = self.driver.find_elements(By.CSS_SELECTOR, "div.article-board table tbody tr")
-        found_new = False
-        max_id_in_page = self.last_article_id
+    def driver_usage(self, driver):
+        # 크롬드라이버와 그 자식(브라우저/렌더러) 프로세스의 메모리(RSS, 바이트)와 누적 CPU 시간(초)
+        if psutil is None:
+            return None
+        try:
+            root = psutil.Process(driver.service.process.pid)
+            procs = [root] + root.children(recursive=True)
+        except Exception:
+            return None
+        rss = 0
+        cpu = 0.0
+        for proc in procs:
+            try:
+                with proc.oneshot():
+                    rss += proc.memory_info().rss
+                    times = proc.cpu_times()
+                    cpu += times.user + times.system
+            except psutil.Error:
+                pass
+        with self._lock:
+            info = self._drivers.get(driver)
+            if info is not None:
+                info["rss"] = rss
+                info["checked"] = time.time()
+        return rss, cpu
 
-        for row in rows:
+    def stats(self):
+        now = time.time()
+        with self._lock:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "in_use": self.in_use,
+                "idle": self._idle.qsize(),
+                "occupancy": self.in_use / self.size,
+                "lease_count": self.lease_count,
+                "lease_timeouts": self.lease_timeouts,
+                "recycled": self.recycled,
+                "recycled_rss": self.recycled_rss,
+                "recycled_age": self.recycled_age,
+                "rss": sum(info["rss"] or 0 for info in self._drivers.values()),
+                "oldest_age": max((now - info["born"] for info in self._drivers.values()), default=0.0),
+                "wait_avg": self.wait_total / self.lease_count if self.lease_count else 0.0,
+                "wait_max": self.wait_max,
+            }
+
+    def shutdown(self):
+        self._closed = True
+        while True:
             try:
-                try:
-                    num_element = row.find_element(By.CSS_SELECTOR, "td.type_articleNumber")
-                except: continue
+                driver, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(driver)
 
-                num_txt = num_element.text.strip()
-                if not num_txt.isdigit(): continue
+# ==========================================
+# [계측]
+# 폴링 한 번을 단계별(대기/요청/프레임 전환/파싱/필터/알림 전달)로 나눠 시간을 재고,
+# 게시판별 크롬 메모리/CPU 와 감지 지연(글 작성 -> 알림)을 모은다.
+# 백엔드는 실행기 스레드에서 돌기 때문에, 진행 중인 폴링의 기록은 스레드 로컬로 넘긴다.
+# ==========================================
+POLL_PHASES = ("queue_wait", "rate_wait", "driver_lease", "network", "frame_switch", "parse",
+               "fetch", "filter", "dispatch", "store", "total")
+METRIC_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+LAG_BUCKETS = (1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
 
-                current_id = int(num_txt)
-                if current_id <= self.last_article_id: break
-                if current_id > max_id_in_page: max_id_in_page = current_id
+_trace_local = threading.local()
 
-                writer_text = ""
-                try:
-                    writer_text = row.find_element(By.CSS_SELECTOR, "td.td_name").text.strip()
-                except: pass
 
-                is_match = False
-                if not self.nickname_filter: is_match = True
-                elif self.nickname_filter in writer_text: is_match = True
+class PollTrace:
+    def __init__(self):
+        self.phases = {}
+        self.values = {}
 
-                if is_match:
-                    found_new = True
-                    self.callback_found(self.item_id, current_id, writer_text)
-            except: continue
+    def add(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
 
-        if max_id_in_page > self.last_article_id:
-            self.last_article_id = max_id_in_page
+    @contextmanager
+    def phase(self, name):
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(name, time.monotonic() - started)
 
-    def stop_and_quit_driver(self):
-        self.is_running = False
-        self.close_driver_safe()
 
-    def close_driver_safe(self):
-        if self.driver:
-            try:
-                self.driver.quit()
-            except:
-                pass
-            finally:
-                self.driver = None
-
-# ==========================================
-# [GUI 항목 위젯 클래스]
-# ==========================================
-class MonitorItemWidget(tk.Frame):
-    def __init__(self, parent, data, app_logic):
-        super().__init__(parent, bg="white", highlightbackground="black", highlightthickness=1, pady=5)
-        self.app_logic = app_logic
-        self.data = data
-        self.item_id = data['id']
-
-        self.pack(fill="x", pady=2, padx=2)
-        self.columnconfigure(1, weight=1)
-
-        # 1. 항목 이름
-        self.name_var = tk.StringVar(value=data.get("name", "항목"))
-        self.lbl_name = tk.Label(self, textvariable=self.name_var, font=("맑은 고딕", 10, "bold"), bg="white", width=15, anchor="w")
-        self.lbl_name.grid(row=0, column=0, padx=10, sticky="w")
-        self.lbl_name.bind("<Button-1>", self.enable_edit_name)
-
-        self.ent_name = tk.Entry(self, textvariable=self.name_var, font=("맑은 고딕", 10), width=15)
-        self.ent_name.bind("<Return>", self.save_name)
-        self.ent_name.bind("<FocusOut>", self.save_name)
-
-        # 2. 상태 메시지
-        self.status_var = tk.StringVar(value="초기화 중...")
-        self.lbl_status = tk.Label(self, textvariable=self.status_var, font=("맑은 고딕", 9), bg="white", anchor="w")
-        self.lbl_status.grid(row=0, column=1, padx=5, sticky="ew")
-
-        # 3. 우측 컨트롤
-        ctrl_frame = tk.Frame(self, bg="white")
-        ctrl_frame.grid(row=0, column=2, padx=5)
-
-        self.btn_stop = tk.Button(ctrl_frame, text="알림끄기", font=("맑은 고딕", 8, "bold"),
-                                  bg="#dddddd", fg="black", state="disabled", command=self.stop_alarm)
-        self.btn_stop.pack(side="left", padx=5)
-
-        tk.Label(ctrl_frame, text="볼륨", bg="white", font=("맑은 고딕", 8)).pack(side="left")
-        self.scale_vol = ttk.Scale(ctrl_frame, from_=0, to=100, orient="horizontal", length=80, command=self.update_volume)
-        self.scale_vol.set(data.get("volume", 70))
-        self.scale_vol.pack(side="left", padx=5)
-
-        # 4. 우클릭 메뉴
-        self.context_menu = tk.Menu(self, tearoff=0)
-
-        self.menu_interval = tk.Menu(self.context_menu, tearoff=0)
-        self.interval_var = tk.IntVar(value=data.get("interval", 30))
-        for sec in [10, 30, 60, 300, 600]:
-            self.menu_interval.add_radiobutton(label=f"{sec}초", variable=self.interval_var, value=sec, command=self.update_interval)
-        self.context_menu.add_cascade(label="감시 주기 설정", menu=self.menu_interval)
-
-        self.menu_loop = tk.Menu(self.context_menu, tearoff=0)
-        self.loop_var = tk.BooleanVar(value=data.get("loop", True))
-        self.menu_loop.add_radiobutton(label="무한 반복", variable=self.loop_var, value=True, command=self.update_loop)
-        self.menu_loop.add_radiobutton(label="1회 반복", variable=self.loop_var, value=False, command=self.update_loop)
-        self.context_menu.add_cascade(label="알람 반복 설정", menu=self.menu_loop)
-
-        self.context_menu.add_separator()
-        self.context_menu.add_command(label="항목 삭제", command=self.delete_item, foreground="red")
-
-        self.bind("<Button-3>", self.show_context_menu)
-        self.lbl_name.bind("<Button-3>", self.show_context_menu)
-        self.lbl_status.bind("<Button-3>", self.show_context_menu)
-
-    def enable_edit_name(self, event):
-        self.lbl_name.grid_remove()
-        self.ent_name.grid(row=0, column=0, padx=10, sticky="w")
-        self.ent_name.focus_set()
-
-    def save_name(self, event=None):
-        new_name = self.name_var.get()
-        self.ent_name.grid_remove()
-        self.lbl_name.grid()
-        self.data['name'] = new_name
-        self.app_logic.save_data()
-
-    def update_volume(self, val):
-        self.data['volume'] = float(val)
-        self.app_logic.save_data()
-
-    def update_interval(self):
-        self.data['interval'] = self.interval_var.get()
-        self.app_logic.save_data()
-        self.app_logic.restart_thread(self.item_id)
-
-    def update_loop(self):
-        self.data['loop'] = self.loop_var.get()
-        self.app_logic.save_data()
-
-    def show_context_menu(self, event):
-        self.context_menu.post(event.x_root, event.y_root)
-
-    def delete_item(self):
-        if messagebox.askyesno("삭제", f"'{self.name_var.get()}' 항목을 삭제하시겠습니까?"):
-            self.app_logic.remove_item(self.item_id)
-
-    def stop_alarm(self):
-        self.app_logic.stop_alarm(self.item_id)
-
-    def set_status(self, text, is_alarm=False):
-        self.status_var.set(text)
-        if is_alarm:
-            self.lbl_status.config(fg="red", font=("맑은 고딕", 9, "bold"))
-            self.config(highlightbackground="red", highlightthickness=2)
-            self.btn_stop.config(state="normal", bg="#ffcccc", fg="red")
-        else:
-            self.lbl_status.config(fg="black", font=("맑은 고딕", 9))
-            self.config(highlightbackground="black", highlightthickness=1)
-            self.btn_stop.config(state="disabled", bg="#dddddd", fg="black")
+def current_trace():
+    return getattr(_trace_local, "trace", None)
+
+
+@contextmanager
+def trace_phase(name):
+    # 폴링 밖(벤치마크, 직접 호출 등)에서는 아무것도 하지 않는다.
+    trace = current_trace()
+    if trace is None:
+        yield
+        return
+    with trace.phase(name):
+        yield
+
+
+def trace_value(name, value):
+    trace = current_trace()
+    if trace is not None:
+        trace.values[name] = value
+
+
+class LatencyStat:
+    # 누적 히스토그램 (Prometheus histogram 과 같은 le 구간)
+    def __init__(self, buckets=METRIC_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def add(self, value):
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        self.last = value
+        i = bisect_left(self.buckets, value)
+        if i < len(self.counts):
+            self.counts[i] += 1
+
+    def quantile(self, q):
+        # 구간 상한으로 어림한 값. 마지막 구간을 넘으면 최댓값.
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "avg": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": self.max,
+            "last": self.last,
+        }
+
+
+def _prom_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PollMetrics:
+    def __init__(self, recent_errors=50):
+        self._lock = threading.Lock()
+        self.phases = {name: LatencyStat() for name in POLL_PHASES}
+        self.lag = LatencyStat(LAG_BUCKETS)
+        self.boards = {}
+        self.recent_errors = deque(maxlen=recent_errors)
+
+    def _board(self, item_id):
+        board = self.boards.get(item_id)
+        if board is None:
+            board = self.boards[item_id] = {
+                "poll": LatencyStat(),
+                "lag": LatencyStat(LAG_BUCKETS),
+                "last_phases": {},
+                "driver_rss": None,
+                "driver_cpu": 0.0,
+                "errors": 0,
+                "last_error": None,
+                "last_error_at": None,
+            }
+        return board
+
+    def record_poll(self, item_id, trace):
+        with self._lock:
+            for name, seconds in trace.phases.items():
+                stat = self.phases.get(name)
+                if stat is not None:
+                    stat.add(seconds)
+            board = self._board(item_id)
+            board["last_phases"] = dict(trace.phases)
+            if "total" in trace.phases:
+                board["poll"].add(trace.phases["total"])
+            if "driver_rss" in trace.values:
+                board["driver_rss"] = trace.values["driver_rss"]
+            board["driver_cpu"] += trace.values.get("driver_cpu", 0.0)
+
+    def record_lag(self, item_id, seconds):
+        with self._lock:
+            self.lag.add(seconds)
+            self._board(item_id)["lag"].add(seconds)
+
+    def record_error(self, item_id, message):
+        # UI 에는 줄인 문구만 보이므로, 전체 오류 문구는 여기에 남긴다.
+        now = time.time()
+        with self._lock:
+            board = self._board(item_id)
+            board["errors"] += 1
+            board["last_error"] = message
+            board["last_error_at"] = now
+            self.recent_errors.append({"item_id": item_id, "at": now, "error": message})
+
+    def last_error(self, item_id):
+        with self._lock:
+            board = self.boards.get(item_id)
+            return (board["last_error"], board["last_error_at"]) if board else (None, None)
+
+    def forget(self, item_id):
+        with self._lock:
+            self.boards.pop(item_id, None)
+
+    def board_snapshot(self, item_id):
+        with self._lock:
+            board = self.boards.get(item_id)
+            if board is None:
+                return None
+            return {
+                "poll": board["poll"].snapshot(),
+                "lag": board["lag"].snapshot(),
+                "last_phases": dict(board["last_phases"]),
+                "driver_rss": board["driver_rss"],
+                "driver_cpu": board["driver_cpu"],
+                "errors": board["errors"],
+                "last_error": board["last_error"],
+                "last_error_at": board["last_error_at"],
+            }
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "phases": {name: stat.snapshot() for name, stat in self.phases.items() if stat.count},
+                "lag": self.lag.snapshot(),
+                "recent_errors": list(self.recent_errors),
+            }
+
+    def prometheus(self, board_names=None, gauges=()):
+        # Prometheus 텍스트 형식(0.0.4). gauges: (이름, 형식, 설명, 값) 목록
+        board_names = board_names or {}
+        lines = []
+
+        def histogram(name, help_text, stats):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, stat in stats:
+                cumulative = 0
+                for bound, count in zip(stat.buckets, stat.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {stat.count}')
+                lines.append(f"{name}_sum{{{labels}}} {stat.sum:.6f}")
+                lines.append(f"{name}_count{{{labels}}} {stat.count}")
+
+        def per_board(name, metric_type, help_text, key):
+            values = [(item_id, b[key]) for item_id, b in self.boards.items() if b[key] is not None]
+            if not values:
+                return
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for item_id, value in values:
+                lines.append(f"{name}{{{board_labels(item_id)}}} {value}")
+
+        def board_labels(item_id):
+            return f'board="{_prom_label(item_id)}",name="{_prom_label(board_names.get(item_id, ""))}"'
+
+        with self._lock:
+            histogram("ncafe_poll_phase_seconds", "폴링 단계별 소요 시간",
+                      [(f'phase="{name}"', stat) for name, stat in self.phases.items()])
+            histogram("ncafe_detection_lag_seconds", "글 작성부터 알림까지 걸린 시간", [('scope="all"', self.lag)])
+            histogram("ncafe_board_poll_seconds", "게시판별 폴링 전체 소요 시간",
+                      [(board_labels(item_id), b["poll"]) for item_id, b in self.boards.items()])
+            histogram("ncafe_board_detection_lag_seconds", "게시판별 감지 지연",
+                      [(board_labels(item_id), b["lag"]) for item_id, b in self.boards.items() if b["lag"].count])
+            per_board("ncafe_board_driver_rss_bytes", "gauge", "마지막 폴링 때 크롬(드라이버+브라우저) 메모리", "driver_rss")
+            per_board("ncafe_board_driver_cpu_seconds_total", "counter", "게시판 폴링 동안 쓴 크롬 CPU 시간", "driver_cpu")
+            per_board("ncafe_board_errors_total", "counter", "게시판별 조회 오류 수", "errors")
+
+        for name, metric_type, help_text, value in gauges:
+            if value is None:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
 
 # ==========================================
-# [메인 애플리케이션 로직]
+# [요청 제한]
+# 모든 요청은 호스트별/카페별 토큰 버킷을 거친다. (예약 -> 필요한 만큼 대기 -> 요청)
+# 차단 응답을 받으면 같은 호스트의 모든 요청이 함께 물러나고(지수 백오프 + 지터),
+# 카페별로 실패가 쌓이면 서킷 브레이커가 그 카페를 잠시 멈췄다가 천천히 재개한다.
 # ==========================================
-class AppLogic:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("네이버 카페 멀티 알리미")
-        self.root.geometry("650x500")
+BLOCK_PAGE_MARKERS = ("비정상적인 접근", "자동입력 방지", "일시적으로 제한", "captcha", "Too Many Requests")
 
-        self.items_data = ConfigManager.load_config()
-        self.threads = {}
-        self.widgets = {}
-        self.active_alarms = set()
 
-        pygame.mixer.init()
-        self.load_music()
-        self.setup_ui()
-        self.restore_items()
-        self.check_alarm_status()
+def looks_blocked(text, expected_marker):
+    # 정상 목록(expected_marker 포함)이 아니면서 차단 문구가 있는 응답
+    if expected_marker in text:
+        return False
+    head = text[:5000]
+    return any(marker in head for marker in BLOCK_PAGE_MARKERS)
 
-    def load_music(self):
-        if os.path.exists(ALARM_FILE_PATH):
-            try:
-                pygame.mixer.music.load(ALARM_FILE_PATH)
-            except Exception as e:
-                print(f"Audio Error: {e}")
-        else:
-            print(f"File Not Found: {ALARM_FILE_PATH}")
 
-    def setup_ui(self):
-        # 상단 프레임
-        top_frame = tk.Frame(self.root, pady=10, padx=10, bg="#f0f0f0")
-        top_frame.pack(fill="x")
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
 
-        # 1. URL 입력 라벨
-        tk.Label(top_frame, text="게시판 링크 :", bg="#f0f0f0", font=("맑은 고딕", 10, "bold")).pack(side="left")
+    def delay(self, now):
+        if not self.rate:
+            return 0.0
+        # 버킷이 now 를 잰 뒤에 만들어졌을 수도 있으므로 경과 시간은 0 이상으로 본다.
+        self.tokens = min(self.burst, self.tokens + max(0.0, now - self.updated) * self.rate)
+        self.updated = max(self.updated, now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
 
-        # 2. URL 입력창
-        self.entry_url = tk.Entry(top_frame, font=("맑은 고딕", 10))
-        self.entry_url.pack(side="left", fill="x", expand=True, padx=10)
-        self.entry_url.bind("<Return>", lambda event: self.add_new_item())
+    def take(self):
+        if self.rate:
+            self.tokens -= 1
 
-        # 3. 입력 버튼
-        btn_add = tk.Button(top_frame, text="입력 버튼", command=self.add_new_item, bg="#4a90e2", fg="white", font=("맑은 고딕", 9, "bold"))
-        btn_add.pack(side="left")
 
-        # [NEW] 4. 사용법 버튼 (우측 정렬을 위해 side=right)
-        btn_guide = tk.Button(top_frame, text="사용법", command=self.show_guide, bg="#9b59b6", fg="white", font=("맑은 고딕", 9, "bold"))
-        btn_guide.pack(side="right", padx=(10, 0))
+class CircuitBreaker:
+    # closed(정상) -> open(중지) -> half_open(간격을 두고 시험 요청, 성공이 쌓이면 closed)
+    def __init__(self, threshold=5, cooldown=60, ramp_steps=3, max_cooldown=1800):
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self.ramp_steps = max(1, ramp_steps)
+        self.max_cooldown = max_cooldown
+        self.state = "closed"
+        self.failures = 0
+        self.trips = 0
+        self.successes = 0
+        self.opened_until = 0.0
+        self.next_probe = 0.0
+        self.current_cooldown = cooldown
 
-        # 메인 리스트 컨테이너
-        list_container = tk.Frame(self.root)
-        list_container.pack(fill="both", expand=True, padx=10, pady=10)
+    def check(self, now):
+        # 지금 요청해도 되면 0, 아니면 기다려야 할 시간(초)
+        if self.state == "open":
+            if now < self.opened_until:
+                return self.opened_until - now
+            self.state = "half_open"
+            self.successes = 0
+            self.next_probe = now
+        if self.state == "half_open":
+            if now < self.next_probe:
+                return self.next_probe - now
+            # 성공할수록 시험 요청 간격을 절반씩 줄인다.
+            self.next_probe = now + self.current_cooldown / (2 ** (self.successes + 1))
+        return 0.0
 
-        self.canvas = tk.Canvas(list_container, bg="white", highlightthickness=0)
-        self.scrollbar = ttk.Scrollbar(list_container, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = tk.Frame(self.canvas, bg="white")
+    def success(self):
+        self.failures = 0
+        if self.state == "half_open":
+            self.successes += 1
+            if self.successes >= self.ramp_steps:
+                self.state = "closed"
+                self.trips = 0
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    def failure(self, now):
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.threshold:
+            self.trips += 1
+            base = min(self.max_cooldown, self.cooldown * (2 ** (self.trips - 1)))
+            self.current_cooldown = base * random.uniform(0.8, 1.2)
+            self.opened_until = now + self.current_cooldown
+            self.state = "open"
+            self.failures = 0
+
+    def stats(self, now):
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "resume_in": max(0.0, self.opened_until - now) if self.state == "open" else 0.0,
+        }
+
+
+class RequestLimiter:
+    def __init__(self, per_host=5.0, host_burst=10, per_cafe=2.0, cafe_burst=5, max_wait=5,
+                 backoff_base=5, backoff_max=300, breaker_threshold=5, breaker_cooldown=60, breaker_ramp_steps=3):
+        self.per_host = per_host
+        self.host_burst = host_burst
+        self.per_cafe = per_cafe
+        self.cafe_burst = cafe_burst
+        self.max_wait = max_wait
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker_options = (breaker_threshold, breaker_cooldown, breaker_ramp_steps)
+
+        self._lock = threading.Lock()
+        self._hosts = {}
+        self._cafes = {}
+
+        # 통계
+        self.granted = 0
+        self.delayed = 0
+        self.wait_total = 0.0
+        self.deferred = 0
+        self.blocked = 0
+        self.errors = 0
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(
+            per_host=settings["rate_limit_per_host"],
+            host_burst=settings["rate_limit_host_burst"],
+            per_cafe=settings["rate_limit_per_cafe"],
+            cafe_burst=settings["rate_limit_cafe_burst"],
+            max_wait=settings["rate_limit_max_wait"],
+            backoff_base=settings["backoff_base"],
+            backoff_max=settings["backoff_max"],
+            breaker_threshold=settings["breaker_threshold"],
+            breaker_cooldown=settings["breaker_cooldown"],
+            breaker_ramp_steps=settings["breaker_ramp_steps"],
         )
 
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw", width=600)
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-
-        self.canvas.pack(side="left", fill="both", expand=True)
-        self.scrollbar.pack(side="right", fill="y")
-        self.canvas.bind('<Configure>', lambda e: self.canvas.itemconfig(self.canvas.create_window((0,0), window=self.scrollable_frame, anchor='nw'), width=e.width))
-
-    # [NEW] 사용법 안내 팝업
-    def show_guide(self):
-        guide_win = tk.Toplevel(self.root)
-        guide_win.title("프로그램 사용법")
-        guide_win.geometry("550x450")
-
-        guide_text = """
-[ 단계별 사용 가이드 ]
-
-1. 게시판 추가
-   - 네이버 카페의 '특정 게시판' URL을 복사합니다.
-   - 상단 입력창에 붙여넣고 [입력 버튼]을 누르세요.
-   - 올바른 링크라면 리스트에 '항목'이 추가됩니다.
-
-2. 이름 변경
-   - 리스트에 추가된 '항목 1', '항목 2' 등의 이름을 클릭하세요.
-   - 입력창으로 바뀌면 원하는 이름(예: 팬아트 게시판)을 입력하고 엔터를 누르세요.
-
-3. 세부 설정 (우클릭 메뉴)
-   - 항목 위에서 [마우스 오른쪽 버튼]을 클릭하세요.
-   - 감시 주기: 10초 ~ 600초 사이로 설정 가능 (기본 30초)
-   - 알람 반복: '무한 반복' 또는 '1회 재생' 선택 가능
-   - 항목 삭제: 더 이상 감시하지 않는 항목을 삭제
-
-4. 알람 제어
-   - 새 글이 감지되면 항목이 빨간색으로 변하고 알람이 울립니다.
-   - [알림끄기] 버튼을 누르면 소리가 멈추고 다시 감시 상태로 돌아갑니다.
-   - 각 항목의 볼륨 슬라이더로 소리 크기를 개별 조절할 수 있습니다.
-
-5. 주의 사항
-   - 프로그램 실행 파일과 같은 폴더에 'alarm.mp3' 파일이 있어야 합니다.
-   - 항목을 너무 많이(5개 이상) 추가하면 컴퓨터가 느려질 수 있습니다.
-        """
-
-        lbl_guide = tk.Label(guide_win, text=guide_text, justify="left", font=("맑은 고딕", 10), padx=20, pady=20)
-        lbl_guide.pack(fill="both", expand=True)
-
-        btn_close = tk.Button(guide_win, text="닫기", command=guide_win.destroy, width=10)
-        btn_close.pack(pady=10)
-
-    def add_new_item(self):
-        url = self.entry_url.get().strip()
-        if not url:
-            messagebox.showwarning("입력 오류", "URL을 입력해주세요.")
-            return
+    def _host(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            state = {"bucket": TokenBucket(self.per_host, self.host_burst), "level": 0, "until": 0.0}
+            self._hosts[host] = state
+        return state
 
-        if "cafe.naver.com" not in url or not url.startswith("http"):
-            messagebox.showerror("입력 오류", "유효하지 않은 링크입니다.\n네이버 카페 게시판 주소(cafe.naver.com)를 입력해주세요.")
-            return
+    def _cafe(self, cafe):
+        state = self._cafes.get(cafe)
+        if state is None:
+            state = {"bucket": TokenBucket(self.per_cafe, self.cafe_burst), "breaker": CircuitBreaker(*self.breaker_options)}
+            self._cafes[cafe] = state
+        return state
 
-        new_data = {
-            "id": str(uuid.uuid4()),
-            "name": f"항목 {len(self.items_data) + 1}",
-            "url": url,
-            "interval": 30,
-            "loop": True,
-            "volume": 70,
-            "nickname_filter": ""
+    def acquire(self, host, cafe=None):
+        # 토큰을 예약하고 기다려야 할 시간을 돌려준다. max_wait 을 넘으면 예약하지 않고 RateLimitError.
+        now = time.monotonic()
+        with self._lock:
+            host_state = self._host(host)
+            cafe_state = self._cafe(cafe) if cafe else None
+
+            if cafe_state is not None:
+                resume_in = cafe_state["breaker"].check(now)
+                if resume_in > 0:
+                    self.deferred += 1
+                    raise CircuitOpenError(f"카페 {cafe} 일시 중지: {resume_in:.0f}초 후 재개", resume_in)
+
+            delay = max(0.0, host_state["until"] - now, host_state["bucket"].delay(now))
+            if cafe_state is not None:
+                delay = max(delay, cafe_state["bucket"].delay(now))
+            if delay > self.max_wait:
+                self.deferred += 1
+                raise RateLimitError(f"요청 제한: {delay:.0f}초 후 재시도", delay)
+
+            host_state["bucket"].take()
+            if cafe_state is not None:
+                cafe_state["bucket"].take()
+            self.granted += 1
+            if delay > 0:
+                self.delayed += 1
+                self.wait_total += delay
+        return delay
+
+    def wait(self, host, cafe=None):
+        delay = self.acquire(host, cafe)
+        if delay > 0:
+            with trace_phase("rate_wait"):
+                time.sleep(delay)
+
+    def record(self, host, cafe, outcome, retry_after=None):
+        # outcome: "ok" / "error" / "blocked"
+        now = time.monotonic()
+        with self._lock:
+            host_state = self._host(host)
+            breaker = self._cafe(cafe)["breaker"] if cafe else None
+            if outcome == "ok":
+                host_state["level"] = max(0, host_state["level"] - 1)
+                if breaker:
+                    breaker.success()
+                return
+
+            if outcome == "blocked":
+                self.blocked += 1
+                host_state["level"] += 1
+                backoff = min(self.backoff_max, self.backoff_base * (2 ** (host_state["level"] - 1)))
+                # 모든 감시가 같은 순간에 재시도하지 않도록 절반은 무작위로 흩뜨린다.
+                backoff = backoff / 2 + random.uniform(0, backoff / 2)
+                if retry_after:
+                    backoff = max(backoff, min(self.backoff_max, retry_after))
+                host_state["until"] = max(host_state["until"], now + backoff)
+            else:
+                self.errors += 1
+            if breaker:
+                breaker.failure(now)
+
+    def stats(self):
+        now = time.monotonic()
+        with self._lock:
+            cafes = {cafe: state["breaker"].stats(now) for cafe, state in self._cafes.items()}
+            return {
+                "granted": self.granted,
+                "delayed": self.delayed,
+                "wait_avg": self.wait_total / self.delayed if self.delayed else 0.0,
+                "deferred": self.deferred,
+                "blocked": self.blocked,
+                "errors": self.errors,
+                "hosts": {host: {"backoff_level": state["level"], "backoff_remaining": max(0.0, state["until"] - now)}
+                          for host, state in self._hosts.items()},
+                "cafes": cafes,
+                "paused_cafes": sum(1 for c in cafes.values() if c["state"] != "closed"),
+            }
+
+
+def parse_retry_after(value):
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+# ==========================================
+# [게시판 목록 가져오기 (Fetch 백엔드)]
+# 폴링 한 번에 필요한 것은 게시글 번호/작성자/제목뿐이므로,
+# 가능하면 브라우저 없이 HTTP로 목록을 받아 직접 파싱한다.
+# ==========================================
+# posted_at: 글 작성 시각(epoch 초). 목록에 날짜만 나오는 지난 글 등 알 수 없으면 None.
+PostRow = namedtuple("PostRow", "article_id writer title posted_at", defaults=(None,))
+HttpResponse = namedtuple("HttpResponse", "status headers body")
+
+
+class FetchError(Exception):
+    pass
+
+
+class BlockedError(FetchError):
+    # 429/403 응답이나 접근 제한 페이지
+    pass
+
+
+class RateLimitError(FetchError):
+    # 요청 제한/차단 대기 때문에 이번 폴링을 건너뜀. retry_after 초 뒤에 다시 시도한다.
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(RateLimitError):
+    pass
+
+
+class _StopParsing(Exception):
+    pass
+
+
+# 목록 영역의 글 번호 순서만으로 "변경 없음"을 판단한다. (조회수 등은 무시)
+HTML_ARTICLE_ID_PATTERN = re.compile(r'type_articleNumber[^>]*>\s*(\d+)')
+JSON_ARTICLE_ID_PATTERN = re.compile(r'"articleId"\s*:\s*(\d+)')
+
+
+def extract_list_region(html):
+    start = html.find('class="article-board')
+    if start == -1:
+        return html
+    start = html.rfind("<", 0, start)
+    end = html.find('class="prev-next"', start)
+    if end == -1:
+        return html[start:]
+    return html[start:end]
+
+
+def list_signature(region, pattern):
+    # 글 번호가 하나도 없으면(빈 게시판, 오류 응답) None: 비교하지 않고 매번 파싱해 오류를 드러낸다.
+    ids = ",".join(pattern.findall(region))
+    if not ids:
+        return None
+    return hashlib.sha1(ids.encode("ascii")).hexdigest()
+
+
+def parse_board_url(url):
+    # 카페 게시판 주소에서 clubid/menuid 를 뽑는다. (iframe_url 로 인코딩된 주소 포함)
+    decoded = unquote(unquote(url))
+    m = re.search(r"/cafes/(\d+)/menus/(\d+)", decoded)
+    if m:
+        return {"clubid": m.group(1), "menuid": m.group(2)}
+
+    clubid = re.search(r"search\.clubid=(\d+)", decoded)
+    menuid = re.search(r"search\.menuid=(\d+)", decoded)
+    if clubid and menuid:
+        return {"clubid": clubid.group(1), "menuid": menuid.group(1)}
+    return None
+
+
+def decode_body(resp):
+    content_type = resp.headers.get("content-type", "")
+    m = re.search(r"charset=([\w-]+)", content_type, re.I)
+    encodings = [m.group(1)] if m else []
+    encodings += ["utf-8", "cp949"]
+    for enc in encodings:
+        try:
+            return resp.body.decode(enc)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return resp.body.decode("utf-8", errors="replace")
+
+
+class HttpConnectionPool:
+    # 호스트별 keep-alive 연결을 모든 감시 항목이 함께 사용한다.
+    def __init__(self, max_per_host=4, timeout=10):
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+        # 통계
+        self.requests = 0
+        self.opened = 0
+        self.reused = 0
+
+    def _get(self, key):
+        with self._lock:
+            conns = self._idle.get(key)
+            if conns:
+                self.reused += 1
+                return conns.pop(), True
+            self.opened += 1
+
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout), False
+        return http.client.HTTPConnection(host, port, timeout=self.timeout), False
+
+    def _put(self, key, conn):
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self.max_per_host:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def request(self, method, url, headers=None, body=None):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        req_headers = {
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "gzip",
+            "Connection": "keep-alive",
         }
+        if headers:
+            req_headers.update(headers)
 
-        self.items_data.append(new_data)
-        self.save_data()
-        self.create_item_widget(new_data)
-        self.start_thread(new_data)
-        self.entry_url.delete(0, tk.END)
+        with self._lock:
+            self.requests += 1
 
-    def restore_items(self):
-        for data in self.items_data:
-            self.create_item_widget(data)
-            self.start_thread(data)
+        for attempt in range(2):
+            conn, reused = self._get(key)
+            try:
+                conn.request(method, path, body=body, headers=req_headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionError):
+                # 서버가 먼저 끊은 keep-alive 연결이면 한 번만 새 연결로 재시도
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
 
-    def create_item_widget(self, data):
-        widget = MonitorItemWidget(self.scrollable_frame, data, self)
-        self.widgets[data['id']] = widget
+            if resp.will_close:
+                conn.close()
+            else:
+                self._put(key, conn)
 
-    def remove_item(self, item_id):
-        if item_id in self.threads:
-            self.threads[item_id].stop_and_quit_driver()
-            del self.threads[item_id]
+            resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+            if resp_headers.get("content-encoding") == "gzip":
+                data = gzip.decompress(data)
+            return HttpResponse(resp.status, resp_headers, data)
 
-        if item_id in self.widgets:
-            self.widgets[item_id].destroy()
-            del self.widgets[item_id]
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "opened": self.opened,
+                "reused": self.reused,
+                "idle": sum(len(c) for c in self._idle.values()),
+            }
 
-        self.items_data = [item for item in self.items_data if item['id'] != item_id]
-        self.save_data()
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
 
-        if item_id in self.active_alarms:
-            self.active_alarms.remove(item_id)
 
-    def save_data(self):
-        ConfigManager.save_config(self.items_data)
+def parse_list_date(text, now=None):
+    # 글목록의 작성일 칸. 오늘 글은 "HH:MM", 지난 글은 "YYYY.MM.DD." 로만 나온다.
+    match = re.fullmatch(r"\s*(\d{1,2}):(\d{2})\s*", text or "")
+    if not match:
+        return None
+    now = time.time() if now is None else now
+    local = time.localtime(now)
+    posted = time.mktime((local.tm_year, local.tm_mon, local.tm_mday, int(match.group(1)), int(match.group(2)), 0, 0, 0, -1))
+    if posted > now + 60:
+        # 자정 직후에 받은 어제 글
+        posted -= 86400
+    return posted
 
-    def start_thread(self, data):
-        t = MonitorThread(
-            data['id'],
-            data['url'],
-            data['interval'],
-            data.get('nickname_filter', ""),
-            self.on_thread_init,
-            self.on_post_found,
-            self.on_thread_error
-        )
-        self.threads[data['id']] = t
-        t.start()
-
-    def restart_thread(self, item_id):
-        if item_id in self.threads:
-            self.threads[item_id].stop_and_quit_driver()
-
-        for data in self.items_data:
-            if data['id'] == item_id:
-                self.start_thread(data)
-                if item_id in self.widgets:
-                    self.widgets[item_id].set_status("재시작 중...")
+
+class BoardListParser(HTMLParser):
+    # Selenium 경로의 "div.article-board table tbody tr" 선택자와 같은 행을 뽑는다.
+    VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+    def __init__(self, stop_at_id=None):
+        super().__init__(convert_charrefs=True)
+        self.stop_at_id = stop_at_id
+        self.rows = []
+        self._stack = []
+        self._board_depth = None
+        self._row_depth = None
+        self._row = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_TAGS:
+            return
+        classes = set((dict(attrs).get("class") or "").split())
+        self._stack.append((tag, classes))
+        depth = len(self._stack)
+
+        if self._board_depth is None:
+            if tag == "div" and "article-board" in classes:
+                self._board_depth = depth
+        elif self._row_depth is None and tag == "tr":
+            self._row_depth = depth
+            self._row = {"number": [], "name": [], "title": [], "date": []}
+
+    def handle_startendtag(self, tag, attrs):
+        pass
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID_TAGS:
+            return
+        # 닫히지 않은 태그가 있어도 짝이 맞는 위치까지 되감는다.
+        for i in range(len(self._stack) - 1, -1, -1):
+            if self._stack[i][0] == tag:
                 break
+        else:
+            return
+
+        depth = i + 1
+        del self._stack[i:]
+        if self._row_depth is not None and depth <= self._row_depth:
+            self._finish_row()
+        if self._board_depth is not None and depth <= self._board_depth:
+            self._board_depth = None
+
+    def handle_data(self, data):
+        if self._row is None:
+            return
+        for tag, classes in reversed(self._stack[self._row_depth:]):
+            if tag == "td" and "type_articleNumber" in classes:
+                self._row["number"].append(data)
+                return
+            if tag == "td" and "td_name" in classes:
+                self._row["name"].append(data)
+                return
+            if tag == "td" and "td_date" in classes:
+                self._row["date"].append(data)
+                return
+            if tag == "a" and "article" in classes:
+                self._row["title"].append(data)
+                return
+
+    def _finish_row(self):
+        row, self._row, self._row_depth = self._row, None, None
+        num_txt = "".join(row["number"]).strip()
+        if not num_txt.isdigit():
+            return
+        article_id = int(num_txt)
+        if self.stop_at_id is not None and article_id <= self.stop_at_id:
+            # 이미 본 글부터는 읽을 필요가 없다.
+            raise _StopParsing()
+        self.rows.append(PostRow(
+            article_id,
+            " ".join("".join(row["name"]).split()),
+            " ".join("".join(row["title"]).split()),
+            parse_list_date("".join(row["date"])),
+        ))
+
+
+def parse_board_html(html, stop_at_id=None):
+    parser = BoardListParser(stop_at_id)
+    try:
+        parser.feed(html)
+        parser.close()
+    except _StopParsing:
+        pass
+    return parser.rows
+
+
+def article_timestamp(article):
+    # writeDateTimestamp 는 밀리초 단위
+    try:
+        return int(article["writeDateTimestamp"]) / 1000.0
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def parse_article_list_json(text, stop_at_id=None):
+    data = json.loads(text)
+    message = data.get("message", {})
+    if str(message.get("status", "200")) != "200":
+        raise FetchError(f"API 오류: {message.get('error', message.get('status'))}")
+
+    rows = []
+    for article in message.get("result", {}).get("articleList", []):
+        article_id = int(article["articleId"])
+        if stop_at_id is not None and article_id <= stop_at_id:
+            continue
+        rows.append(PostRow(
+            article_id,
+            article.get("writerNickname", ""),
+            article.get("subject", ""),
+            article_timestamp(article),
+        ))
+    rows.sort(key=lambda r: r.article_id, reverse=True)
+    return rows
+
+
+def parse_cafe_article_list_json(text):
+    # 카페 전체 글목록(menuid=0). 게시판별로 나눌 수 있도록 (menuid, PostRow) 를 돌려준다.
+    data = json.loads(text)
+    message = data.get("message", {})
+    if str(message.get("status", "200")) != "200":
+        raise FetchError(f"API 오류: {message.get('error', message.get('status'))}")
+
+    entries = []
+    for article in message.get("result", {}).get("articleList", []):
+        if "menuId" not in article:
+            raise FetchError("카페 전체 글목록에 게시판 번호(menuId)가 없습니다")
+        entries.append((str(article["menuId"]), PostRow(
+            int(article["articleId"]),
+            article.get("writerNickname", ""),
+            article.get("subject", ""),
+            article_timestamp(article),
+        )))
+    entries.sort(key=lambda e: e[1].article_id, reverse=True)
+    return entries
+
+
+class SeleniumFetchBackend:
+    name = "selenium"
+
+    def __init__(self, driver_pool, ready_timeout=10, limiter=None, resource_metrics=True):
+        self.driver_pool = driver_pool
+        self.ready_timeout = ready_timeout
+        self.limiter = limiter
+        self.resource_metrics = resource_metrics
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        board = parse_board_url(url)
+        if page > 1:
+            # 2페이지 이후는 iframe 문서 주소로 직접 연다.
+            if board is None:
+                return []
+            url = (f"https://cafe.naver.com/ArticleList.nhn?search.clubid={board['clubid']}"
+                   f"&search.menuid={board['menuid']}&search.boardtype=L&search.page={page}")
 
-    def on_thread_init(self, item_id, last_id):
-        self.root.after(0, lambda: self._handle_init(item_id, last_id))
+        host, cafe = urlsplit(url).hostname, board['clubid'] if board else None
+        if self.limiter:
+            # 드라이버를 빌리기 전에 기다린다. (대기 중에 드라이버를 붙잡고 있지 않도록)
+            self.limiter.wait(host, cafe)
+        leased = False
+        try:
+            lease_started = time.monotonic()
+            with self.driver_pool.lease() as driver:
+                leased = True
+                trace = current_trace()
+                if trace is not None:
+                    trace.add("driver_lease", time.monotonic() - lease_started)
+                usage = self.driver_pool.driver_usage(driver) if trace is not None and self.resource_metrics else None
+                with trace_phase("network"):
+                    driver.get(url)
+                with trace_phase("frame_switch"):
+                    self.wait_until_ready(driver, switch_frame=page == 1)
+                with trace_phase("parse"):
+                    rows = self.extract_rows(driver, min_id)
+                if not rows and self.is_blocked(driver):
+                    raise BlockedError("접근 제한 페이지")
+                if usage is not None:
+                    # 드라이버는 여러 게시판이 돌려 쓰므로, CPU 는 이 폴링 동안 늘어난 만큼만 게시판에 붙인다.
+                    after = self.driver_pool.driver_usage(driver)
+                    if after is not None:
+                        trace_value("driver_rss", after[0])
+                        trace_value("driver_cpu", max(0.0, after[1] - usage[1]))
+        except BlockedError:
+            if self.limiter:
+                self.limiter.record(host, cafe, "blocked")
+            raise
+        except Exception:
+            # 드라이버를 빌리지 못한 경우(대기 시간 초과, 풀 종료)는 이 쪽 자원 문제이므로
+            # 카페 실패로 세지 않는다. (서킷 브레이커가 멀쩡한 카페를 멈추지 않도록)
+            if self.limiter and leased:
+                self.limiter.record(host, cafe, "error")
+            raise
+        if self.limiter:
+            self.limiter.record(host, cafe, "ok")
+        return rows
 
-    def on_post_found(self, item_id, post_id, writer):
-        self.root.after(0, lambda: self._handle_alarm(item_id, post_id))
+    BLOCK_CHECK_SCRIPT = """
+        return document.title + "\\n" + (document.body ? document.body.innerText.slice(0, 5000) : "");
+    """
 
-    def on_thread_error(self, item_id, error_msg):
-        self.root.after(0, lambda: self._handle_error(item_id, error_msg))
+    def is_blocked(self, driver):
+        # 글이 하나도 없을 때만 확인한다. (왕복 1회 추가)
+        return looks_blocked(driver.execute_script(self.BLOCK_CHECK_SCRIPT) or "", "article-board")
 
-    def _handle_init(self, item_id, last_id):
-        if item_id in self.widgets:
-            self.widgets[item_id].set_status(f"감시중... (최신글: {last_id})", is_alarm=False)
+    def wait_until_ready(self, driver, switch_frame=True):
+        # 고정 대기 대신, cafe_main 프레임과 글 목록이 나타나는 즉시 진행한다.
+        wait = WebDriverWait(driver, self.ready_timeout, poll_frequency=0.1)
+        if switch_frame:
+            try:
+                wait.until(EC.frame_to_be_available_and_switch_to_it("cafe_main"))
+            except Exception:
+                # 프레임이 없는 문서(iframe 주소를 직접 연 경우 등)는 그대로 읽는다.
+                pass
+        try:
+            # 글이 하나도 없는 게시판은 글 목록이 끝내 나타나지 않으므로, 문서 로드가 끝나면 준비된 것으로 본다.
+            wait.until(lambda d: d.execute_script(self.READY_SCRIPT))
+        except Exception:
+            pass
 
-    def _handle_alarm(self, item_id, post_id):
-        if item_id in self.widgets:
-            msg = f"새 글 감지됨! (ID: {post_id})"
-            self.widgets[item_id].set_status(msg, is_alarm=True)
-            self.active_alarms.add(item_id)
-            self.play_alarm(item_id)
+    READY_SCRIPT = """
+        return !!document.querySelector("div.article-board") || document.readyState === "complete";
+    """
 
-    def _handle_error(self, item_id, msg):
-        if item_id in self.widgets:
-            short_msg = (msg[:30] + '..') if len(msg) > 30 else msg
-            self.widgets[item_id].set_status(f"오류: {short_msg}", is_alarm=False)
+    # 행마다 find_element 를 부르면 WebDriver 왕복이 행당 2~3번 생기므로,
+    # 모든 행의 번호/작성자/제목을 스크립트 한 번으로 배열로 받아 온다.
+    EXTRACT_ROWS_SCRIPT = """
+        var rows = document.querySelectorAll("div.article-board table tbody tr");
+        var out = [];
+        for (var i = 0; i < rows.length; i++) {
+            var num = rows[i].querySelector("td.type_articleNumber");
+            if (!num) continue;
+            var name = rows[i].querySelector("td.td_name");
+            var title = rows[i].querySelector("a.article");
+            var date = rows[i].querySelector("td.td_date");
+            out.push([
+                num.innerText.trim(),
+                name ? name.innerText.trim() : "",
+                title ? title.innerText.trim() : "",
+                date ? date.innerText.trim() : ""
+            ]);
+        }
+        return out;
+    """
 
-    def play_alarm(self, trigger_item_id):
-        for data in self.items_data:
-            if data['id'] == trigger_item_id:
-                vol = data['volume'] / 100.0
-                pygame.mixer.music.set_volume(vol)
+    def extract_rows(self, driver, min_id=None):
+        result = []
+        for num_txt, writer_text, title_text, date_text in driver.execute_script(self.EXTRACT_ROWS_SCRIPT) or []:
+            if not num_txt.isdigit():
+                continue
+            if min_id is not None and int(num_txt) <= min_id:
                 break
+            result.append(PostRow(int(num_txt), writer_text, title_text, parse_list_date(date_text)))
+        return result
+
+
+class HttpFetchBackend:
+    # mode="json" : 카페 글목록 JSON API, mode="html" : cafe_main iframe 문서
+    name = "http"
 
-        if not pygame.mixer.music.get_busy():
-            pygame.mixer.music.play()
+    def __init__(self, conn_pool, mode="json", api_base="https://apis.naver.com", web_base="https://cafe.naver.com", per_page=50,
+                 limiter=None):
+        self.conn_pool = conn_pool
+        self.mode = mode
+        self.api_base = api_base.rstrip("/")
+        self.web_base = web_base.rstrip("/")
+        self.per_page = per_page
+        self.limiter = limiter
 
-    def stop_alarm(self, item_id):
-        if item_id in self.active_alarms:
-            self.active_alarms.remove(item_id)
+    def build_request_url(self, board, page=1):
+        if self.mode == "json":
+            return (f"{self.api_base}/cafe-web/cafe2/ArticleListV2dot1.json"
+                    f"?search.clubid={board['clubid']}&search.menuid={board['menuid']}"
+                    f"&search.queryType=lastArticle&search.page={page}&search.perPage={self.per_page}")
+        return (f"{self.web_base}/ArticleList.nhn"
+                f"?search.clubid={board['clubid']}&search.menuid={board['menuid']}"
+                f"&search.boardtype=L&userDisplay={self.per_page}&search.page={page}")
 
-        if item_id in self.widgets:
-            current_last_id = 0
-            if item_id in self.threads:
-                current_last_id = self.threads[item_id].last_article_id
+    def fetch_cafe_entries(self, clubid, state=None):
+        # 카페 전체 글목록을 한 번 받아 온다. 변경이 없으면(304) None.
+        headers = {"Referer": f"{self.web_base}/"}
+        if state is not None and state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        url = self.build_request_url({"clubid": clubid, "menuid": "0"})
+        resp, text = self._get(url, headers, clubid)
+        if resp.status == 304:
+            return None
+        with trace_phase("parse"):
+            entries = parse_cafe_article_list_json(text)
+        # 파싱에 성공한 응답의 ETag 만 기억한다. (오류 응답을 기억하면 이후 요청이 304 로 가려진다)
+        if state is not None:
+            state["etag"] = resp.headers.get("etag")
+        return entries
 
-            self.widgets[item_id].set_status(f"감시중... (최신글: {current_last_id})", is_alarm=False)
+    def _get(self, url, headers, clubid):
+        # 요청 제한기를 거쳐 GET 하고, 결과(성공/오류/차단)를 제한기에 알린다. 304 면 text 는 None.
+        host = urlsplit(url).hostname
+        if self.limiter:
+            self.limiter.wait(host, clubid)
 
-        if not self.active_alarms:
-            pygame.mixer.music.stop()
+        outcome, retry_after = "error", None
+        try:
+            with trace_phase("network"):
+                resp = self.conn_pool.request("GET", url, headers=headers)
+            if resp.status == 304:
+                outcome = "ok"
+                return resp, None
+            if resp.status in (403, 429):
+                outcome, retry_after = "blocked", parse_retry_after(resp.headers.get("retry-after"))
+                raise BlockedError(f"HTTP {resp.status} (요청 차단)")
+            if resp.status != 200:
+                raise FetchError(f"HTTP {resp.status}")
+
+            text = decode_body(resp)
+            if looks_blocked(text, '"articleList"' if self.mode == "json" else 'class="article-board'):
+                outcome = "blocked"
+                raise BlockedError("접근 제한 페이지")
+            outcome = "ok"
+            return resp, text
+        finally:
+            if self.limiter:
+                self.limiter.record(host, clubid, outcome, retry_after)
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        # state: 게시판별 조건부 요청 정보(ETag 등). 변경이 없으면 None 을 돌려준다.
+        board = parse_board_url(url)
+        if board is None:
+            raise FetchError("게시판 주소에서 clubid/menuid 를 찾을 수 없습니다")
 
-    def check_alarm_status(self):
-        if not pygame.mixer.music.get_busy() and self.active_alarms:
-            should_loop = False
-            target_vol = 0.5
+        headers = {"Referer": f"{self.web_base}/"}
+        if state is not None:
+            if state.get("etag"):
+                headers["If-None-Match"] = state["etag"]
+            if state.get("last_modified"):
+                headers["If-Modified-Since"] = state["last_modified"]
 
-            for item_id in self.active_alarms:
-                item_data = next((item for item in self.items_data if item['id'] == item_id), None)
-                if item_data:
-                    if item_data['loop']:
-                        should_loop = True
-                        target_vol = item_data['volume'] / 100.0
+        resp, text = self._get(self.build_request_url(board, page), headers, board['clubid'])
+        if resp.status == 304:
+            return None
 
-            if should_loop:
-                pygame.mixer.music.set_volume(target_vol)
-                pygame.mixer.music.play()
+        with trace_phase("parse"):
+            if self.mode == "json":
+                region, pattern = text, JSON_ARTICLE_ID_PATTERN
             else:
-                self.active_alarms.clear()
+                region, pattern = extract_list_region(text), HTML_ARTICLE_ID_PATTERN
 
-        self.root.after(500, self.check_alarm_status)
+            signature = None
+            if state is not None:
+                signature = list_signature(region, pattern)
+                if signature is not None and signature == state.get("signature"):
+                    return None
 
-    def on_close(self):
-        active_threads = list(self.threads.values())
-        for t in active_threads:
-            t.stop_and_quit_driver()
-        self.root.destroy()
+            if self.mode == "json":
+                rows = parse_article_list_json(region, min_id)
+            else:
+                rows = parse_board_html(region, min_id)
 
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = AppLogic(root)
-    root.protocol("WM_DELETE_WINDOW", app.on_close)
-    root.mainloop()
\ No newline at end of file
+        # 검증값(ETag 등)과 서명은 파싱에 성공한 뒤에만 기억한다.
+        # 오류 응답을 기억하면 다음 폴링부터 304/변경 없음으로 가려져 오류도, Selenium 대체도 일어나지 않는다.
+        if state is not None:
+            state["etag"] = resp.headers.get("etag")
+            state["last_modified"] = resp.headers.get("last-modified")
+            state["signature"] = signature
+        return rows
+
+
+class FallbackFetchBackend:
+    # 기본 백엔드가 실패하면 대체 백엔드(Selenium)로 한 번 더 시도한다.
+    def __init__(self, primary, fallback):
+        self.primary = primary
+        self.fallback = fallback
+        self.name = f"{primary.name}+{fallback.name}"
+        self._lock = threading.Lock()
+        self.primary_ok = 0
+        self.fallback_used = 0
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        try:
+            rows = self.primary.fetch_rows(url, state, min_id, page)
+        except (RateLimitError, BlockedError):
+            # 차단/대기 중에는 브라우저로 같은 사이트를 다시 두드리지 않는다.
+            raise
+        except Exception as e:
+            print(f"Fetch Fallback ({self.primary.name} -> {self.fallback.name}): {e}")
+            with self._lock:
+                self.fallback_used += 1
+            return self.fallback.fetch_rows(url, state, min_id, page)
+        with self._lock:
+            self.primary_ok += 1
+        return rows
+
+    def stats(self):
+        with self._lock:
+            return {"primary_ok": self.primary_ok, "fallback_used": self.fallback_used}
+
+
+class CafeAggregateFetchBackend:
+    # 같은 카페(clubid)의 게시판 여러 개를 감시할 때, 게시판마다 요청하지 않고
+    # 카페 전체 글목록을 한 번 받아 menuid 별로 나눠 준다.
+    # 연달아 받은 전체 목록이 서로 겹치면(사이에 빠진 글이 없으면) 그동안 본 글을 창(window)에 모아 두고,
+    # 카페 전체 최신 번호(high_water)도 기억한다. 게시판별 state 에는 그 게시판이 어느 번호까지
+    # 확인되었는지(cafe_known_to)를 남겨, 창이 그 번호부터 끊김 없이 이어져 있으면 조용한 게시판도
+    # 따로 요청하지 않고 창에서 새 글을 찾는다. (없으면 변경 없음)
+    # 창이 끊기거나(주기 사이에 글이 너무 많이 올라온 경우) 확인 기록이 없으면 해당 게시판만 기존 방식으로
+    # 따로 요청한다. 첫 조회와 이전 페이지 조회도 기존 방식을 쓴다.
+    # 전체 목록에 빠지는 게시판이 있을 수 있으므로 verify_every 번에 한 번은 게시판별로 직접 확인한다.
+    def __init__(self, http_backend, per_board, ttl=5, min_boards=2, verify_every=20, window_size=2000):
+        self.http_backend = http_backend
+        self.per_board = per_board
+        self.ttl = ttl
+        self.min_boards = min_boards
+        self.verify_every = verify_every
+        self.window_size = window_size
+        self.name = f"cafe+{per_board.name}"
+        self._lock = threading.Lock()
+        self._cafes = {}
+
+        # 통계
+        self.combined_fetches = 0
+        self.served_combined = 0
+        self.per_board_fetches = 0
+        self.coverage_misses = 0
+        self.window_resets = 0
+
+    def _cafe(self, clubid):
+        with self._lock:
+            cafe = self._cafes.get(clubid)
+            if cafe is None:
+                # window: menuid -> {article_id: PostRow}. covered_from 이상 번호의 글은 빠짐없이 들어 있다.
+                cafe = {"lock": threading.Lock(), "menus": {}, "entries": None,
+                        "fetched_at": 0.0, "state": {}, "failed": False,
+                        "window": {}, "window_count": 0, "covered_from": None, "high_water": None}
+                self._cafes[clubid] = cafe
+            return cafe
+
+    def _per_board(self, url, state, min_id, page, cafe=None):
+        with self._lock:
+            self.per_board_fetches += 1
+            # 요청 전의 카페 최신 번호: 이 요청 뒤에 올라오는 글은 모두 이 번호보다 크다.
+            high_water = cafe["high_water"] if cafe is not None else None
+        rows = self.per_board.fetch_rows(url, state, min_id, page)
+        if cafe is not None and state is not None:
+            state["cafe_known_to"] = high_water
+        return rows
+
+    def _combined_entries(self, clubid, cafe):
+        # TTL 안에 다른 게시판이 받아 둔 목록이 있으면 그대로 쓴다. 동시에 요청하면 한 번만 받는다.
+        with cafe["lock"]:
+            if cafe["entries"] is not None and time.monotonic() - cafe["fetched_at"] < self.ttl:
+                return cafe["entries"]
+            entries = self.http_backend.fetch_cafe_entries(clubid, cafe["state"])
+            with self._lock:
+                self.combined_fetches += 1
+                if entries:
+                    self._merge_window(cafe, entries)
+            if entries is not None:
+                cafe["entries"] = entries
+            cafe["fetched_at"] = time.monotonic()
+            return cafe["entries"]
+
+    def _merge_window(self, cafe, entries):
+        # 새 목록의 가장 오래된 글이 지금까지의 최신 번호 이하면 사이에 빠진 글이 없으므로 창을 이어 붙이고,
+        # 아니면(주기 사이에 한 페이지보다 많이 올라옴) 새 목록부터 창을 다시 시작한다.
+        oldest, newest = entries[-1][1].article_id, entries[0][1].article_id
+        if cafe["high_water"] is None or oldest > cafe["high_water"]:
+            if cafe["high_water"] is not None:
+                self.window_resets += 1
+            cafe["window"], cafe["window_count"], cafe["covered_from"] = {}, 0, oldest
+        window = cafe["window"]
+        for menu_id, row in entries:
+            posts = window.setdefault(menu_id, {})
+            if row.article_id not in posts:
+                posts[row.article_id] = row
+                cafe["window_count"] += 1
+        cafe["high_water"] = max(cafe["high_water"] or 0, newest)
+
+        if cafe["window_count"] > self.window_size:
+            # 오래된 글부터 덜어 내고, 끊김 없이 덮는 범위의 시작도 그만큼 올린다.
+            ids = sorted(article_id for posts in window.values() for article_id in posts)
+            cutoff = ids[len(ids) - self.window_size * 3 // 4]
+            for menu_id in list(window):
+                posts = {article_id: row for article_id, row in window[menu_id].items() if article_id >= cutoff}
+                if posts:
+                    window[menu_id] = posts
+                else:
+                    del window[menu_id]
+            cafe["window_count"] = sum(len(posts) for posts in window.values())
+            cafe["covered_from"] = cutoff
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        board = parse_board_url(url)
+        if board is None or page != 1:
+            return self._per_board(url, state, min_id, page)
+
+        cafe = self._cafe(board["clubid"])
+        if min_id is None:
+            return self._per_board(url, state, min_id, page, cafe)
+        with self._lock:
+            polls = cafe["menus"].get(board["menuid"], 0)
+            cafe["menus"][board["menuid"]] = polls + 1
+            shared = len(cafe["menus"]) >= self.min_boards and not cafe["failed"]
+        if not shared or (polls + 1) % self.verify_every == 0:
+            return self._per_board(url, state, min_id, page, cafe)
+
+        try:
+            entries = self._combined_entries(board["clubid"], cafe)
+        except (RateLimitError, BlockedError):
+            raise
+        except FetchError as e:
+            # 전체 목록을 지원하지 않는 카페는 이후 게시판별 요청만 쓴다.
+            print(f"Cafe Aggregation Error ({board['clubid']}): {e}")
+            with self._lock:
+                cafe["failed"] = True
+            return self._per_board(url, state, min_id, page, cafe)
+
+        with self._lock:
+            # 창이 (게시판이 마지막으로 확인된 시점의 카페 최신 번호) 또는 (게시판의 마지막 글 번호)부터
+            # 끊김 없이 이어져 있으면, 이 게시판의 새 글은 모두 창 안에 있다.
+            covered_from = cafe["covered_from"]
+            known_to = state.get("cafe_known_to") if state is not None else None
+            covered = entries and covered_from is not None and (
+                min_id >= covered_from or (known_to is not None and known_to >= covered_from))
+            if covered:
+                self.served_combined += 1
+                high_water = cafe["high_water"]
+                posts = cafe["window"].get(board["menuid"], {})
+                rows = sorted((row for article_id, row in posts.items() if article_id > min_id),
+                              key=lambda r: r.article_id, reverse=True)
+            else:
+                self.coverage_misses += 1
+        if not covered:
+            return self._per_board(url, state, min_id, page, cafe)
+        if state is not None:
+            state["cafe_known_to"] = high_water
+        return rows or None
+
+    def stats(self):
+        with self._lock:
+            stats = {
+                "cafes": sum(1 for c in self._cafes.values() if len(c["menus"]) >= self.min_boards),
+                "combined_fetches": self.combined_fetches,
+                "served_combined": self.served_combined,
+                "per_board_fetches": self.per_board_fetches,
+                "coverage_misses": self.coverage_misses,
+                "window_resets": self.window_resets,
+            }
+        if hasattr(self.per_board, "stats"):
+            stats.update(self.per_board.stats())
+        return stats
+
+
+def create_fetch_backend(settings, driver_pool, conn_pool, limiter=None):
+    selenium_backend = SeleniumFetchBackend(driver_pool, settings["selenium_ready_timeout"], limiter, settings["resource_metrics"])
+    if settings["fetch_backend"] == "selenium":
+        return selenium_backend
+
+    http_backend = HttpFetchBackend(
+        conn_pool,
+        mode=settings["http_mode"],
+        api_base=settings["naver_api_base"],
+        web_base=settings["naver_web_base"],
+        limiter=limiter,
+    )
+    per_board = http_backend
+    if settings["selenium_fallback"] and webdriver is not None:
+        per_board = FallbackFetchBackend(http_backend, selenium_backend)
+    if settings["cafe_aggregation"] and settings["http_mode"] == "json":
+        return CafeAggregateFetchBackend(http_backend, per_board, settings["cafe_aggregation_ttl"])
+    return per_board
+
+
+def create_fetch_stack(settings):
+    # 드라이버 풀/연결 풀/요청 제한기/백엔드를 설정대로 만든다. (엔진과 분할 감시 작업 프로세스가 같이 쓴다)
+    driver_pool = DriverPool(
+        settings["driver_pool_size"],
+        lease_timeout=settings["driver_lease_timeout"],
+        health_check_idle=settings["driver_health_check_idle"],
+        driver_cache_days=settings["driver_cache_days"],
+        max_rss_mb=settings["driver_max_rss_mb"],
+        max_age_min=settings["driver_max_age_min"],
+        lean=settings["driver_lean"],
+        blocked_urls=settings["driver_blocked_urls"],
+    )
+    http_pool = HttpConnectionPool(settings["http_pool_per_host"], settings["http_timeout"])
+    limiter = RequestLimiter.from_settings(settings) if settings["rate_limit"] else None
+    return driver_pool, http_pool, limiter, create_fetch_backend(settings, driver_pool, http_pool, limiter)
+
+# ==========================================
+# [적응형 감시 주기]
+# 새 글이 많은 게시판은 주기를 좁히고, 조용한 게시판은 지수적으로 늘린다.
+# ==========================================
+class AdaptiveInterval:
+    def __init__(self, min_interval, max_interval, initial=None, target_posts=1.0, backoff=1.5, smoothing=0.3):
+        self.min_interval = max(1, min_interval)
+        self.max_interval = max(self.min_interval, max_interval)
+        self.target_posts = target_posts    # 한 번 폴링할 때 기대하는 새 글 수
+        self.backoff = backoff
+        self.smoothing = smoothing
+
+        self.rate = None                    # 초당 새 글 수 (지수 이동 평균)
+        self.interval = self._clamp(initial if initial else self.min_interval)
+
+    def _clamp(self, value):
+        return min(self.max_interval, max(self.min_interval, value))
+
+    def observe(self, new_posts, elapsed):
+        sample = new_posts / elapsed if elapsed > 0 else 0.0
+        if self.rate is None:
+            self.rate = sample
+        else:
+            self.rate = self.smoothing * sample + (1 - self.smoothing) * self.rate
+
+        if new_posts > 0:
+            # 급증은 평균이 따라오기 전에 바로 반영한다.
+            rate = max(self.rate, sample)
+            wanted = self.target_posts / rate if rate else self.min_interval
+            self.interval = self._clamp(min(wanted, self.interval))
+        else:
+            self.interval = self._clamp(self.interval * self.backoff)
+        return self.interval
+
+# ==========================================
+# [글 필터]
+# 게시판별 포함/제외 규칙(작성자, 제목 키워드, 제목 정규식).
+# 규칙은 바뀔 때 한 번만 컴파일한다. 문자열 목록은 Aho-Corasick 오토마톤 하나로,
+# 정규식 목록은 하나로 합친 정규식으로 만들어 규칙 수가 늘어도 글 하나를 검사하는 비용은 거의 같다.
+# ==========================================
+FILTER_KEYS = ("include_writers", "exclude_writers", "include_keywords", "exclude_keywords",
+               "include_regex", "exclude_regex")
+
+
+class AhoCorasick:
+    # 여러 문자열 중 하나라도 text 안에 들어 있는지 한 번 훑어서 확인한다. (대소문자 무시)
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [False]
+        for pattern in patterns:
+            self._add(pattern.casefold())
+        self._build()
+
+    def _add(self, pattern):
+        state = 0
+        for ch in pattern:
+            nxt = self.goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append(False)
+            state = nxt
+        self.out[state] = True
+
+    def _build(self):
+        queue_ = list(self.goto[0].values())
+        head = 0
+        while head < len(queue_):
+            state = queue_[head]
+            head += 1
+            for ch, nxt in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[nxt] = self.goto[fallback].get(ch, 0)
+                self.out[nxt] = self.out[nxt] or self.out[self.fail[nxt]]
+                queue_.append(nxt)
+
+    def search(self, text):
+        goto, fail, out = self.goto, self.fail, self.out
+        state = 0
+        for ch in text.casefold():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                return True
+        return False
+
+
+def compile_regex_list(patterns):
+    # 정규식 여러 개를 (?:a)|(?:b) 하나로 합친다. 합칠 수 없는 조합이면 각각 검사한다.
+    # 그룹이 있는 정규식은 합치면 그룹 번호가 바뀌어 \1 같은 역참조가 다른 그룹을 가리키므로 따로 둔다.
+    if not patterns:
+        return None
+    compiled = [re.compile(p, re.IGNORECASE) for p in patterns]
+    plain = [p for p, r in zip(patterns, compiled) if not r.groups]
+    grouped = [r for r in compiled if r.groups]
+    if len(plain) < 2:
+        return compiled
+    try:
+        return [re.compile("|".join(f"(?:{p})" for p in plain), re.IGNORECASE)] + grouped
+    except re.error:
+        return compiled
+
+
+def normalize_filters(filters, nickname_filter=""):
+    # config.json 의 filters 값을 정리한다. 예전 nickname_filter 는 include_writers 로 옮긴다.
+    # (예전 작성자 필터는 대소문자를 구분했지만, 옮긴 뒤에는 다른 작성자 규칙처럼 대소문자를 무시한다)
+    if filters is not None and not isinstance(filters, dict):
+        raise ValueError("filters 는 객체여야 합니다")
+    filters = filters or {}
+    unknown = set(filters) - set(FILTER_KEYS)
+    if unknown:
+        raise ValueError(f"알 수 없는 필터: {', '.join(sorted(unknown))}")
+
+    result = {}
+    for key in FILTER_KEYS:
+        values = filters.get(key, [])
+        if isinstance(values, str):
+            values = [values]
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            raise ValueError(f"{key} 는 문자열 목록이어야 합니다")
+        values = [v.strip() for v in values if v.strip()]
+        if values:
+            result[key] = values
+    if nickname_filter and nickname_filter not in result.get("include_writers", []):
+        result.setdefault("include_writers", []).append(nickname_filter)
+
+    for key in ("include_regex", "exclude_regex"):
+        for pattern in result.get(key, []):
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"정규식 오류 ({pattern}): {e}")
+    return result
+
+
+class PostFilter:
+    # 제외 규칙에 하나라도 걸리면 버리고, 포함 규칙이 있는 항목(작성자/키워드/정규식)은 각각 하나 이상 맞아야 통과한다.
+    def __init__(self, filters=None):
+        self.filters = filters or {}
+        self.rule_count = sum(len(v) for v in self.filters.values())
+        self.include_writers = self._automaton("include_writers")
+        self.exclude_writers = self._automaton("exclude_writers")
+        self.include_keywords = self._automaton("include_keywords")
+        self.exclude_keywords = self._automaton("exclude_keywords")
+        self.include_regex = compile_regex_list(self.filters.get("include_regex"))
+        self.exclude_regex = compile_regex_list(self.filters.get("exclude_regex"))
+
+    def _automaton(self, key):
+        patterns = self.filters.get(key)
+        return AhoCorasick(patterns) if patterns else None
+
+    @staticmethod
+    def _regex_match(compiled, text):
+        return any(r.search(text) for r in compiled)
+
+    def matches(self, row):
+        if self.exclude_writers and self.exclude_writers.search(row.writer):
+            return False
+        if self.exclude_keywords and self.exclude_keywords.search(row.title):
+            return False
+        if self.exclude_regex and self._regex_match(self.exclude_regex, row.title):
+            return False
+
+        if self.include_writers and not self.include_writers.search(row.writer):
+            return False
+        if self.include_keywords and not self.include_keywords.search(row.title):
+            return False
+        if self.include_regex and not self._regex_match(self.include_regex, row.title):
+            return False
+        return True
+
+# ==========================================
+# [게시판 감시 상태]
+# ==========================================
+class BoardMonitor:
+    def __init__(self, item_id, url, interval, nickname_filter, interval_mode="fixed", min_interval=10, max_interval=600, resume_from=None,
+                 filters=None):
+        self.item_id = item_id
+        self.url = url
+        self.interval = interval
+        self.nickname_filter = nickname_filter
+        self.filters = filters
+        self.post_filter = None
+        self.configure_filter()
+        self.interval_mode = interval_mode
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        self.last_article_id = 0
+        self.last_new_count = 0
+        self.last_new_rows = []
+        self.resume_from = resume_from      # 저장소에 남아 있던 마지막 글 번호
+        self.baselined = False
+        self.in_flight = False
+        self.generation = 0
+        self.last_poll_at = None
+        self.demand = 0.0
+        self.adaptive = None
+        self.configure_interval()
+
+        # 등록 시각과 첫 기준 글을 확인한 시각 (시작 소요 시간 측정용)
+        self.added_at = time.monotonic()
+        self.baseline_at = None
+
+        # 다음 폴링 한 번을 cProfile 로 기록할 때의 프로파일러와 저장 경로
+        self.profile_request = None
+        self.profile_path = None
+        self.last_profile = None
+
+        # 조건부 요청 상태와 "변경 없음"/"파싱" 횟수
+        self.fetch_state = {}
+        self.unchanged_polls = 0
+        self.parsed_polls = 0
+
+    def configure_filter(self):
+        try:
+            rules = normalize_filters(self.filters, self.nickname_filter)
+        except ValueError as e:
+            # config.json 을 직접 고치다 잘못된 규칙이 들어간 경우. 예전 작성자 필터만 적용한다.
+            print(f"Filter Error ({self.item_id}): {e}")
+            rules = normalize_filters(None, self.nickname_filter)
+        self.post_filter = PostFilter(rules)
+
+    def configure_interval(self):
+        if self.interval_mode == "adaptive":
+            self.adaptive = AdaptiveInterval(self.min_interval, self.max_interval, initial=self.interval)
+        else:
+            self.adaptive = None
+
+    def current_interval(self):
+        if self.adaptive:
+            return self.adaptive.interval
+        return self.interval
+
+    def observe_poll(self, elapsed):
+        if self.adaptive:
+            self.adaptive.observe(self.last_new_count, elapsed)
+
+    def get_latest_post_id(self, rows):
+        if rows:
+            return rows[0].article_id
+        return 0
+
+    def check_new_posts(self, rows):
+        found = []
+        max_id_in_page = self.last_article_id
+        self.last_new_rows = []
+
+        for row in rows:
+            if row.article_id <= self.last_article_id: break
+            if row.article_id > max_id_in_page: max_id_in_page = row.article_id
+            self.last_new_rows.append(row)
+
+            if self.post_filter.matches(row):
+                found.append(row)
+
+        if max_id_in_page > self.last_article_id:
+            self.last_article_id = max_id_in_page
+        self.last_new_count = len(self.last_new_rows)
+        return found
+
+# ==========================================
+# [감시 스케줄러]
+# 게시판마다 스레드를 두지 않고, 하나의 asyncio 루프가 "다음 폴링 시각" 순서의
+# 우선순위 큐로 모든 게시판을 관리한다. Tk 없이도 단독으로 사용할 수 있다.
+# ==========================================
+class MonitorScheduler:
+    def __init__(self, fetcher, max_concurrency=4, request_budget_per_min=0, callback_init=None, callback_found=None, callback_error=None,
+                 state_store=None, catchup_max_pages=5, startup_concurrency=2, startup_ramp=0.1, metrics=None):
+        self.fetcher = fetcher
+        self.metrics = metrics or PollMetrics()
+        self.state_store = state_store
+        self.catchup_max_pages = catchup_max_pages
+        self.max_concurrency = max(1, int(max_concurrency))
+        # 시작 직후 모든 게시판이 한꺼번에 첫 조회를 하지 않도록, 간격을 두고 몇 개씩만 진행한다.
+        self.startup_concurrency = max(1, min(int(startup_concurrency), self.max_concurrency))
+        self.startup_ramp = max(0.0, startup_ramp)
+        self._ramp_next = 0.0
+        # 전체 요청 수 상한 (분당). 모든 게시판의 요청 합이 넘으면 주기를 같은 비율로 늘린다.
+        self.request_budget = request_budget_per_min / 60.0 if request_budget_per_min else 0.0
+        self._demand = 0.0
+
+        self.callback_init = callback_init or (lambda item_id, last_id: None)
+        self.callback_found = callback_found or (lambda item_id, row: None)
+        self.callback_error = callback_error or (lambda item_id, error_msg: None)
+
+        self.boards = {}
+        self._heap = []
+        self._seq = 0
+        self._lock = threading.Lock()
+        # 게시판의 폴링이 끝날 때마다 깨운다. (release_board 가 기다린다)
+        self._poll_done = threading.Condition(self._lock)
+
+        self._loop = None
+        self._wake = None
+        self._startup_semaphore = None
+        self._thread = None
+        self._executor = None
+        self._stopping = False
+
+        # 통계
+        self.polls = 0
+        self.errors = 0
+        self.limited = 0
+        self.lag_max = 0.0
+
+    # ---- 외부(어느 스레드에서든) 호출 API ----
+    def add_board(self, item_id, url, interval, nickname_filter="", interval_mode="fixed", min_interval=10, max_interval=600, resume_from=None,
+                  filters=None):
+        with self._lock:
+            board = BoardMonitor(item_id, url, interval, nickname_filter, interval_mode, min_interval, max_interval, resume_from, filters)
+            self.boards[item_id] = board
+            self._update_demand(board)
+            now = time.monotonic()
+            due = max(now, self._ramp_next)
+            self._ramp_next = due + self.startup_ramp
+            self._push(board, due)
+        self._notify()
+        return board
+
+    def remove_board(self, item_id):
+        with self._lock:
+            board = self.boards.pop(item_id, None)
+            if board:
+                board.generation += 1
+                self._demand -= board.demand
+        self.metrics.forget(item_id)
+        self._notify()
+        return board
+
+    def update_board(self, item_id, **changes):
+        # 주기 설정이 실제로 바뀐 경우에만 마지막 폴링 시각 기준으로 다음 순서를 다시 잡는다.
+        # (같은 값으로 다시 저장해도 적응형 주기가 학습한 값은 유지)
+        with self._lock:
+            board = self.boards.get(item_id)
+            if board is None:
+                return
+            changed = {key for key, value in changes.items() if getattr(board, key, None) != value}
+            for key, value in changes.items():
+                setattr(board, key, value)
+            if changed & {"filters", "nickname_filter"}:
+                board.configure_filter()
+            if changed & {"interval", "interval_mode", "min_interval", "max_interval"}:
+                board.configure_interval()
+                self._update_demand(board)
+                if not board.in_flight:
+                    base = board.last_poll_at if board.last_poll_at is not None else time.monotonic()
+                    self._push(board, base + self._effective_interval(board))
+        self._notify()
+
+    def profile_next_poll(self, item_id, path):
+        # 다음 폴링 한 번을 cProfile 로 기록한다. path(.prof) 와 path.txt(누적 시간 순 요약)에 저장된다.
+        with self._lock:
+            board = self.boards.get(item_id)
+            if board is None:
+                return False
+            board.profile_path = path
+            board.profile_request = cProfile.Profile()
+            if not board.in_flight:
+                self._push(board, time.monotonic())
+        self._notify()
+        return True
+
+    def get_last_article_id(self, item_id):
+        board = self.boards.get(item_id)
+        return board.last_article_id if board else 0
+
+    def release_board(self, item_id, timeout=60):
+        # 다른 프로세스로 넘길 게시판을 뺀다. 진행 중이던 폴링(알림 전송 포함)이 끝나기를 기다린 뒤
+        # (마지막 글 번호, 폴링이 끝났는지) 를 돌려주므로, 끝났다면 그 뒤로는 이 게시판의 알림이 나오지 않는다.
+        # timeout 안에 끝나지 않으면 False 와 그때까지 알린 번호를 돌려준다. 늦게 끝난 폴링의 결과는
+        # _is_current 검사로 버려지므로, 넘겨받은 쪽이 그 번호부터 다시 찾는다.
+        board = self.remove_board(item_id)
+        if board is None:
+            return 0, True
+        with self._poll_done:
+            finished = self._poll_done.wait_for(lambda: not board.in_flight, timeout)
+            return board.last_article_id, finished
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="MonitorScheduler", daemon=True)
+        self._thread.start()
+
+    def run(self):
+        asyncio.run(self._main())
+
+    def stop(self, timeout=5):
+        self._stopping = True
+        self._notify()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def stats(self):
+        with self._lock:
+            in_flight = sum(1 for b in self.boards.values() if b.in_flight)
+            return {
+                "boards": len(self.boards),
+                "in_flight": in_flight,
+                "demand_per_min": self._demand * 60,
+                "budget_factor": self._budget_factor(),
+                "queued": len(self._heap),
+                "polls": self.polls,
+                "errors": self.errors,
+                "limited": self.limited,
+                "unchanged": sum(b.unchanged_polls for b in self.boards.values()),
+                "parsed": sum(b.parsed_polls for b in self.boards.values()),
+                "lag_max": self.lag_max,
+                "startup_pending": sum(1 for b in self.boards.values() if not b.baselined),
+            }
+
+    def board_stats(self, item_id):
+        board = self.boards.get(item_id)
+        if board is None:
+            return None
+        return {
+            "last_article_id": board.last_article_id,
+            "interval": self.get_current_interval(item_id),
+            "unchanged_polls": board.unchanged_polls,
+            "parsed_polls": board.parsed_polls,
+            "time_to_baseline": board.baseline_at - board.added_at if board.baseline_at is not None else None,
+            "last_profile": board.last_profile,
+            "metrics": self.metrics.board_snapshot(item_id),
+        }
+
+    def get_current_interval(self, item_id):
+        with self._lock:
+            board = self.boards.get(item_id)
+            return self._effective_interval(board) if board else None
+
+    # ---- 내부 ----
+    def _catch_up(self, board):
+        # 저장된 번호가 나올 때까지 이전 페이지로 거슬러 올라가며 놓친 글을 모은다.
+        collected = {}
+        for page in range(1, self.catchup_max_pages + 1):
+            rows = self.fetcher.fetch_rows(board.url, None, None, page)
+            if not rows:
+                break
+            for row in rows:
+                if row.article_id > board.resume_from:
+                    collected.setdefault(row.article_id, row)
+            if any(row.article_id <= board.resume_from for row in rows):
+                break
+        return sorted(collected.values(), key=lambda r: r.article_id, reverse=True)
+
+    def _update_demand(self, board):
+        self._demand -= board.demand
+        board.demand = 1.0 / max(1, board.current_interval())
+        self._demand += board.demand
+
+    def _budget_factor(self):
+        if not self.request_budget or self._demand <= self.request_budget:
+            return 1.0
+        return self._demand / self.request_budget
+
+    def _effective_interval(self, board):
+        return board.current_interval() * self._budget_factor()
+
+    def _push(self, board, due):
+        # 이전 예약은 generation 으로 무효화한다. (힙에서 직접 지우지 않음)
+        board.generation += 1
+        self._seq += 1
+        heapq.heappush(self._heap, (due, self._seq, board.item_id, board.generation))
+
+    def _notify(self):
+        loop, wake = self._loop, self._wake
+        if loop is not None and wake is not None:
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                pass
+
+    def _is_current(self, board):
+        # 같은 id 라도 주소가 바뀌어 새로 만든 게시판이면 이전 폴링 결과는 버린다.
+        return self.boards.get(board.item_id) is board
+
+    def _pop_due(self, now):
+        due_boards = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due, _, item_id, generation = heapq.heappop(self._heap)
+                board = self.boards.get(item_id)
+                if board is None or board.generation != generation:
+                    continue
+                board.in_flight = True
+                due_boards.append((board, due))
+            next_due = self._heap[0][0] if self._heap else None
+        return due_boards, next_due
+
+    async def _main(self):
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="fetch")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._startup_semaphore = asyncio.Semaphore(self.startup_concurrency)
+        tasks = set()
+
+        try:
+            while not self._stopping:
+                now = time.monotonic()
+                due_boards, next_due = self._pop_due(now)
+                for board, due in due_boards:
+                    task = asyncio.ensure_future(self._poll(board, due, semaphore))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+
+                self._wake.clear()
+                timeout = None if next_due is None else max(0.0, next_due - time.monotonic())
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._executor.shutdown(wait=False)
+            self._loop = None
+            self._wake = None
+
+    async def _poll(self, board, due, semaphore):
+        if board.baselined:
+            await self._poll_once(board, due, semaphore)
+            return
+        # 첫 조회(기준 글 확인/따라잡기)는 드라이버 기동 등으로 무거우므로 별도로 동시 수를 제한한다.
+        async with self._startup_semaphore:
+            await self._poll_once(board, due, semaphore)
+
+    async def _poll_once(self, board, due, semaphore):
+        async with semaphore:
+            if self._stopping or not self._is_current(board):
+                return
+            started = time.monotonic()
+            self.lag_max = max(self.lag_max, started - due)
+            # 단계별 소요 시간. fetch 안쪽 단계(rate_wait/network/parse 등)는 백엔드가 채운다.
+            trace = PollTrace()
+            trace.add("queue_wait", max(0.0, started - due))
+            profiler, board.profile_request = board.profile_request, None
+            failed = False
+            retry_after = 0.0
+            catching_up = not board.baselined and board.resume_from is not None
+            previous_last_id = board.last_article_id
+            if catching_up:
+                fetch_args = (self._catch_up, board)
+            else:
+                min_id = board.last_article_id if board.baselined else None
+                fetch_args = (self.fetcher.fetch_rows, board.url, board.fetch_state, min_id)
+            try:
+                rows = await self._loop.run_in_executor(self._executor, self._run_fetch, trace, profiler, *fetch_args)
+            except RateLimitError as e:
+                # 요청 제한/카페 일시 중지: 오류로 세지 않고, 풀릴 때까지 다음 폴링을 미룬다.
+                failed = True
+                retry_after = e.retry_after
+                if not self._stopping and self._is_current(board):
+                    self.limited += 1
+                    self.callback_error(board.item_id, str(e))
+                rows = None
+            except Exception as e:
+                failed = True
+                if not self._stopping and self._is_current(board):
+                    self.errors += 1
+                    self.metrics.record_error(board.item_id, f"{type(e).__name__}: {e}")
+                    self.callback_error(board.item_id, str(e))
+                rows = None
+            finally:
+                self.polls += 1
+                trace.add("fetch", time.monotonic() - started)
+
+            if not failed and rows is None and not board.baselined:
+                # 첫 조회에서 "변경 없음"을 돌려준 경우(빈 게시판 등)도 조회는 끝났으므로 빈 목록으로 기준을 잡는다.
+                rows = []
+            if not failed and rows is None:
+                board.unchanged_polls += 1
+                board.last_new_count = 0
+                if board.last_poll_at is not None:
+                    board.observe_poll(started - board.last_poll_at)
+            elif rows is not None and self._is_current(board):
+                board.parsed_polls += 1
+                matched = []
+                if profiler:
+                    profiler.enable()
+                if catching_up:
+                    # 꺼져 있던 동안 올라온 글을 새 글로 처리한다.
+                    board.last_article_id = board.resume_from
+                    board.baselined = True
+                    board.baseline_at = time.monotonic()
+                    self.callback_init(board.item_id, board.last_article_id)
+                    with trace.phase("filter"):
+                        matched = board.check_new_posts(rows)
+                elif not board.baselined:
+                    board.last_article_id = board.get_latest_post_id(rows)
+                    board.baselined = True
+                    board.baseline_at = time.monotonic()
+                    self.callback_init(board.item_id, board.last_article_id)
+                else:
+                    with trace.phase("filter"):
+                        matched = board.check_new_posts(rows)
+                    if board.last_poll_at is not None:
+                        board.observe_poll(started - board.last_poll_at)
+
+                with trace.phase("dispatch"):
+                    for row in matched:
+                        self.callback_found(board.item_id, row)
+                        # 감지 지연: 글 작성 시각 -> 알림 시각 (따라잡기로 찾은 글은 제외)
+                        if row.posted_at and not catching_up:
+                            self.metrics.record_lag(board.item_id, max(0.0, time.time() - row.posted_at))
+                if profiler:
+                    profiler.disable()
+
+                if self.state_store and board.last_article_id != previous_last_id:
+                    with trace.phase("store"):
+                        try:
+                            await self._loop.run_in_executor(
+                                self._executor, self.state_store.record_poll,
+                                board.item_id, board.last_article_id, list(board.last_new_rows))
+                        except Exception as e:
+                            print(f"State Store Error: {e}")
+            if profiler:
+                self._save_profile(board, profiler)
+
+            trace.add("total", time.monotonic() - started)
+            if self._is_current(board):
+                self.metrics.record_poll(board.item_id, trace)
+
+        with self._lock:
+            board.in_flight = False
+            board.last_poll_at = started
+            self._poll_done.notify_all()
+            if self.boards.get(board.item_id) is board:
+                self._update_demand(board)
+                self._push(board, started + max(self._effective_interval(board), retry_after))
+        # 모든 게시판이 폴링 중이라 큐가 비어 있던 경우에도 메인 루프가 새 예약을 보도록 깨운다.
+        if self._wake is not None:
+            self._wake.set()
+
+    def _run_fetch(self, trace, profiler, func, *args):
+        # 실행기 스레드에서 fetch 를 돌리며, 백엔드의 trace_phase 기록이 trace 로 모이게 한다.
+        _trace_local.trace = trace
+        if profiler:
+            profiler.enable()
+        try:
+            return func(*args)
+        finally:
+            if profiler:
+                profiler.disable()
+            _trace_local.trace = None
+
+    def _save_profile(self, board, profiler):
+        path = board.profile_path
+        try:
+            profiler.dump_stats(path)
+            summary = io.StringIO()
+            pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(40)
+            with open(path + ".txt", 'w', encoding='utf-8') as f:
+                f.write(summary.getvalue())
+            board.last_profile = path
+            print(f"Poll Profile ({board.item_id}): {path}")
+        except Exception as e:
+            print(f"Profile Error: {e}")
+
+# ==========================================
+# [감시 상태 저장소]
+# 게시판별 마지막 글 번호와 최근 글 정보를 SQLite 에 저장한다.
+# 재시작하면 저장된 번호부터 이어서 감시하고, 그 사이에 올라온 글은 이전 페이지를 거슬러 올라가 찾는다.
+# ==========================================
+class StateStore:
+    def __init__(self, path, recent_per_board=200):
+        self.path = path
+        self.recent_per_board = recent_per_board
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        # WAL: 쓰기 도중 강제 종료되어도 마지막으로 커밋된 상태는 그대로 남는다.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS board_state (
+                item_id TEXT PRIMARY KEY,
+                last_article_id INTEGER NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS recent_posts (
+                item_id TEXT NOT NULL,
+                article_id INTEGER NOT NULL,
+                writer TEXT,
+                title TEXT,
+                seen_at REAL NOT NULL,
+                PRIMARY KEY (item_id, article_id)
+            );
+        """)
+        self._conn.commit()
+
+    def load_all(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT item_id, last_article_id FROM board_state").fetchall()
+        return {item_id: last_id for item_id, last_id in rows}
+
+    def record_poll(self, item_id, last_article_id, new_rows=()):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO board_state (item_id, last_article_id, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(item_id) DO UPDATE SET last_article_id=excluded.last_article_id, updated_at=excluded.updated_at",
+                (item_id, last_article_id, now))
+            if new_rows:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO recent_posts (item_id, article_id, writer, title, seen_at) VALUES (?, ?, ?, ?, ?)",
+                    [(item_id, r.article_id, r.writer, r.title, now) for r in new_rows])
+                # 게시판마다 최근 글은 정해진 개수만 남긴다.
+                self._conn.execute(
+                    "DELETE FROM recent_posts WHERE item_id = ? AND article_id NOT IN "
+                    "(SELECT article_id FROM recent_posts WHERE item_id = ? ORDER BY article_id DESC LIMIT ?)",
+                    (item_id, item_id, self.recent_per_board))
+
+    def recent_posts(self, item_id, limit=20):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT article_id, writer, title, seen_at FROM recent_posts WHERE item_id = ? "
+                "ORDER BY article_id DESC LIMIT ?", (item_id, limit)).fetchall()
+        return [{"article_id": a, "writer": w, "title": t, "seen_at": s} for a, w, t, s in rows]
+
+    def forget(self, item_id):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM board_state WHERE item_id = ?", (item_id,))
+            self._conn.execute("DELETE FROM recent_posts WHERE item_id = ?", (item_id,))
+
+    def retain(self, item_ids):
+        # config.json 에서 사라진 항목의 기록은 지운다.
+        keep = set(item_ids)
+        for item_id in set(self.load_all()) - keep:
+            self.forget(item_id)
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                pass
+            self._conn.close()
+
+# ==========================================
+# [알림 전달]
+# 감지된 새 글을 웹훅/로컬 소켓/데스크톱 알림/파일로 내보낸다.
+# 전달 대상(sink)마다 크기 제한이 있는 대기열을 두고, 별도 asyncio 스레드에서 모아서 보낸다.
+# 느리거나 죽은 대상이 있어도 감지 쪽은 기다리지 않는다. (대기열이 차면 가장 오래된 것부터 버림)
+# ==========================================
+class WebhookSink:
+    def __init__(self, url, timeout=5, headers=None):
+        self.url = url
+        self.headers = dict(headers or {})
+        self.headers.setdefault("Content-Type", "application/json; charset=UTF-8")
+        self.pool = HttpConnectionPool(1, timeout)
+
+    def send(self, events):
+        body = json.dumps({"events": events}, ensure_ascii=False).encode("utf-8")
+        resp = self.pool.request("POST", self.url, headers=self.headers, body=body)
+        if not 200 <= resp.status < 300:
+            raise FetchError(f"HTTP {resp.status}")
+
+    def close(self):
+        self.pool.close()
+
+
+class SocketSink:
+    # 로컬 TCP 소켓으로 한 줄에 이벤트 하나(JSON)씩 보낸다. 끊기면 다음 전송 때 다시 연결한다.
+    def __init__(self, host="127.0.0.1", port=8766, timeout=5):
+        self.address = (host, port)
+        self.timeout = timeout
+        self._sock = None
+
+    def send(self, events):
+        data = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in events).encode("utf-8")
+        if self._sock is None:
+            self._sock = socket.create_connection(self.address, timeout=self.timeout)
+        try:
+            self._sock.sendall(data)
+        except OSError:
+            self.close()
+            raise
+
+    def close(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+
+class DesktopSink:
+    # plyer 가 있으면 사용하고, 없으면 notify-send(리눅스)를 쓴다.
+    def __init__(self, app_name="네이버 카페 새글 알리미", timeout=10):
+        self.app_name = app_name
+        self.timeout = timeout
+        self._notify_send = shutil.which("notify-send")
+        if desktop_notification is None and self._notify_send is None:
+            raise RuntimeError("데스크톱 알림을 보낼 수 없습니다 (plyer 미설치)")
+
+    def send(self, events):
+        if len(events) == 1:
+            title = f"[{events[0].get('name', '')}] 새 글"
+            message = f"{events[0].get('title', '')} - {events[0].get('writer', '')}"
+        else:
+            title = f"새 글 {len(events)}개"
+            message = "\n".join(f"[{e.get('name', '')}] {e.get('title', '')}" for e in events[:5])
+
+        if desktop_notification is not None:
+            desktop_notification.notify(title=title, message=message, app_name=self.app_name, timeout=self.timeout)
+        else:
+            subprocess.run([self._notify_send, "-a", self.app_name, title, message], check=True, timeout=self.timeout)
+
+    def close(self):
+        pass
+
+
+class FileSink:
+    # 한 줄에 이벤트 하나(JSON)씩 파일 끝에 덧붙인다.
+    def __init__(self, path):
+        self.path = path if os.path.isabs(path) else os.path.join(APP_PATH, path)
+
+    def send(self, events):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for event in events:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+    def close(self):
+        pass
+
+
+SINK_TYPES = {
+    "webhook": WebhookSink,
+    "socket": SocketSink,
+    "desktop": DesktopSink,
+    "file": FileSink,
+}
+
+# 대기열/재시도 옵션. 나머지 키는 sink 생성자에 그대로 넘긴다.
+NOTIFIER_OPTIONS = {"type", "name", "queue_size", "batch_size", "batch_delay", "retries", "backoff", "max_backoff"}
+
+
+class SinkChannel:
+    # sink 하나의 대기열과 통계
+    def __init__(self, name, sink, queue_size=1000, batch_size=20, batch_delay=0.2, retries=3, backoff=1.0, max_backoff=30.0):
+        self.name = name
+        self.sink = sink
+        self.batch_size = max(1, int(batch_size))
+        self.batch_delay = batch_delay
+        self.retries = max(0, int(retries))
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.queue = deque(maxlen=max(1, int(queue_size)))
+        self.lock = threading.Lock()
+        self.ready = None
+
+        # 통계
+        self.delivered = 0
+        self.batches = 0
+        self.failed = 0
+        self.dropped = 0
+        self.retried = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.last_error = None
+
+    def put(self, event):
+        with self.lock:
+            if len(self.queue) == self.queue.maxlen:
+                self.dropped += 1
+            self.queue.append(event)
+
+    def take(self):
+        with self.lock:
+            batch = []
+            while self.queue and len(batch) < self.batch_size:
+                batch.append(self.queue.popleft())
+            return batch
+
+    def stats(self):
+        with self.lock:
+            return {
+                "queued": len(self.queue),
+                "delivered": self.delivered,
+                "batches": self.batches,
+                "failed": self.failed,
+                "dropped": self.dropped,
+                "retried": self.retried,
+                "latency_avg": self.latency_total / self.delivered if self.delivered else 0.0,
+                "latency_max": self.latency_max,
+                "last_error": self.last_error,
+            }
+
+
+class NotifierHub:
+    def __init__(self, configs=None):
+        self.channels = []
+        for index, config in enumerate(configs or []):
+            try:
+                self.add_sink(config, index)
+            except Exception as e:
+                print(f"Notifier Config Error ({config.get('type') if isinstance(config, dict) else config}): {e}")
+
+        self._loop = None
+        self._thread = None
+        self._started = threading.Event()
+        self._stopping = False
+        self._deadline = None
+
+    def add_sink(self, config, index=0):
+        sink_cls = SINK_TYPES.get(config.get("type"))
+        if sink_cls is None:
+            raise ValueError(f"알 수 없는 알림 종류: {config.get('type')}")
+        sink_args = {k: v for k, v in config.items() if k not in NOTIFIER_OPTIONS}
+        options = {k: v for k, v in config.items() if k in NOTIFIER_OPTIONS - {"type", "name"}}
+        name = config.get("name") or f"{config['type']}-{index}"
+        channel = SinkChannel(name, sink_cls(**sink_args), **options)
+        self.channels.append(channel)
+        return channel
+
+    # ---- 수명 주기 ----
+    def start(self):
+        if not self.channels:
+            return
+        self._thread = threading.Thread(target=self.run, name="NotifierHub", daemon=True)
+        self._thread.start()
+        self._started.wait(5)
+
+    def run(self):
+        asyncio.run(self._main())
+
+    def stop(self, timeout=5):
+        # 남은 알림은 timeout 안에서 최대한 보내고 끝낸다.
+        self._deadline = time.monotonic() + timeout
+        self._stopping = True
+        self._wake_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout + 1)
+        for channel in self.channels:
+            if channel.queue:
+                print(f"Notifier ({channel.name}): 보내지 못한 알림 {len(channel.queue)}개를 버립니다")
+            try:
+                channel.sink.close()
+            except Exception:
+                pass
+
+    # ---- 외부(어느 스레드에서든) 호출 API ----
+    def publish(self, event):
+        # MonitorEngine.subscribe 에 그대로 연결한다. 새 글 이벤트만 전달한다.
+        if event.get("type") != "post" or not self.channels:
+            return
+        for channel in self.channels:
+            channel.put(event)
+        self._wake_all()
+
+    def stats(self):
+        return {channel.name: channel.stats() for channel in self.channels}
+
+    # ---- 내부 ----
+    def _wake_all(self):
+        loop = self._loop
+        if loop is None:
+            return
+        for channel in self.channels:
+            if channel.ready is not None:
+                try:
+                    loop.call_soon_threadsafe(channel.ready.set)
+                except RuntimeError:
+                    pass
+
+    async def _main(self):
+        self._loop = asyncio.get_running_loop()
+        # sink 는 동기 코드이므로 sink 마다 스레드 하나씩 두어 서로 막지 않게 한다.
+        executor = ThreadPoolExecutor(max_workers=len(self.channels), thread_name_prefix="notify")
+        for channel in self.channels:
+            channel.ready = asyncio.Event()
+        self._started.set()
+        try:
+            await asyncio.gather(*(self._worker(channel, executor) for channel in self.channels))
+        finally:
+            executor.shutdown(wait=False)
+            self._loop = None
+
+    async def _worker(self, channel, executor):
+        while True:
+            if self._stopping and time.monotonic() >= self._deadline:
+                return
+            if not channel.queue:
+                if self._stopping:
+                    return
+                channel.ready.clear()
+                await channel.ready.wait()
+                # 짧게 기다려 한 번에 보낼 묶음을 만든다.
+                if channel.batch_delay and not self._stopping:
+                    await asyncio.sleep(channel.batch_delay)
+                continue
+
+            batch = channel.take()
+            if batch:
+                await self._deliver(channel, batch, executor)
+
+    async def _deliver(self, channel, batch, executor):
+        for attempt in range(channel.retries + 1):
+            try:
+                await self._loop.run_in_executor(executor, channel.sink.send, batch)
+            except Exception as e:
+                with channel.lock:
+                    channel.last_error = str(e)
+                if attempt == channel.retries or self._stopping:
+                    with channel.lock:
+                        channel.failed += len(batch)
+                    print(f"Notifier Error ({channel.name}): {e}")
+                    return
+                with channel.lock:
+                    channel.retried += 1
+                await asyncio.sleep(min(channel.max_backoff, channel.backoff * (2 ** attempt)))
+                continue
+
+            now = time.time()
+            with channel.lock:
+                channel.batches += 1
+                channel.delivered += len(batch)
+                for event in batch:
+                    latency = now - event.get("time", now)
+                    channel.latency_total += latency
+                    channel.latency_max = max(channel.latency_max, latency)
+            return
+
+# ==========================================
+# [다중 프로세스 분할 감시]
+# shard_workers 가 1 이상이면 게시판들을 여러 작업 프로세스로 나눠 감시한다.
+# 프로세스마다 GIL/드라이버 풀/스케줄러를 따로 가지므로 코어를 모두 쓰고, 한 프로세스가 죽어도 나머지는 계속 감시한다.
+#   - 같은 카페의 게시판은 같은 프로세스에 둔다. (카페별 요청 제한/카페 묶음 조회가 그대로 동작)
+#   - 죽은 프로세스는 다시 띄우고, 맡던 게시판은 state.db 의 마지막 글 번호부터 이어서 감시한다.
+#   - 게시판 수가 한쪽으로 몰리면 카페 단위로 옮긴다.
+#   - 감지/오류/계측은 프로세스별 큐로 부모에게 보내, GUI/데몬은 한 프로세스일 때와 같은 이벤트를 받는다.
+# ==========================================
+def shard_worker_settings(settings, workers):
+    # 호스트 요청 제한과 전체 요청 상한은 작업 프로세스 수로 나눠, 합이 한 프로세스일 때와 같게 한다.
+    worker_settings = dict(settings, shard_workers=0, notifiers=[], metrics_dump_path="")
+    worker_settings["rate_limit_per_host"] = settings["rate_limit_per_host"] / workers
+    worker_settings["rate_limit_host_burst"] = max(1, settings["rate_limit_host_burst"] // workers)
+    if settings["request_budget_per_min"]:
+        worker_settings["request_budget_per_min"] = settings["request_budget_per_min"] / workers
+    return worker_settings
+
+
+class ShardMetricsForwarder:
+    # 작업 프로세스의 PollMetrics 자리. 기록을 부모 프로세스로 넘겨 한곳에서 모은다.
+    def __init__(self, events):
+        self.events = events
+
+    def record_poll(self, item_id, trace):
+        self.events.put(("poll", item_id, trace.phases, trace.values))
+
+    def record_lag(self, item_id, seconds):
+        self.events.put(("lag", item_id, seconds))
+
+    def record_error(self, item_id, message):
+        self.events.put(("poll_error", item_id, message))
+
+    def forget(self, item_id):
+        pass
+
+    def board_snapshot(self, item_id):
+        return None
+
+
+def shard_worker_main(index, settings, state_db_path, commands, events):
+    # 작업 프로세스: Tk/알람 없이 스케줄러만 돌리고, 부모가 보낸 명령을 처리한다.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    driver_pool, http_pool, limiter, fetcher = create_fetch_stack(settings)
+    state_store = StateStore(state_db_path, settings["recent_posts_per_board"]) if settings["state_store"] else None
+    scheduler = MonitorScheduler(
+        fetcher,
+        max_concurrency=settings["max_concurrent_fetches"],
+        request_budget_per_min=settings["request_budget_per_min"],
+        callback_init=lambda item_id, last_id: events.put(("init", item_id, last_id)),
+        callback_found=lambda item_id, row: events.put(("found", item_id, tuple(row))),
+        callback_error=lambda item_id, error_msg: events.put(("error", item_id, error_msg)),
+        state_store=state_store,
+        catchup_max_pages=settings["catchup_max_pages"],
+        startup_concurrency=settings["startup_concurrency"],
+        startup_ramp=settings["startup_ramp"],
+        metrics=ShardMetricsForwarder(events),
+    )
+    scheduler.start()
+    parent = multiprocessing.parent_process()
+    reported = 0.0
+    try:
+        while True:
+            try:
+                command = commands.get(timeout=1)
+            except queue.Empty:
+                command = None
+            if command is not None:
+                op = command[0]
+                if op == "stop":
+                    break
+                if op == "add":
+                    _, item_id, args = command
+                    scheduler.add_board(item_id, **args)
+                elif op == "update":
+                    scheduler.update_board(command[1], **command[2])
+                elif op == "remove":
+                    # 진행 중인 폴링의 found 가 모두 큐에 들어간 뒤에 removed 를 보낸다.
+                    last_id, finished = scheduler.release_board(command[1])
+                    events.put(("removed", command[1], last_id, finished))
+                elif op == "profile":
+                    scheduler.profile_next_poll(command[1], command[2])
+
+            if time.monotonic() - reported >= 1:
+                reported = time.monotonic()
+                events.put(("stats", scheduler.stats(),
+                            {item_id: scheduler.board_stats(item_id) for item_id in list(scheduler.boards)},
+                            {
+                                "http_pool": http_pool.stats(),
+                                "driver_pool": driver_pool.stats(),
+                                "fetcher": fetcher.stats() if hasattr(fetcher, "stats") else {},
+                                "limiter": limiter.stats() if limiter else {},
+                            }))
+            if parent is not None and not parent.is_alive():
+                break
+    finally:
+        scheduler.stop()
+        driver_pool.shutdown()
+        http_pool.close()
+        if state_store:
+            state_store.close()
+
+
+# 작업 프로세스가 첫 통계를 보내기 전의 기본값. (MonitorScheduler/HttpConnectionPool/DriverPool.stats() 와 같은 키)
+SHARD_EMPTY_STATS = {
+    "scheduler": {
+        "boards": 0, "in_flight": 0, "demand_per_min": 0.0, "budget_factor": 1.0, "queued": 0, "polls": 0,
+        "errors": 0, "limited": 0, "unchanged": 0, "parsed": 0, "lag_max": 0.0, "startup_pending": 0,
+    },
+    "http_pool": {"requests": 0, "opened": 0, "reused": 0, "idle": 0},
+    "driver_pool": {
+        "size": 0, "created": 0, "in_use": 0, "idle": 0, "occupancy": 0.0, "lease_count": 0, "lease_timeouts": 0,
+        "recycled": 0, "recycled_rss": 0, "recycled_age": 0, "rss": 0, "oldest_age": 0.0,
+        "wait_avg": 0.0, "wait_max": 0.0,
+    },
+}
+
+
+def merge_stats(parts):
+    # 프로세스별 통계 dict 를 하나로 합친다. *_max 는 최댓값, *_avg/occupancy 는 평균, 나머지 숫자는 합.
+    merged = {}
+    parts = [p for p in parts if p]
+    for key in {k for p in parts for k in p}:
+        values = [p[key] for p in parts if key in p]
+        if all(isinstance(v, dict) for v in values):
+            merged[key] = {}
+            for v in values:
+                merged[key].update(v)
+        elif all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+            if key.endswith("_max") or key in ("budget_factor", "oldest_age"):
+                merged[key] = max(values)
+            elif key.endswith("_avg") or key == "occupancy":
+                merged[key] = sum(values) / len(values)
+            else:
+                merged[key] = sum(values)
+        else:
+            merged[key] = values[-1]
+    return merged
+
+
+class ShardSupervisor:
+    # MonitorScheduler 와 같은 호출 방식(add_board/update_board/remove_board/stats ...)이라 MonitorEngine 은 어느 쪽이든 그대로 쓴다.
+    def __init__(self, settings, workers, callback_init=None, callback_found=None, callback_error=None, state_store=None,
+                 metrics=None, state_db_path=None, rebalance_interval=30, restart_max_delay=60):
+        self.settings = settings
+        self.workers = max(1, int(workers))
+        self.worker_settings = shard_worker_settings(settings, self.workers)
+        self.state_store = state_store
+        self.state_db_path = state_db_path or STATE_DB_PATH
+        self.metrics = metrics or PollMetrics()
+        self.rebalance_interval = rebalance_interval
+        self.restart_max_delay = restart_max_delay
+
+        self.callback_init = callback_init or (lambda item_id, last_id: None)
+        self.callback_found = callback_found or (lambda item_id, row: None)
+        self.callback_error = callback_error or (lambda item_id, error_msg: None)
+
+        # Windows 와 같은 방식(spawn)으로 통일: 부모의 스레드/크롬 상태를 물려받지 않는다.
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self.boards = {}
+        self.shards = [{
+            "process": None, "commands": None, "boards": set(),
+            "scheduler": {}, "board_stats": {}, "worker": {},
+            "started_at": 0.0, "restart_at": None, "restart_delay": 1.0, "restarts": 0,
+        } for _ in range(self.workers)]
+        self._thread = None
+        self._stopping = False
+
+        # 통계
+        self.restarts = 0
+        self.moved = 0
+
+    # ---- 외부 호출 API (MonitorScheduler 와 같음) ----
+    def add_board(self, item_id, url, interval, nickname_filter="", interval_mode="fixed", min_interval=10, max_interval=600, resume_from=None,
+                  filters=None):
+        args = {"url": url, "interval": interval, "nickname_filter": nickname_filter, "interval_mode": interval_mode,
+                "min_interval": min_interval, "max_interval": max_interval, "filters": filters}
+        board_url = parse_board_url(url)
+        with self._lock:
+            # alarmed: 최근에 알린 글 번호. 옮기거나 재시작하며 같은 글을 다시 찾아도 한 번만 알린다.
+            board = {"args": args, "cafe": board_url['clubid'] if board_url else item_id,
+                     "resume_from": resume_from, "last_article_id": resume_from or 0, "shard": None, "move_from": None,
+                     "alarmed": deque(maxlen=256)}
+            self.boards[item_id] = board
+            board["shard"] = self._place(board)
+            self.shards[board["shard"]]["boards"].add(item_id)
+            self._send_add(item_id)
+
+    def remove_board(self, item_id):
+        with self._lock:
+            board = self.boards.pop(item_id, None)
+            if board:
+                self.shards[board["shard"]]["boards"].discard(item_id)
+                self._send(board["shard"], ("remove", item_id))
+        self.metrics.forget(item_id)
+
+    def update_board(self, item_id, **changes):
+        with self._lock:
+            board = self.boards.get(item_id)
+            if board is None:
+                return
+            board["args"].update({k: v for k, v in changes.items() if k in board["args"]})
+            self._send(board["shard"], ("update", item_id, changes))
+
+    def get_last_article_id(self, item_id):
+        board = self.boards.get(item_id)
+        return board["last_article_id"] if board else 0
+
+    def profile_next_poll(self, item_id, path):
+        with self._lock:
+            board = self.boards.get(item_id)
+            if board is None:
+                return False
+            self._send(board["shard"], ("profile", item_id, path))
+        return True
+
+    def start(self):
+        with self._lock:
+            for index in range(self.workers):
+                self._start_worker(index)
+        self._thread = threading.Thread(target=self._supervise, name="ShardSupervisor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=5):
+        self._stopping = True
+        with self._lock:
+            for index in range(self.workers):
+                self._send(index, ("stop",))
+        deadline = time.monotonic() + timeout
+        for shard in self.shards:
+            process = shard["process"]
+            if process is None:
+                continue
+            process.join(max(0.1, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+                process.join(1)
+            shard["commands"].close()
+            shard["commands"].cancel_join_thread()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def stats(self):
+        with self._lock:
+            merged = dict(SHARD_EMPTY_STATS["scheduler"], **merge_stats([shard["scheduler"] for shard in self.shards]))
+            merged.update({
+                "boards": len(self.boards),
+                "workers": self.workers,
+                "workers_alive": sum(1 for s in self.shards if s["process"] is not None and s["process"].is_alive()),
+                "worker_restarts": self.restarts,
+                "boards_moved": self.moved,
+                "shards": [{
+                    "pid": s["process"].pid if s["process"] else None,
+                    "alive": bool(s["process"] and s["process"].is_alive()),
+                    "boards": len(s["boards"]),
+                    "restarts": s["restarts"],
+                } for s in self.shards],
+            })
+            return merged
+
+    def worker_stats(self):
+        # 작업 프로세스들의 연결 풀/드라이버 풀/요청 제한기 통계를 합친 것
+        with self._lock:
+            workers = [shard["worker"] for shard in self.shards]
+        return {key: dict(SHARD_EMPTY_STATS.get(key, {}), **merge_stats([w.get(key) for w in workers]))
+                for key in ("http_pool", "driver_pool", "fetcher", "limiter")}
+
+    def board_stats(self, item_id):
+        with self._lock:
+            board = self.boards.get(item_id)
+            if board is None:
+                return None
+            stats = dict(self.shards[board["shard"]]["board_stats"].get(item_id) or {})
+        stats["shard"] = board["shard"]
+        stats["metrics"] = self.metrics.board_snapshot(item_id)
+        return stats
+
+    def get_current_interval(self, item_id):
+        stats = self.board_stats(item_id)
+        return stats.get("interval") if stats else None
+
+    # ---- 내부 ----
+    def _place(self, board):
+        # 같은 카페가 있는 프로세스가 있으면 그곳, 없으면 게시판이 가장 적은 프로세스
+        for index, shard in enumerate(self.shards):
+            if any(self.boards[i]["cafe"] == board["cafe"] for i in shard["boards"] if i in self.boards):
+                return index
+        return min(range(self.workers), key=lambda i: len(self.shards[i]["boards"]))
+
+    def _send(self, index, command):
+        shard = self.shards[index]
+        if shard["commands"] is None:
+            return
+        try:
+            shard["commands"].put(command)
+        except (OSError, ValueError) as e:
+            print(f"Shard Command Error ({index}): {e}")
+
+    def _send_add(self, item_id):
+        board = self.boards[item_id]
+        args = dict(board["args"], resume_from=board["resume_from"])
+        self._send(board["shard"], ("add", item_id, args))
+
+    def _start_worker(self, index):
+        shard = self.shards[index]
+        if shard["commands"] is not None:
+            shard["commands"].close()
+            shard["commands"].cancel_join_thread()
+        commands = self._ctx.Queue()
+        events = self._ctx.Queue()
+        process = self._ctx.Process(target=shard_worker_main, name=f"ShardWorker-{index}",
+                                    args=(index, self.worker_settings, self.state_db_path, commands, events), daemon=True)
+        process.start()
+        shard.update(process=process, commands=commands, scheduler={}, board_stats={}, worker={},
+                     started_at=time.monotonic(), restart_at=None)
+        threading.Thread(target=self._read_events, args=(index, process, events), name=f"ShardEvents-{index}", daemon=True).start()
+        for item_id in shard["boards"]:
+            self._send_add(item_id)
+
+    def _read_events(self, index, process, events):
+        # 프로세스마다 따로 읽으므로, 한 프로세스가 쓰는 도중 죽어 큐가 망가져도 다른 프로세스에는 영향이 없다.
+        while True:
+            try:
+                event = events.get(timeout=0.5)
+            except queue.Empty:
+                if self._stopping or not process.is_alive() or self.shards[index]["process"] is not process:
+                    break
+                continue
+            except (EOFError, OSError, ValueError):
+                break
+            try:
+                self._handle_event(index, event)
+            except Exception as e:
+                print(f"Shard Event Error ({index}): {e}")
+        events.close()
+        events.cancel_join_thread()
+
+    def _handle_event(self, index, event):
+        kind, payload = event[0], event[1:]
+        if kind == "stats":
+            scheduler_stats, board_stats, worker_stats = payload
+            with self._lock:
+                shard = self.shards[index]
+                shard.update(scheduler=scheduler_stats, board_stats=board_stats, worker=worker_stats)
+                for item_id, stats in board_stats.items():
+                    board = self.boards.get(item_id)
+                    if board is not None and board["shard"] == index and stats:
+                        board["last_article_id"] = max(board["last_article_id"], stats["last_article_id"])
+            return
+        if kind == "removed":
+            item_id, last_id, finished = payload
+            if not finished:
+                print(f"Shard Release Warning: {item_id} 의 폴링이 끝나기 전에 넘깁니다 (shard {index})")
+            with self._lock:
+                board = self.boards.get(item_id)
+                if board is not None and board["move_from"] == index:
+                    # 옮기는 중인 게시판: 이전 프로세스가 놓아 준 번호부터 새 프로세스가 이어서 감시한다.
+                    board["move_from"] = None
+                    board["resume_from"] = max(last_id, board["last_article_id"]) or None
+                    self._send_add(item_id)
+            return
+
+        item_id = payload[0]
+        with self._lock:
+            board = self.boards.get(item_id)
+            # 옮기는 중에는 removed 응답이 올 때까지 이전 프로세스의 이벤트도 받는다.
+            # (놓아 주기 직전에 찾은 글의 found 가 removed 보다 먼저 큐에 들어 있다)
+            if board is None or index not in (board["shard"], board["move_from"]):
+                return
+            if kind == "init":
+                board["last_article_id"] = max(board["last_article_id"], payload[1])
+            elif kind == "found":
+                row = PostRow(*payload[1])
+                if row.article_id in board["alarmed"]:
+                    return
+                board["alarmed"].append(row.article_id)
+                board["last_article_id"] = max(board["last_article_id"], row.article_id)
+        if kind == "init":
+            self.callback_init(item_id, payload[1])
+        elif kind == "found":
+            self.callback_found(item_id, row)
+        elif kind == "error":
+            self.callback_error(item_id, payload[1])
+        elif kind == "poll":
+            trace = PollTrace()
+            trace.phases, trace.values = payload[1], payload[2]
+            self.metrics.record_poll(item_id, trace)
+        elif kind == "lag":
+            self.metrics.record_lag(item_id, payload[1])
+        elif kind == "poll_error":
+            self.metrics.record_error(item_id, payload[1])
+
+    def _supervise(self):
+        last_rebalance = time.monotonic()
+        while not self._stopping:
+            time.sleep(1)
+            if self._stopping:
+                break
+            now = time.monotonic()
+            for index, shard in enumerate(self.shards):
+                process = shard["process"]
+                if process is not None and not process.is_alive() and shard["restart_at"] is None:
+                    self._worker_died(index, now)
+                elif shard["restart_at"] is not None and now >= shard["restart_at"]:
+                    self._restart_worker(index)
+            if now - last_rebalance >= self.rebalance_interval:
+                last_rebalance = now
+                self.rebalance()
+
+    def _worker_died(self, index, now):
+        shard = self.shards[index]
+        # 시작하자마자 계속 죽는 경우 재시작 간격을 두 배씩 늘린다.
+        if now - shard["started_at"] > self.restart_max_delay:
+            shard["restart_delay"] = 1.0
+        else:
+            shard["restart_delay"] = min(self.restart_max_delay, shard["restart_delay"] * 2)
+        shard["restart_at"] = now + shard["restart_delay"]
+        print(f"Shard Worker {index} 종료됨 (exit {shard['process'].exitcode}), {shard['restart_delay']:.0f}초 후 재시작")
+        for item_id in list(shard["boards"]):
+            self.callback_error(item_id, "감시 프로세스 재시작 중")
+
+    def _restart_worker(self, index):
+        resume = {}
+        if self.state_store:
+            try:
+                resume = self.state_store.load_all()
+            except Exception as e:
+                print(f"State Store Error: {e}")
+        with self._lock:
+            shard = self.shards[index]
+            for item_id in shard["boards"]:
+                board = self.boards[item_id]
+                # 기준 글을 잡은 적이 없는 게시판은 처음처럼 시작한다.
+                board["resume_from"] = max(resume.get(item_id, 0), board["last_article_id"]) or None
+            # 이 프로세스에서 옮겨 가던 게시판은 응답을 기다리지 않고 바로 새 프로세스로 보낸다.
+            for item_id, board in self.boards.items():
+                if board["move_from"] == index:
+                    board["move_from"] = None
+                    board["resume_from"] = max(resume.get(item_id, 0), board["last_article_id"]) or None
+                    self._send_add(item_id)
+            shard["restarts"] += 1
+            self.restarts += 1
+            self._start_worker(index)
+
+    def rebalance(self):
+        # 게시판이 가장 많은 프로세스에서 가장 적은 프로세스로, 옮기면 차이가 줄어드는 카페 하나를 옮긴다.
+        with self._lock:
+            alive = [i for i, s in enumerate(self.shards) if s["process"] is not None and s["process"].is_alive()]
+            if len(alive) < 2 or any(b["move_from"] is not None for b in self.boards.values()):
+                return
+            loads = {i: len(self.shards[i]["boards"]) for i in alive}
+            src = max(alive, key=loads.get)
+            dst = min(alive, key=loads.get)
+            groups = {}
+            for item_id in self.shards[src]["boards"]:
+                groups.setdefault(self.boards[item_id]["cafe"], []).append(item_id)
+            movable = [ids for ids in groups.values() if loads[dst] + len(ids) < loads[src]]
+            if not movable:
+                return
+            for item_id in min(movable, key=len):
+                board = self.boards[item_id]
+                board["shard"] = dst
+                board["move_from"] = src
+                self.shards[src]["boards"].discard(item_id)
+                self.shards[dst]["boards"].add(item_id)
+                self._send(src, ("remove", item_id))
+                self.moved += 1
+
+# ==========================================
+# [감시 엔진]
+# config.json 항목 관리 + 스케줄러 + 이벤트 구독을 묶은 GUI 없는 핵심부.
+# Tk 창, 로컬 제어 API 모두 이 엔진의 클라이언트로 동작한다.
+# ==========================================
+def article_link(board_url, article_id):
+    board = parse_board_url(board_url)
+    if board is None:
+        return ""
+    return f"https://cafe.naver.com/ca-fe/cafes/{board['clubid']}/articles/{article_id}"
+
+
+def validate_board_url(url):
+    if not isinstance(url, str):
+        return "URL은 문자열이어야 합니다."
+    if not url:
+        return "URL을 입력해주세요."
+    if "cafe.naver.com" not in url or not url.startswith("http"):
+        return "유효하지 않은 링크입니다.\n네이버 카페 게시판 주소(cafe.naver.com)를 입력해주세요."
+    return None
+
+
+class MonitorEngine:
+    # 외부(API/GUI)에서 바꿀 수 있는 항목 키
+    EDITABLE_KEYS = {"name", "url", "interval", "interval_mode", "min_interval", "max_interval",
+                     "nickname_filter", "filters", "loop", "volume", "sound", "priority"}
+
+    def __init__(self, settings=None, items=None):
+        self.settings = settings if settings is not None else ConfigManager.load_settings()
+        self.items = ItemRegistry(items if items is not None else ConfigManager.load_config())
+
+        if self.settings["shard_workers"] > 0:
+            # 감시는 작업 프로세스들이 하므로 이 프로세스에서는 드라이버/연결 풀을 만들지 않는다.
+            self.driver_pool = self.http_pool = self.limiter = self.fetcher = None
+        else:
+            self.driver_pool, self.http_pool, self.limiter, self.fetcher = create_fetch_stack(self.settings)
+        self.metrics = PollMetrics()
+        self._metrics_stop = threading.Event()
+        self._metrics_thread = None
+        self.state_store = None
+        if self.settings["state_store"]:
+            self.state_store = StateStore(STATE_DB_PATH, self.settings["recent_posts_per_board"])
+        if self.settings["shard_workers"] > 0:
+            self.scheduler = ShardSupervisor(
+                self.settings,
+                self.settings["shard_workers"],
+                callback_init=self._on_init,
+                callback_found=self._on_found,
+                callback_error=self._on_error,
+                state_store=self.state_store,
+                metrics=self.metrics,
+                rebalance_interval=self.settings["shard_rebalance_interval"],
+            )
+        else:
+            self.scheduler = MonitorScheduler(
+                self.fetcher,
+                max_concurrency=self.settings["max_concurrent_fetches"],
+                request_budget_per_min=self.settings["request_budget_per_min"],
+                callback_init=self._on_init,
+                callback_found=self._on_found,
+                callback_error=self._on_error,
+                state_store=self.state_store,
+                catchup_max_pages=self.settings["catchup_max_pages"],
+                startup_concurrency=self.settings["startup_concurrency"],
+                startup_ramp=self.settings["startup_ramp"],
+                metrics=self.metrics,
+            )
+
+        self.config_writer = ConfigWriter(self.items.to_list, self.settings["config_save_debounce"])
+
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._started = False
+
+        self.notifier = NotifierHub(self.settings["notifiers"])
+        self.subscribe(self.notifier.publish)
+
+    # ---- 수명 주기 ----
+    def start(self):
+        resume = {}
+        if self.state_store:
+            self.state_store.retain(self.items.ids())
+            resume = self.state_store.load_all()
+        if (self.settings["driver_warmup"] and self.settings["fetch_backend"] == "selenium" and webdriver is not None and len(self.items)
+                and not self.settings["shard_workers"]):
+            self.driver_pool.warm_up()
+        for data in self.items:
+            self._schedule(data, resume.get(data['id']))
+        self.notifier.start()
+        self.scheduler.start()
+        if self.settings["metrics_dump_path"]:
+            self._metrics_thread = threading.Thread(target=self._dump_metrics_loop, name="MetricsDump", daemon=True)
+            self._metrics_thread.start()
+        self._started = True
+
+    def stop(self):
+        self.config_writer.flush()
+        self.scheduler.stop()
+        if self._metrics_thread:
+            self._metrics_stop.set()
+            self._metrics_thread.join(5)
+        self.notifier.stop()
+        if self.driver_pool:
+            self.driver_pool.shutdown()
+        if self.http_pool:
+            self.http_pool.close()
+        if self.state_store:
+            self.state_store.close()
+
+    def save(self):
+        self.config_writer.request_save()
+
+    # ---- 항목 관리 ----
+    def get_item(self, item_id):
+        return self.items.get(item_id)
+
+    def add_item(self, url, **options):
+        error = validate_board_url(url)
+        if error:
+            raise ValueError(error)
+
+        new_data = {
+            "id": str(uuid.uuid4()),
+            "name": f"항목 {len(self.items) + 1}",
+            "url": url,
+            "interval": 30,
+            "loop": True,
+            "volume": 70,
+            "nickname_filter": ""
+        }
+        options.pop("url", None)
+        new_data.update(self._check_changes(options))
+
+        self.items.add(new_data)
+        self.save()
+        self._schedule(new_data)
+        return new_data
+
+    def remove_item(self, item_id):
+        self.scheduler.remove_board(item_id)
+        self.items.remove(item_id)
+        self.save()
+        if self.state_store:
+            self.state_store.forget(item_id)
+
+    def update_item(self, item_id, **changes):
+        data = self.get_item(item_id)
+        if data is None:
+            return None
+
+        changes = self._check_changes(changes)
+        if "url" in changes:
+            error = validate_board_url(changes["url"])
+            if error:
+                raise ValueError(error)
+
+        data.update(changes)
+        self.save()
+
+        if "url" in changes:
+            # 다른 게시판이 되었으므로 최신글 기준부터 다시 잡는다.
+            self.scheduler.remove_board(item_id)
+            if self.state_store:
+                self.state_store.forget(item_id)
+            self._schedule(data)
+        else:
+            self.reschedule_item(item_id)
+        return data
+
+    def _check_changes(self, changes):
+        unknown = set(changes) - self.EDITABLE_KEYS
+        if unknown:
+            raise ValueError(f"변경할 수 없는 항목: {', '.join(sorted(unknown))}")
+        for key in ("interval", "min_interval", "max_interval", "volume"):
+            if key in changes:
+                value = changes[key]
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                    raise ValueError(f"{key} 값이 올바르지 않습니다")
+        if changes.get("interval_mode", "fixed") not in ("fixed", "adaptive"):
+            raise ValueError("interval_mode 는 fixed 또는 adaptive 여야 합니다")
+        if "interval" in changes and changes["interval"] < 1:
+            raise ValueError("interval 은 1초 이상이어야 합니다")
+        if "nickname_filter" in changes and not isinstance(changes["nickname_filter"], str):
+            raise ValueError("nickname_filter 는 문자열이어야 합니다")
+        if "priority" in changes and (isinstance(changes["priority"], bool) or not isinstance(changes["priority"], int)):
+            raise ValueError("priority 는 정수여야 합니다")
+        if "loop" in changes and not isinstance(changes["loop"], bool):
+            raise ValueError("loop 는 true 또는 false 여야 합니다")
+        if "sound" in changes and changes["sound"] is not None and not isinstance(changes["sound"], str):
+            raise ValueError("sound 는 파일 경로(문자열) 또는 null 이어야 합니다")
+        if "filters" in changes:
+            changes["filters"] = normalize_filters(changes["filters"])
+        return changes
+
+    def reschedule_item(self, item_id):
+        data = self.get_item(item_id)
+        if data is None:
+            return
+        self.scheduler.update_board(
+            item_id,
+            interval=data['interval'],
+            nickname_filter=data.get('nickname_filter', ""),
+            filters=data.get('filters'),
+            **self.interval_options(data)
+        )
+
+    def interval_options(self, data):
+        return {
+            "interval_mode": data.get('interval_mode', "fixed"),
+            "min_interval": data.get('min_interval', self.settings["adaptive_min_interval"]),
+            "max_interval": data.get('max_interval', self.settings["adaptive_max_interval"]),
+        }
+
+    def _schedule(self, data, resume_from=None):
+        self.scheduler.add_board(
+            data['id'],
+            data['url'],
+            data['interval'],
+            data.get('nickname_filter', ""),
+            resume_from=resume_from,
+            filters=data.get('filters'),
+            **self.interval_options(data)
+        )
+
+    # ---- 이벤트 ----
+    def subscribe(self, callback):
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def _emit(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Event Subscriber Error: {e}")
+
+    def _on_init(self, item_id, last_id):
+        self._emit({"type": "init", "item_id": item_id, "last_article_id": last_id, "time": time.time()})
+
+    def _on_found(self, item_id, row):
+        data = self.get_item(item_id)
+        self._emit({
+            "type": "post",
+            "item_id": item_id,
+            "name": data.get("name", "") if data else "",
+            "link": article_link(data.get("url", "") if data else "", row.article_id),
+            "article_id": row.article_id,
+            "writer": row.writer,
+            "title": row.title,
+            "time": time.time(),
+        })
+
+    def _on_error(self, item_id, error_msg):
+        self._emit({"type": "error", "item_id": item_id, "error": error_msg, "time": time.time()})
+
+    # ---- 계측 ----
+    def metrics_snapshot(self):
+        snapshot = self.metrics.snapshot()
+        snapshot["time"] = time.time()
+        snapshot["stats"] = self.stats()
+        snapshot["boards"] = {d['id']: dict(self.metrics.board_snapshot(d['id']) or {}, name=d.get('name', ""))
+                              for d in self.items}
+        return snapshot
+
+    def metrics_text(self):
+        stats = self.stats()
+        scheduler = stats["scheduler"]
+        driver_pool = stats["driver_pool"]
+        notifier = stats["notifier"]
+        limiter = stats["limiter"]
+        gauges = [
+            ("ncafe_boards", "gauge", "감시 중인 게시판 수", scheduler["boards"]),
+            ("ncafe_polls_in_flight", "gauge", "진행 중인 폴링 수", scheduler["in_flight"]),
+            ("ncafe_polls_total", "counter", "폴링 수", scheduler["polls"]),
+            ("ncafe_poll_errors_total", "counter", "조회 오류 수", scheduler["errors"]),
+            ("ncafe_poll_limited_total", "counter", "요청 제한으로 미룬 폴링 수", scheduler["limited"]),
+            ("ncafe_poll_unchanged_total", "counter", "변경 없음(304/같은 목록) 폴링 수", scheduler["unchanged"]),
+            ("ncafe_scheduler_lag_max_seconds", "gauge", "예약 시각보다 늦게 시작한 최대 시간", scheduler["lag_max"]),
+            ("ncafe_driver_pool_in_use", "gauge", "사용 중인 크롬 드라이버 수", driver_pool["in_use"]),
+            ("ncafe_driver_pool_created", "gauge", "띄워 둔 크롬 드라이버 수", driver_pool["created"]),
+            ("ncafe_driver_recycled_total", "counter", "다시 띄운 크롬 드라이버 수", driver_pool["recycled"]),
+            ("ncafe_driver_recycled_rss_total", "counter", "메모리 기준을 넘어 다시 띄운 크롬 드라이버 수", driver_pool["recycled_rss"]),
+            ("ncafe_driver_recycled_age_total", "counter", "사용 기한이 지나 다시 띄운 크롬 드라이버 수", driver_pool["recycled_age"]),
+            ("ncafe_driver_pool_rss_bytes", "gauge", "마지막으로 잰 크롬 드라이버 메모리 합", driver_pool["rss"]),
+            ("ncafe_notifier_dropped_total", "counter", "알림 전달 대기열에서 버린 이벤트 수", sum(c["dropped"] for c in notifier.values())),
+            ("ncafe_limiter_blocked_total", "counter", "차단 응답 수", limiter.get("blocked")),
+            ("ncafe_limiter_paused_cafes", "gauge", "일시 중지된 카페 수", limiter.get("paused_cafes")),
+            ("ncafe_shard_workers_alive", "gauge", "살아 있는 분할 감시 작업 프로세스 수", scheduler.get("workers_alive")),
+            ("ncafe_shard_worker_restarts_total", "counter", "다시 띄운 작업 프로세스 수", scheduler.get("worker_restarts")),
+        ]
+        board_names = {d['id']: d.get('name', "") for d in self.items}
+        return self.metrics.prometheus(board_names, gauges)
+
+    def dump_metrics(self, path=None):
+        path = path or self.settings["metrics_dump_path"]
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.metrics_snapshot(), f, ensure_ascii=False, indent=2, default=str)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Metrics Dump Error: {e}")
+
+    def _dump_metrics_loop(self):
+        while not self._metrics_stop.wait(max(1, self.settings["metrics_dump_interval"])):
+            self.dump_metrics()
+        self.dump_metrics()
+
+    def profile_item(self, item_id):
+        # 다음 폴링 한 번을 cProfile 로 기록한다. 저장될 .prof 경로를 돌려준다.
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        path = os.path.join(PROFILE_DIR, f"poll-{item_id}-{time.strftime('%Y%m%d-%H%M%S')}.prof")
+        return path if self.scheduler.profile_next_poll(item_id, path) else None
+
+    def last_error(self, item_id):
+        return self.metrics.last_error(item_id)
+
+    def stats(self):
+        if isinstance(self.scheduler, ShardSupervisor):
+            workers = self.scheduler.worker_stats()
+            return {
+                "scheduler": self.scheduler.stats(),
+                "http_pool": workers["http_pool"],
+                "driver_pool": workers["driver_pool"],
+                "config_writer": self.config_writer.stats(),
+                "fetcher": workers["fetcher"],
+                "notifier": self.notifier.stats(),
+                "limiter": workers["limiter"] if self.settings["rate_limit"] else {},
+            }
+        return {
+            "scheduler": self.scheduler.stats(),
+            "http_pool": self.http_pool.stats(),
+            "driver_pool": self.driver_pool.stats(),
+            "config_writer": self.config_writer.stats(),
+            "fetcher": self.fetcher.stats() if hasattr(self.fetcher, "stats") else {},
+            "notifier": self.notifier.stats(),
+            "limiter": self.limiter.stats() if self.limiter else {},
+        }
+
+# ==========================================
+# [로컬 제어 API]
+# 127.0.0.1 에서만 열리는 작은 HTTP API. 항목 추가/삭제/변경과 감지 이벤트 스트림을 제공한다.
+#   GET    /boards            항목 목록
+#   POST   /boards            {"url": ..., "name": ..., "interval": ...}
+#   GET    /boards/<id>       항목 하나 (+ 감시 상태)
+#   PATCH  /boards/<id>       변경할 값만 전달
+#   DELETE /boards/<id>
+#   GET    /events            감지 이벤트를 한 줄에 하나씩 JSON 으로 계속 전달
+#   GET    /stats
+#   GET    /metrics           Prometheus 텍스트 형식 계측 값
+#   POST   /boards/<id>/profile   다음 폴링 한 번을 cProfile 로 기록
+# ==========================================
+class ControlRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def engine(self):
+        return self.server.engine
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        payload = json.loads(self.rfile.read(length).decode("utf-8"))
+        if not isinstance(payload, dict):
+            raise ValueError("JSON 객체가 필요합니다")
+        return payload
+
+    def _route(self):
+        parts = [p for p in urlsplit(self.path).path.split("/") if p]
+        if not parts:
+            return None, None, None
+        return parts[0], (parts[1] if len(parts) > 1 else None), (parts[2] if len(parts) > 2 else None)
+
+    def _board_view(self, data):
+        view = dict(data)
+        view["state"] = self.engine.scheduler.board_stats(data['id'])
+        if self.engine.state_store:
+            view["recent_posts"] = self.engine.state_store.recent_posts(data['id'])
+        return view
+
+    def do_GET(self):
+        resource, item_id, action = self._route()
+        if resource == "boards" and item_id is None:
+            self._send_json(200, [self._board_view(d) for d in self.engine.items])
+        elif resource == "boards":
+            data = self.engine.get_item(item_id)
+            if data is None:
+                self._send_json(404, {"error": "not found"})
+            else:
+                self._send_json(200, self._board_view(data))
+        elif resource == "stats":
+            self._send_json(200, self.engine.stats())
+        elif resource == "metrics":
+            body = self.engine.metrics_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif resource == "events":
+            self._stream_events()
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        resource, item_id, action = self._route()
+        if resource == "boards" and action == "profile":
+            path = self.engine.profile_item(item_id)
+            if path is None:
+                self._send_json(404, {"error": "not found"})
+            else:
+                self._send_json(202, {"profile": path})
+            return
+        if resource != "boards" or item_id is not None:
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            payload = self._read_json()
+            url = payload.pop("url", "")
+            if not isinstance(url, str):
+                raise ValueError("url 은 문자열이어야 합니다")
+            data = self.engine.add_item(url.strip(), **payload)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        self._send_json(201, data)
+
+    def do_PATCH(self):
+        resource, item_id, action = self._route()
+        if resource != "boards" or item_id is None:
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            data = self.engine.update_item(item_id, **self._read_json())
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        if data is None:
+            self._send_json(404, {"error": "not found"})
+        else:
+            self._send_json(200, data)
+
+    def do_DELETE(self):
+        resource, item_id, action = self._route()
+        if resource != "boards" or item_id is None or self.engine.get_item(item_id) is None:
+            self._send_json(404, {"error": "not found"})
+            return
+        self.engine.remove_item(item_id)
+        self._send_json(200, {"deleted": item_id})
+
+    def _stream_events(self):
+        # 구독자마다 제한된 큐를 두어, 느린 클라이언트가 감시를 막지 않게 한다.
+        events = queue.Queue(maxsize=1000)
+
+        def on_event(event):
+            try:
+                events.put_nowait(event)
+            except queue.Full:
+                pass
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        self.engine.subscribe(on_event)
+        try:
+            while not self.server.closing:
+                try:
+                    event = events.get(timeout=15)
+                except queue.Empty:
+                    event = {"type": "ping", "time": time.time()}
+                self.wfile.write(json.dumps(event, ensure_ascii=False).encode("utf-8") + b"\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.engine.unsubscribe(on_event)
+
+
+class ControlServer:
+    def __init__(self, engine, host="127.0.0.1", port=8765):
+        self.httpd = ThreadingHTTPServer((host, port), ControlRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.engine = engine
+        self.httpd.closing = False
+        self._thread = None
+
+    @property
+    def address(self):
+        return self.httpd.server_address
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="ControlServer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.httpd.closing = True
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def run_daemon(port=None):
+    engine = MonitorEngine()
+    settings = engine.settings
+    server = ControlServer(engine, settings["control_host"], settings["control_port"] if port is None else port)
+
+    def print_event(event):
+        if event["type"] == "post":
+            print(f"[새 글] {event['name']} #{event['article_id']} {event['writer']} - {event['title']}", flush=True)
+        elif event["type"] == "error":
+            print(f"[오류] {event['item_id']}: {event['error']}", flush=True)
+
+    engine.subscribe(print_event)
+    engine.start()
+    server.start()
+    host, bound_port = server.address
+    print(f"감시 엔진 실행 중: 항목 {len(engine.items)}개, 제어 API http://{host}:{bound_port}", flush=True)
+
+    stop_event = threading.Event()
+    try:
+        signal.signal(signal.SIGTERM, lambda *args: stop_event.set())
+    except ValueError:
+        pass
+    try:
+        while not stop_event.is_set():
+            stop_event.wait(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        engine.stop()
+
+# ==========================================
+# [알람 엔진]
+# 항목마다 미리 불러온 소리를 별도 믹서 채널에서 재생한다.
+# 500ms 마다 재생 상태를 확인하지 않고, 1회 재생은 소리 길이만큼 뒤에 종료 콜백을 받는다.
+# 반복 재생은 채널 자체 반복(loops=-1)을 사용한다.
+# ==========================================
+class NullAlarmBackend:
+    # 소리를 내지 않는 백엔드 (헤드리스 실행/테스트용). 재생 요청은 기록만 한다.
+    name = "null"
+
+    def __init__(self, default_length=3.0):
+        self.default_length = default_length
+        self.played = []
+        self._next_handle = 0
+
+    def preload(self, path):
+        return True
+
+    def length(self, path):
+        return self.default_length
+
+    def play(self, path, volume, loop):
+        self._next_handle += 1
+        self.played.append((path, volume, loop))
+        return self._next_handle
+
+    def stop(self, handle):
+        pass
+
+    def set_volume(self, handle, volume):
+        pass
+
+    def close(self):
+        pass
+
+
+class PygameAlarmBackend:
+    name = "pygame"
+
+    def __init__(self, channels=8):
+        pygame.mixer.init()
+        pygame.mixer.set_num_channels(channels)
+        self._sounds = {}
+
+    def preload(self, path):
+        if path in self._sounds:
+            return self._sounds[path] is not None
+
+        sound = None
+        if os.path.exists(path):
+            try:
+                sound = pygame.mixer.Sound(path)
+            except Exception as e:
+                print(f"Audio Error: {e}")
+        else:
+            print(f"File Not Found: {path}")
+        self._sounds[path] = sound
+        return sound is not None
+
+    def length(self, path):
+        sound = self._sounds.get(path)
+        return sound.get_length() if sound else 0.0
+
+    def play(self, path, volume, loop):
+        if not self.preload(path):
+            return None
+        channel = pygame.mixer.find_channel()
+        if channel is None:
+            return None
+        channel.set_volume(volume)
+        channel.play(self._sounds[path], loops=-1 if loop else 0)
+        return channel
+
+    def stop(self, handle):
+        if handle is not None:
+            handle.stop()
+
+    def set_volume(self, handle, volume):
+        if handle is not None:
+            handle.set_volume(volume)
+
+    def close(self):
+        pygame.mixer.quit()
+
+
+def create_alarm_backend(settings):
+    if settings["alarm_backend"] == "pygame" and pygame is not None:
+        try:
+            return PygameAlarmBackend(settings["alarm_channels"])
+        except Exception as e:
+            print(f"Audio Error: {e}")
+    return NullAlarmBackend()
+
+
+def threading_call_later(delay, callback):
+    timer = threading.Timer(delay, callback)
+    timer.daemon = True
+    timer.start()
+
+
+class AlarmEngine:
+    # 채널 수보다 많은 알람이 동시에 울리면, 우선순위가 더 높은 알람이 가장 낮은 알람을 밀어내고
+    # 나머지는 대기열에서 기다렸다가 채널이 비면 재생된다.
+    def __init__(self, backend, call_later=threading_call_later, max_channels=8, on_finished=None):
+        self.backend = backend
+        self.call_later = call_later
+        self.max_channels = max(1, max_channels)
+        self.on_finished = on_finished or (lambda item_id: None)
+
+        self.playing = {}
+        self._waiting = []
+        self._requests = {}
+        self._seq = 0
+        self._lock = threading.RLock()
+
+    def preload(self, path):
+        return self.backend.preload(path)
+
+    def is_active(self, item_id):
+        with self._lock:
+            return item_id in self.playing or item_id in self._requests
+
+    def play(self, item_id, path, volume, loop, priority=0):
+        with self._lock:
+            if self.is_active(item_id):
+                return
+            request = {"path": path, "volume": volume, "loop": loop, "priority": priority}
+            if len(self.playing) < self.max_channels:
+                self._start(item_id, request)
+                return
+
+            lowest_id = min(self.playing, key=lambda i: self.playing[i]["request"]["priority"])
+            if priority > self.playing[lowest_id]["request"]["priority"]:
+                preempted = self.playing.pop(lowest_id)
+                self.backend.stop(preempted["handle"])
+                self._enqueue(lowest_id, preempted["request"])
+                self._start(item_id, request)
+            else:
+                self._enqueue(item_id, request)
+
+    def stop(self, item_id):
+        with self._lock:
+            entry = self.playing.pop(item_id, None)
+            if entry:
+                self.backend.stop(entry["handle"])
+            self._requests.pop(item_id, None)
+            self._drain()
+
+    def stop_all(self):
+        with self._lock:
+            for entry in self.playing.values():
+                self.backend.stop(entry["handle"])
+            self.playing.clear()
+            self._requests.clear()
+            self._waiting.clear()
+
+    def set_volume(self, item_id, volume):
+        with self._lock:
+            entry = self.playing.get(item_id)
+            if entry:
+                entry["request"]["volume"] = volume
+                self.backend.set_volume(entry["handle"], volume)
+            elif item_id in self._requests:
+                self._requests[item_id]["volume"] = volume
+
+    def stats(self):
+        with self._lock:
+            return {"backend": self.backend.name, "playing": len(self.playing), "waiting": len(self._requests)}
+
+    def close(self):
+        self.stop_all()
+        self.backend.close()
+
+    def _enqueue(self, item_id, request):
+        self._seq += 1
+        request["seq"] = self._seq
+        self._requests[item_id] = request
+        heapq.heappush(self._waiting, (-request["priority"], self._seq, item_id))
+
+    def _start(self, item_id, request):
+        self._seq += 1
+        token = self._seq
+        handle = self.backend.play(request["path"], request["volume"], request["loop"])
+        self.playing[item_id] = {"handle": handle, "request": request, "token": token}
+        if not request["loop"]:
+            self.call_later(self.backend.length(request["path"]), lambda: self._on_end(item_id, token))
+
+    def _on_end(self, item_id, token):
+        with self._lock:
+            entry = self.playing.get(item_id)
+            if entry is None or entry["token"] != token:
+                return
+            del self.playing[item_id]
+            self._drain()
+        self.on_finished(item_id)
+
+    def _drain(self):
+        while self._waiting and len(self.playing) < self.max_channels:
+            _, seq, item_id = heapq.heappop(self._waiting)
+            request = self._requests.get(item_id)
+            if request is None or request["seq"] != seq:
+                continue
+            del self._requests[item_id]
+            self._start(item_id, request)
+
+# ==========================================
+# [화면 갱신 묶음]
+# 감시 스레드의 이벤트를 프레임 단위로 모아 GUI 에 넘긴다. (tkinter 없이도 쓸 수 있도록 root.after 만 사용)
+# ==========================================
+class UiEventBatcher:
+    # 감시 스레드에서 오는 이벤트를 모았다가 화면 갱신 한 번(프레임당)으로 처리한다.
+    def __init__(self, root, handler, frame_ms=16):
+        self.root = root
+        self.handler = handler
+        self.frame_ms = frame_ms
+        self._events = []
+        self._lock = threading.Lock()
+        self._scheduled = False
+
+    def push(self, event):
+        with self._lock:
+            self._events.append(event)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self.root.after(self.frame_ms, self._flush)
+
+    def _flush(self):
+        with self._lock:
+            events, self._events = self._events, []
+            self._scheduled = False
+        self.handler(events)
+
+if __name__ == "__main__":
+    # 실행 파일(PyInstaller)로 분할 감시 작업 프로세스를 띄울 때 필요
+    multiprocessing.freeze_support()
+    parser = argparse.ArgumentParser(description="네이버 카페 멀티 알리미")
+    parser.add_argument("--daemon", action="store_true", help="GUI 없이 감시 엔진과 로컬 제어 API만 실행")
+    parser.add_argument("--port", type=int, default=None, help="제어 API 포트 (기본: settings.json 의 control_port)")
+    args = parser.parse_args()
+
+    if args.daemon:
+        run_daemon(args.port)
+    else:
+        # GUI 는 여기서 불러온다. (tkinter 가 없는 서버에서도 --daemon 은 실행되도록)
+        try:
+            from nCafePostAlarm_gui import run_gui
+        except ImportError as e:
+            print(f"GUI 를 불러올 수 없습니다 ({e}). tkinter 가 없는 환경에서는 --daemon 으로 실행하세요.")
+            sys.exit(1)
+        run_gui()
\ No newline at end of file
@@ -0,0 +1,610 @@
+# ==========================================
+# 네이버 카페 멀티 알리미 GUI (tkinter)
+# 감시 엔진은 nCafePostAlarm.py 에 있고, 이 모듈은 GUI 로 실행할 때만 불러온다.
+# tkinter 가 없는 서버에서도 --daemon 은 그대로 동작한다.
+# ==========================================
+import tkinter as tk
+from tkinter import ttk, messagebox, simpledialog, filedialog
+import re
+import time
+
+from nCafePostAlarm import (
+    ALARM_FILE_PATH, AlarmEngine, ControlServer, MonitorEngine, UiEventBatcher,
+    create_alarm_backend, normalize_filters, validate_board_url,
+)
+
+# ==========================================
+# [GUI 항목 위젯 클래스]
+# ==========================================
+class MonitorItemWidget(tk.Frame):
+    # 가상 리스트의 한 줄. 스크롤할 때 다른 항목에 다시 연결(bind_item)되어 재사용된다.
+    def __init__(self, parent, app_logic):
+        super().__init__(parent, bg="white", highlightbackground="black", highlightthickness=1, pady=5)
+        self.app_logic = app_logic
+        self.data = None
+        self.item_id = None
+        self._binding = False
+        self._is_alarm = False
+
+        self.columnconfigure(1, weight=1)
+
+        # 1. 항목 이름
+        self.name_var = tk.StringVar(value="")
+        self.lbl_name = tk.Label(self, textvariable=self.name_var, font=("맑은 고딕", 10, "bold"), bg="white", width=15, anchor="w")
+        self.lbl_name.grid(row=0, column=0, padx=10, sticky="w")
+        self.lbl_name.bind("<Button-1>", self.enable_edit_name)
+
+        self.ent_name = tk.Entry(self, textvariable=self.name_var, font=("맑은 고딕", 10), width=15)
+        self.ent_name.bind("<Return>", self.save_name)
+        self.ent_name.bind("<FocusOut>", self.save_name)
+
+        # 2. 상태 메시지
+        self.status_var = tk.StringVar(value="초기화 중...")
+        self.lbl_status = tk.Label(self, textvariable=self.status_var, font=("맑은 고딕", 9), bg="white", anchor="w")
+        self.lbl_status.grid(row=0, column=1, padx=5, sticky="ew")
+
+        # 3. 우측 컨트롤
+        ctrl_frame = tk.Frame(self, bg="white")
+        ctrl_frame.grid(row=0, column=2, padx=5)
+
+        self.btn_stop = tk.Button(ctrl_frame, text="알림끄기", font=("맑은 고딕", 8, "bold"),
+                                  bg="#dddddd", fg="black", state="disabled", command=self.stop_alarm)
+        self.btn_stop.pack(side="left", padx=5)
+
+        tk.Label(ctrl_frame, text="볼륨", bg="white", font=("맑은 고딕", 8)).pack(side="left")
+        self.scale_vol = ttk.Scale(ctrl_frame, from_=0, to=100, orient="horizontal", length=80, command=self.update_volume)
+        self.scale_vol.pack(side="left", padx=5)
+
+        # 4. 우클릭 메뉴
+        self.context_menu = tk.Menu(self, tearoff=0)
+
+        self.menu_interval = tk.Menu(self.context_menu, tearoff=0)
+        # 값 0 은 "자동 조절" (적응형 주기)
+        self.interval_var = tk.IntVar(value=30)
+        for sec in [10, 30, 60, 300, 600]:
+            self.menu_interval.add_radiobutton(label=f"{sec}초", variable=self.interval_var, value=sec, command=self.update_interval)
+        self.menu_interval.add_separator()
+        self.menu_interval.add_radiobutton(label="자동 조절", variable=self.interval_var, value=0, command=self.update_interval)
+        self.menu_interval.add_command(label="자동 조절 범위...", command=self.edit_adaptive_bounds)
+        self.context_menu.add_cascade(label="감시 주기 설정", menu=self.menu_interval)
+
+        self.menu_loop = tk.Menu(self.context_menu, tearoff=0)
+        self.loop_var = tk.BooleanVar(value=True)
+        self.menu_loop.add_radiobutton(label="무한 반복", variable=self.loop_var, value=True, command=self.update_loop)
+        self.menu_loop.add_radiobutton(label="1회 반복", variable=self.loop_var, value=False, command=self.update_loop)
+        self.context_menu.add_cascade(label="알람 반복 설정", menu=self.menu_loop)
+
+        self.menu_priority = tk.Menu(self.context_menu, tearoff=0)
+        self.priority_var = tk.IntVar(value=0)
+        for label, value in [("높음", 1), ("보통", 0), ("낮음", -1)]:
+            self.menu_priority.add_radiobutton(label=label, variable=self.priority_var, value=value, command=self.update_priority)
+        self.context_menu.add_cascade(label="알람 우선순위", menu=self.menu_priority)
+        self.context_menu.add_command(label="알람 소리 선택...", command=self.choose_sound)
+        self.context_menu.add_command(label="글 필터 설정...", command=self.edit_filters)
+        self.context_menu.add_command(label="마지막 오류 보기", command=self.show_error)
+        self.context_menu.add_command(label="다음 폴링 프로파일링", command=self.profile_poll)
+
+        self.context_menu.add_separator()
+        self.context_menu.add_command(label="항목 삭제", command=self.delete_item, foreground="red")
+
+        self.bind("<Button-3>", self.show_context_menu)
+        self.lbl_name.bind("<Button-3>", self.show_context_menu)
+        self.lbl_status.bind("<Button-3>", self.show_context_menu)
+        # 상태 줄에는 오류가 줄여서 보이므로, 더블클릭하면 전체 문구를 보여준다.
+        self.lbl_status.bind("<Double-Button-1>", self.show_error)
+
+    def bind_item(self, data, status_text, is_alarm):
+        if self.data is not data:
+            if self.ent_name.winfo_ismapped():
+                self.save_name()
+            self.data = data
+            self.item_id = data['id']
+
+        # 값을 채우는 동안에는 슬라이더 콜백이 저장을 일으키지 않도록 막는다.
+        self._binding = True
+        try:
+            if not self.ent_name.winfo_ismapped():
+                self.name_var.set(data.get("name", "항목"))
+            self.scale_vol.set(data.get("volume", 70))
+            self.interval_var.set(0 if data.get("interval_mode") == "adaptive" else data.get("interval", 30))
+            self.loop_var.set(data.get("loop", True))
+            self.priority_var.set(data.get("priority", 0))
+        finally:
+            self._binding = False
+        self.set_status(status_text, is_alarm)
+
+    def enable_edit_name(self, event):
+        self.lbl_name.grid_remove()
+        self.ent_name.grid(row=0, column=0, padx=10, sticky="w")
+        self.ent_name.focus_set()
+
+    def save_name(self, event=None):
+        new_name = self.name_var.get()
+        self.ent_name.grid_remove()
+        self.lbl_name.grid()
+        self.data['name'] = new_name
+        self.app_logic.save_data()
+
+    def update_volume(self, val):
+        if self._binding or self.data is None: return
+        self.data['volume'] = float(val)
+        self.app_logic.update_alarm_volume(self.item_id, self.data['volume'])
+        self.app_logic.save_data()
+
+    def update_interval(self):
+        value = self.interval_var.get()
+        if value == 0:
+            self.data['interval_mode'] = "adaptive"
+        else:
+            self.data['interval_mode'] = "fixed"
+            self.data['interval'] = value
+        self.app_logic.save_data()
+        self.app_logic.restart_thread(self.item_id)
+
+    def edit_adaptive_bounds(self):
+        options = self.app_logic.interval_options(self.data)
+        min_val = simpledialog.askinteger("자동 조절 범위", "최소 주기(초)", parent=self,
+                                          initialvalue=options['min_interval'], minvalue=5, maxvalue=3600)
+        if min_val is None: return
+        max_val = simpledialog.askinteger("자동 조절 범위", "최대 주기(초)", parent=self,
+                                          initialvalue=max(min_val, options['max_interval']), minvalue=min_val, maxvalue=86400)
+        if max_val is None: return
+
+        self.data['min_interval'] = min_val
+        self.data['max_interval'] = max_val
+        self.app_logic.save_data()
+        self.app_logic.restart_thread(self.item_id)
+
+    def update_loop(self):
+        self.data['loop'] = self.loop_var.get()
+        self.app_logic.save_data()
+
+    def update_priority(self):
+        self.data['priority'] = self.priority_var.get()
+        self.app_logic.save_data()
+
+    def choose_sound(self):
+        path = filedialog.askopenfilename(parent=self, title="알람 소리 선택",
+                                          filetypes=[("소리 파일", "*.mp3 *.wav *.ogg"), ("모든 파일", "*.*")])
+        if not path: return
+        self.data['sound'] = path
+        self.app_logic.alarms.preload(path)
+        self.app_logic.save_data()
+
+    def edit_filters(self):
+        FilterDialog(self, self.app_logic, self.item_id)
+
+    def show_error(self, event=None):
+        if self.data is None: return
+        self.app_logic.show_item_error(self.item_id)
+
+    def profile_poll(self):
+        if self.data is None: return
+        self.app_logic.profile_item(self.item_id)
+
+    def show_context_menu(self, event):
+        self.context_menu.post(event.x_root, event.y_root)
+
+    def delete_item(self):
+        if messagebox.askyesno("삭제", f"'{self.name_var.get()}' 항목을 삭제하시겠습니까?"):
+            self.app_logic.remove_item(self.item_id)
+
+    def stop_alarm(self):
+        self.app_logic.stop_alarm(self.item_id)
+
+    def set_status(self, text, is_alarm=False):
+        if self.status_var.get() == text and self._is_alarm == is_alarm:
+            return
+        self._is_alarm = is_alarm
+        self.status_var.set(text)
+        if is_alarm:
+            self.lbl_status.config(fg="red", font=("맑은 고딕", 9, "bold"))
+            self.config(highlightbackground="red", highlightthickness=2)
+            self.btn_stop.config(state="normal", bg="#ffcccc", fg="red")
+        else:
+            self.lbl_status.config(fg="black", font=("맑은 고딕", 9))
+            self.config(highlightbackground="black", highlightthickness=1)
+            self.btn_stop.config(state="disabled", bg="#dddddd", fg="black")
+
+class FilterDialog(tk.Toplevel):
+    # 게시판별 포함/제외 규칙 편집 창. 한 줄에 규칙 하나.
+    FIELDS = [
+        ("작성자", "include_writers", "exclude_writers"),
+        ("제목 키워드", "include_keywords", "exclude_keywords"),
+        ("제목 정규식", "include_regex", "exclude_regex"),
+    ]
+
+    def __init__(self, parent, app_logic, item_id):
+        super().__init__(parent)
+        self.app_logic = app_logic
+        self.item_id = item_id
+        data = app_logic.engine.get_item(item_id)
+        self.title(f"글 필터 - {data.get('name', '항목')}")
+        self.transient(parent.winfo_toplevel())
+
+        try:
+            filters = normalize_filters(data.get('filters'), data.get('nickname_filter', ""))
+        except (re.error, ValueError) as e:
+            # config.json 을 직접 고치다 잘못된 규칙이 들어간 경우: 알리고, 고칠 수 있도록 읽히는 값만 채워 연다.
+            messagebox.showerror("필터 오류", f"저장된 필터에 문제가 있습니다.\n{e}", parent=self)
+            raw = data.get('filters') if isinstance(data.get('filters'), dict) else {}
+            filters = {key: [str(v) for v in values] for key, values in raw.items() if isinstance(values, list)}
+        self.texts = {}
+
+        tk.Label(self, text="포함 (하나 이상 맞아야 알림)").grid(row=0, column=1, padx=5, pady=(10, 2))
+        tk.Label(self, text="제외 (하나라도 맞으면 무시)").grid(row=0, column=2, padx=5, pady=(10, 2))
+        for row, (label, include_key, exclude_key) in enumerate(self.FIELDS, start=1):
+            tk.Label(self, text=label).grid(row=row, column=0, padx=(10, 5), sticky="ne")
+            for column, key in ((1, include_key), (2, exclude_key)):
+                text = tk.Text(self, width=24, height=5, font=("맑은 고딕", 9))
+                text.insert("1.0", "\n".join(filters.get(key, [])))
+                text.grid(row=row, column=column, padx=5, pady=3)
+                self.texts[key] = text
+
+        tk.Label(self, text="한 줄에 하나씩 입력합니다. 작성자/키워드는 일부만 같아도 맞는 것으로 봅니다.",
+                 fg="gray").grid(row=4, column=0, columnspan=3, padx=10, pady=(5, 0))
+        btn_frame = tk.Frame(self)
+        btn_frame.grid(row=5, column=0, columnspan=3, pady=10)
+        tk.Button(btn_frame, text="저장", width=8, command=self.save).pack(side="left", padx=5)
+        tk.Button(btn_frame, text="취소", width=8, command=self.destroy).pack(side="left", padx=5)
+
+    def save(self):
+        filters = {key: text.get("1.0", tk.END).splitlines() for key, text in self.texts.items()}
+        if self.app_logic.update_filters(self.item_id, filters):
+            self.destroy()
+
+# ==========================================
+# [가상 리스트]
+# 항목이 수백 개여도 화면에 보이는 줄 수만큼만 위젯을 만들고, 스크롤하면 재사용한다.
+# ==========================================
+class VirtualItemList(tk.Frame):
+    ROW_HEIGHT = 44
+
+    def __init__(self, parent, app_logic):
+        super().__init__(parent, bg="white")
+        self.app_logic = app_logic
+        self.item_ids = []
+        self.offset = 0
+        self.rows = []
+
+        self.viewport = tk.Frame(self, bg="white")
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.viewport.bind("<Configure>", lambda e: self.refresh())
+        self._bind_wheel(self.viewport)
+
+    def set_items(self, item_ids):
+        self.item_ids = list(item_ids)
+        self.refresh()
+
+    def refresh(self):
+        height = max(1, self.viewport.winfo_height())
+        total = len(self.item_ids) * self.ROW_HEIGHT
+        self.offset = max(0, min(self.offset, total - height))
+
+        first = self.offset // self.ROW_HEIGHT
+        visible = height // self.ROW_HEIGHT + 2
+        while len(self.rows) < visible:
+            row = MonitorItemWidget(self.viewport, self.app_logic)
+            self._bind_wheel(row)
+            self.rows.append(row)
+
+        for i, row in enumerate(self.rows):
+            index = first + i
+            if i < visible and index < len(self.item_ids):
+                item_id = self.item_ids[index]
+                data = self.app_logic.items.get(item_id)
+                text, is_alarm = self.app_logic.item_status.get(item_id, ("초기화 중...", False))
+                row.bind_item(data, text, is_alarm)
+                row.place(x=2, y=index * self.ROW_HEIGHT - self.offset + 2, relwidth=1, width=-4, height=self.ROW_HEIGHT - 4)
+            else:
+                row.place_forget()
+
+        if total <= height:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + height) / total)
+
+    def refresh_item(self, item_id):
+        for row in self.rows:
+            if row.item_id == item_id and row.winfo_ismapped():
+                text, is_alarm = self.app_logic.item_status.get(item_id, ("초기화 중...", False))
+                row.bind_item(self.app_logic.items.get(item_id), text, is_alarm)
+
+    def yview(self, *args):
+        height = max(1, self.viewport.winfo_height())
+        total = len(self.item_ids) * self.ROW_HEIGHT
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = height if args[2] == "pages" else self.ROW_HEIGHT
+            self.offset += int(args[1]) * step
+        self.refresh()
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", lambda e: self.yview("scroll", -1, "units"))
+        widget.bind("<Button-5>", lambda e: self.yview("scroll", 1, "units"))
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+    def _on_wheel(self, event):
+        self.yview("scroll", -1 if event.delta > 0 else 1, "units")
+
+
+# ==========================================
+# [메인 애플리케이션 로직]
+# ==========================================
+class AppLogic:
+    def __init__(self, root, engine):
+        self.root = root
+        self.root.title("네이버 카페 멀티 알리미")
+        self.root.geometry("650x500")
+
+        self.engine = engine
+        self.items = engine.items
+        self.settings = engine.settings
+        self.scheduler = engine.scheduler
+        self.control_server = None
+        self.item_status = {}
+        self.active_alarms = set()
+        self.ui_events = UiEventBatcher(root, self.handle_engine_events)
+
+        self.alarms = AlarmEngine(
+            create_alarm_backend(self.settings),
+            call_later=lambda delay, callback: self.root.after(int(delay * 1000), callback),
+            max_channels=self.settings["alarm_channels"],
+            on_finished=self.on_alarm_finished,
+        )
+        self.setup_ui()
+        self.restore_items()
+        self.engine.subscribe(self.on_engine_event)
+        self.engine.start()
+        if self.settings["control_api_in_gui"]:
+            self.control_server = ControlServer(engine, self.settings["control_host"], self.settings["control_port"])
+            self.control_server.start()
+
+    def setup_ui(self):
+        # 상단 프레임
+        top_frame = tk.Frame(self.root, pady=10, padx=10, bg="#f0f0f0")
+        top_frame.pack(fill="x")
+
+        # 1. URL 입력 라벨
+        tk.Label(top_frame, text="게시판 링크 :", bg="#f0f0f0", font=("맑은 고딕", 10, "bold")).pack(side="left")
+
+        # 2. URL 입력창
+        self.entry_url = tk.Entry(top_frame, font=("맑은 고딕", 10))
+        self.entry_url.pack(side="left", fill="x", expand=True, padx=10)
+        self.entry_url.bind("<Return>", lambda event: self.add_new_item())
+
+        # 3. 입력 버튼
+        btn_add = tk.Button(top_frame, text="입력 버튼", command=self.add_new_item, bg="#4a90e2", fg="white", font=("맑은 고딕", 9, "bold"))
+        btn_add.pack(side="left")
+
+        # [NEW] 4. 사용법 버튼 (우측 정렬을 위해 side=right)
+        btn_guide = tk.Button(top_frame, text="사용법", command=self.show_guide, bg="#9b59b6", fg="white", font=("맑은 고딕", 9, "bold"))
+        btn_guide.pack(side="right", padx=(10, 0))
+
+        # 메인 리스트 컨테이너
+        list_container = tk.Frame(self.root)
+        list_container.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self.item_list = VirtualItemList(list_container, self)
+        self.item_list.pack(fill="both", expand=True)
+
+        # 하단 상태 표시줄 (브라우저 풀 사용량)
+        self.stats_var = tk.StringVar(value="")
+        tk.Label(self.root, textvariable=self.stats_var, font=("맑은 고딕", 8), anchor="w", fg="#555555").pack(fill="x", side="bottom", padx=10)
+        self.refresh_stats()
+
+    def refresh_stats(self):
+        stats = self.engine.stats()
+        pool = stats["driver_pool"]
+        http_stats = stats["http_pool"]
+        sched = stats["scheduler"]
+        combined = stats["fetcher"].get("served_combined")
+        limiter = stats["limiter"]
+        limit_text = ""
+        if limiter:
+            limit_text = (f" | 요청 제한: 대기 {limiter['delayed']} / 미룸 {limiter['deferred']} / 차단 감지 {limiter['blocked']}"
+                          + (f" / 일시 중지 카페 {limiter['paused_cafes']}" if limiter['paused_cafes'] else ""))
+        self.stats_var.set(
+            f"폴링: 변경 없음 {sched['unchanged']} / 파싱 {sched['parsed']} | "
+            f"HTTP 요청 {http_stats['requests']}회 (연결 재사용 {http_stats['reused']}"
+            + (f", 카페 묶음 {combined}" if combined else "") + ") | "
+            f"브라우저 풀: 사용 {pool['in_use']}/{pool['size']} | "
+            f"대기 평균 {pool['wait_avg']:.1f}초 (최대 {pool['wait_max']:.1f}초) | 재시작 {pool['recycled']}회"
+            + (f" (메모리 {pool['rss'] / 1048576:.0f}MB)" if pool['rss'] else "")
+            + limit_text
+        )
+        self.root.after(2000, self.refresh_stats)
+
+    # [NEW] 사용법 안내 팝업
+    def show_guide(self):
+        guide_win = tk.Toplevel(self.root)
+        guide_win.title("프로그램 사용법")
+        guide_win.geometry("550x450")
+
+        guide_text = """
+[ 단계별 사용 가이드 ]
+
+1. 게시판 추가
+   - 네이버 카페의 '특정 게시판' URL을 복사합니다.
+   - 상단 입력창에 붙여넣고 [입력 버튼]을 누르세요.
+   - 올바른 링크라면 리스트에 '항목'이 추가됩니다.
+
+2. 이름 변경
+   - 리스트에 추가된 '항목 1', '항목 2' 등의 이름을 클릭하세요.
+   - 입력창으로 바뀌면 원하는 이름(예: 팬아트 게시판)을 입력하고 엔터를 누르세요.
+
+3. 세부 설정 (우클릭 메뉴)
+   - 항목 위에서 [마우스 오른쪽 버튼]을 클릭하세요.
+   - 감시 주기: 10초 ~ 600초 사이로 설정 가능 (기본 30초)
+   - 자동 조절: 글이 많은 게시판은 자주, 조용한 게시판은 드물게 확인
+   - 알람 반복: '무한 반복' 또는 '1회 재생' 선택 가능
+   - 글 필터: 작성자/제목 키워드/제목 정규식으로 알림 받을 글을 포함·제외
+   - 항목 삭제: 더 이상 감시하지 않는 항목을 삭제
+
+4. 알람 제어
+   - 새 글이 감지되면 항목이 빨간색으로 변하고 알람이 울립니다.
+   - [알림끄기] 버튼을 누르면 소리가 멈추고 다시 감시 상태로 돌아갑니다.
+   - 각 항목의 볼륨 슬라이더로 소리 크기를 개별 조절할 수 있습니다.
+   - 여러 항목의 알람은 각자 다른 채널에서 동시에 울립니다.
+   - 우클릭 메뉴에서 항목별 알람 소리와 우선순위를 정할 수 있습니다.
+
+5. 주의 사항
+   - 프로그램 실행 파일과 같은 폴더에 'alarm.mp3' 파일이 있어야 합니다.
+   - 크롬은 항목 수와 관계없이 settings.json 의 driver_pool_size 개수만큼만 실행됩니다.
+   - 항목이 많을수록 각 항목의 감시 간격이 실제로는 조금씩 늦어질 수 있습니다.
+        """
+
+        lbl_guide = tk.Label(guide_win, text=guide_text, justify="left", font=("맑은 고딕", 10), padx=20, pady=20)
+        lbl_guide.pack(fill="both", expand=True)
+
+        btn_close = tk.Button(guide_win, text="닫기", command=guide_win.destroy, width=10)
+        btn_close.pack(pady=10)
+
+    def add_new_item(self):
+        url = self.entry_url.get().strip()
+        if not url:
+            messagebox.showwarning("입력 오류", "URL을 입력해주세요.")
+            return
+
+        error = validate_board_url(url)
+        if error:
+            messagebox.showerror("입력 오류", error)
+            return
+
+        new_data = self.engine.add_item(url)
+        self.alarms.preload(self.sound_path(new_data))
+        self.item_list.set_items(self.items.ids())
+        self.entry_url.delete(0, tk.END)
+
+    def restore_items(self):
+        for data in self.items:
+            self.alarms.preload(self.sound_path(data))
+        self.item_list.set_items(self.items.ids())
+
+    def set_item_status(self, item_id, text, is_alarm=False, refresh=True):
+        if item_id not in self.items:
+            return
+        self.item_status[item_id] = (text, is_alarm)
+        if refresh:
+            self.item_list.refresh_item(item_id)
+
+    def sound_path(self, data):
+        return data.get('sound') or ALARM_FILE_PATH
+
+    def remove_item(self, item_id):
+        self.engine.remove_item(item_id)
+        self.item_status.pop(item_id, None)
+        self.item_list.set_items(self.items.ids())
+
+        if item_id in self.active_alarms:
+            self.active_alarms.remove(item_id)
+        self.alarms.stop(item_id)
+
+    def save_data(self):
+        self.engine.save()
+
+    def update_filters(self, item_id, filters):
+        # 예전 작성자 필터(nickname_filter)는 filters 로 옮겨 저장한다.
+        try:
+            self.engine.update_item(item_id, filters=filters, nickname_filter="")
+        except ValueError as e:
+            messagebox.showerror("필터 오류", str(e))
+            return False
+        return True
+
+    def show_item_error(self, item_id):
+        error, error_at = self.engine.last_error(item_id)
+        if error is None:
+            messagebox.showinfo("마지막 오류", "기록된 오류가 없습니다.")
+            return
+        when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(error_at))
+        messagebox.showinfo("마지막 오류", f"{when}\n\n{error}")
+
+    def profile_item(self, item_id):
+        path = self.engine.profile_item(item_id)
+        if path:
+            messagebox.showinfo("프로파일링", f"다음 폴링 한 번을 기록합니다.\n{path}\n(요약: {path}.txt)")
+
+    def interval_options(self, data):
+        return self.engine.interval_options(data)
+
+    def restart_thread(self, item_id):
+        # 드라이버/스레드를 새로 만들지 않고 스케줄만 다시 잡는다.
+        self.engine.reschedule_item(item_id)
+        data = self.engine.get_item(item_id)
+        if data:
+            if data.get('interval_mode') == "adaptive":
+                self.set_item_status(item_id, "감시중... (주기: 자동 조절)")
+            else:
+                self.set_item_status(item_id, f"감시중... (주기: {data['interval']}초)")
+
+    def on_engine_event(self, event):
+        # 엔진(스케줄러 스레드)에서 오는 이벤트는 모아서 프레임마다 한 번에 반영한다.
+        self.ui_events.push(event)
+
+    def handle_engine_events(self, events):
+        for event in events:
+            item_id = event["item_id"]
+            if event["type"] == "init":
+                self._handle_init(item_id, event["last_article_id"])
+            elif event["type"] == "post":
+                self._handle_alarm(item_id, event["article_id"])
+            elif event["type"] == "error":
+                self._handle_error(item_id, event["error"])
+        self.item_list.refresh()
+
+    def _handle_init(self, item_id, last_id):
+        self.set_item_status(item_id, f"감시중... (최신글: {last_id})", is_alarm=False, refresh=False)
+
+    def _handle_alarm(self, item_id, post_id):
+        if item_id in self.items:
+            msg = f"새 글 감지됨! (ID: {post_id})"
+            self.set_item_status(item_id, msg, is_alarm=True, refresh=False)
+            self.active_alarms.add(item_id)
+            self.play_alarm(item_id)
+
+    def _handle_error(self, item_id, msg):
+        short_msg = (msg[:30] + '..') if len(msg) > 30 else msg
+        self.set_item_status(item_id, f"오류: {short_msg}", is_alarm=False, refresh=False)
+
+    def play_alarm(self, trigger_item_id):
+        data = self.items.get(trigger_item_id)
+        if data:
+            self.alarms.play(trigger_item_id, self.sound_path(data), data['volume'] / 100.0,
+                             data['loop'], data.get('priority', 0))
+
+    def update_alarm_volume(self, item_id, volume):
+        self.alarms.set_volume(item_id, volume / 100.0)
+
+    def on_alarm_finished(self, item_id):
+        # 1회 재생이 끝난 알람. 화면 표시는 [알림끄기]를 누를 때까지 유지한다.
+        self.active_alarms.discard(item_id)
+
+    def stop_alarm(self, item_id):
+        if item_id in self.active_alarms:
+            self.active_alarms.remove(item_id)
+
+        current_last_id = self.scheduler.get_last_article_id(item_id)
+        self.set_item_status(item_id, f"감시중... (최신글: {current_last_id})", is_alarm=False)
+
+        self.alarms.stop(item_id)
+
+    def on_close(self):
+        if self.control_server:
+            self.control_server.stop()
+        self.engine.stop()
+        self.alarms.close()
+        self.root.destroy()
+
+
+def run_gui():
+    root = tk.Tk()
+    app = AppLogic(root, MonitorEngine())
+    root.protocol("WM_DELETE_WINDOW", app.on_close)
+    root.mainloop()
@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import AdaptiveInterval, MonitorScheduler
+
+
+class AdaptiveIntervalTest(unittest.TestCase):
+    def test_quiet_board_backs_off_to_max(self):
+        adaptive = AdaptiveInterval(10, 60, initial=10, backoff=2)
+        self.assertEqual(adaptive.observe(0, 10), 20)
+        self.assertEqual(adaptive.observe(0, 20), 40)
+        self.assertEqual(adaptive.observe(0, 40), 60)
+        self.assertEqual(adaptive.observe(0, 60), 60)
+
+    def test_burst_tightens_immediately(self):
+        adaptive = AdaptiveInterval(10, 600, initial=300)
+        adaptive.observe(0, 300)
+        # 30초 동안 새 글 3개 -> 초당 0.1개, 목표 1개이면 10초
+        self.assertEqual(adaptive.observe(3, 30), 10)
+
+    def test_clamped_to_bounds(self):
+        adaptive = AdaptiveInterval(10, 600, initial=5)
+        self.assertEqual(adaptive.interval, 10)
+        self.assertEqual(adaptive.observe(100, 1), 10)
+        self.assertEqual(AdaptiveInterval(0, 5).min_interval, 1)
+
+
+class RequestBudgetTest(unittest.TestCase):
+    def test_budget_stretches_all_intervals(self):
+        # 분당 6회 예산에 10초 주기 게시판 2개(분당 12회) -> 주기 2배
+        scheduler = MonitorScheduler(None, request_budget_per_min=6)
+        scheduler.add_board("a", "url", 10)
+        scheduler.add_board("b", "url", 10)
+        self.assertAlmostEqual(scheduler.stats()["budget_factor"], 2.0)
+        self.assertAlmostEqual(scheduler.get_current_interval("a"), 20.0)
+
+        scheduler.remove_board("b")
+        self.assertAlmostEqual(scheduler.stats()["budget_factor"], 1.0)
+        self.assertAlmostEqual(scheduler.get_current_interval("a"), 10.0)
+
+    def test_no_budget(self):
+        scheduler = MonitorScheduler(None)
+        scheduler.add_board("a", "url", 1)
+        self.assertEqual(scheduler.stats()["budget_factor"], 1.0)
+
+
+class UpdateBoardTest(unittest.TestCase):
+    def test_unchanged_interval_keeps_learned_rate(self):
+        scheduler = MonitorScheduler(None)
+        board = scheduler.add_board("a", "url", 10, interval_mode="adaptive", min_interval=10, max_interval=600)
+        board.adaptive.observe(0, 10)
+        learned = board.adaptive
+        scheduler.update_board("a", interval=10, nickname_filter="새 필터", interval_mode="adaptive", min_interval=10, max_interval=600)
+        self.assertIs(board.adaptive, learned)
+        self.assertEqual(board.nickname_filter, "새 필터")
+
+        scheduler.update_board("a", max_interval=300)
+        self.assertIsNot(board.adaptive, learned)
+        self.assertEqual(board.adaptive.max_interval, 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import AlarmEngine, NullAlarmBackend
+
+
+class RecordingBackend(NullAlarmBackend):
+    # 채널(핸들)별 정지/볼륨 변경을 기록한다.
+    def __init__(self, default_length=3.0):
+        super().__init__(default_length)
+        self.stopped = []
+        self.volumes = []
+
+    def stop(self, handle):
+        self.stopped.append(handle)
+
+    def set_volume(self, handle, volume):
+        self.volumes.append((handle, volume))
+
+
+class ManualClock:
+    # call_later 로 예약된 콜백을 테스트가 직접 실행한다.
+    def __init__(self):
+        self.pending = []
+
+    def call_later(self, delay, callback):
+        self.pending.append((delay, callback))
+
+    def fire_all(self):
+        pending, self.pending = self.pending, []
+        for _, callback in pending:
+            callback()
+
+
+class AlarmEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = RecordingBackend(default_length=2.5)
+        self.clock = ManualClock()
+        self.finished = []
+
+    def engine(self, max_channels=8):
+        return AlarmEngine(self.backend, call_later=self.clock.call_later,
+                           max_channels=max_channels, on_finished=self.finished.append)
+
+    def test_each_alarm_gets_its_own_channel(self):
+        engine = self.engine()
+        engine.play("a", "a.mp3", 0.5, loop=True)
+        engine.play("b", "b.mp3", 0.8, loop=True)
+        self.assertEqual(self.backend.played, [("a.mp3", 0.5, True), ("b.mp3", 0.8, True)])
+        self.assertNotEqual(engine.playing["a"]["handle"], engine.playing["b"]["handle"])
+
+        # 이미 울리는 항목은 다시 재생하지 않는다.
+        engine.play("a", "a.mp3", 0.5, loop=True)
+        self.assertEqual(len(self.backend.played), 2)
+
+    def test_stop_one_channel(self):
+        engine = self.engine()
+        engine.play("a", "a.mp3", 0.5, loop=True)
+        engine.play("b", "b.mp3", 0.5, loop=True)
+        handle = engine.playing["a"]["handle"]
+        engine.stop("a")
+        self.assertEqual(self.backend.stopped, [handle])
+        self.assertFalse(engine.is_active("a"))
+        self.assertTrue(engine.is_active("b"))
+
+    def test_loop_has_no_end_callback(self):
+        engine = self.engine()
+        engine.play("a", "a.mp3", 0.5, loop=True)
+        self.assertEqual(self.clock.pending, [])
+
+    def test_one_shot_ends_after_sound_length(self):
+        engine = self.engine()
+        engine.play("a", "a.mp3", 0.5, loop=False)
+        self.assertEqual([delay for delay, _ in self.clock.pending], [2.5])
+        self.clock.fire_all()
+        self.assertFalse(engine.is_active("a"))
+        self.assertEqual(self.finished, ["a"])
+
+    def test_stale_end_callback_is_ignored(self):
+        # 멈춘 뒤 다시 울린 알람은 이전 재생의 종료 콜백으로 꺼지지 않는다.
+        engine = self.engine()
+        engine.play("a", "a.mp3", 0.5, loop=False)
+        engine.stop("a")
+        engine.play("a", "a.mp3", 0.5, loop=False)
+        self.clock.pending[0][1]()
+        self.assertTrue(engine.is_active("a"))
+        self.assertEqual(self.finished, [])
+
+    def test_volume_applies_to_playing_channel(self):
+        engine = self.engine()
+        engine.play("a", "a.mp3", 0.5, loop=True)
+        engine.set_volume("a", 0.2)
+        self.assertEqual(self.backend.volumes, [(engine.playing["a"]["handle"], 0.2)])
+
+    def test_waiting_alarm_starts_when_channel_frees(self):
+        engine = self.engine(max_channels=1)
+        engine.play("a", "a.mp3", 0.5, loop=True)
+        engine.play("b", "b.mp3", 0.5, loop=True)
+        self.assertEqual(engine.stats()["waiting"], 1)
+        self.assertTrue(engine.is_active("b"))
+
+        engine.set_volume("b", 0.9)
+        engine.stop("a")
+        self.assertIn("b", engine.playing)
+        self.assertEqual(self.backend.played[-1], ("b.mp3", 0.9, True))
+
+    def test_higher_priority_preempts_lowest(self):
+        engine = self.engine(max_channels=2)
+        engine.play("low", "a.mp3", 0.5, loop=True, priority=-1)
+        engine.play("mid", "a.mp3", 0.5, loop=True, priority=0)
+        engine.play("high", "a.mp3", 0.5, loop=True, priority=1)
+        self.assertEqual(set(engine.playing), {"mid", "high"})
+        self.assertTrue(engine.is_active("low"))
+
+        engine.stop("mid")
+        self.assertEqual(set(engine.playing), {"high", "low"})
+
+    def test_stop_all(self):
+        engine = self.engine(max_channels=1)
+        engine.play("a", "a.mp3", 0.5, loop=True)
+        engine.play("b", "b.mp3", 0.5, loop=False)
+        engine.stop_all()
+        self.assertEqual(engine.stats(), {"backend": "null", "playing": 0, "waiting": 0})
+        self.assertFalse(engine.is_active("a"))
+        self.assertFalse(engine.is_active("b"))
+        self.assertEqual(len(self.backend.stopped), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import CafeAggregateFetchBackend, FetchError, PostRow
+
+
+def board_url(menuid):
+    return f"https://cafe.naver.com/ArticleList.nhn?search.clubid=1&search.menuid={menuid}"
+
+
+class FakeCafe:
+    # 카페 전체 목록은 최신 per_page 개만, 게시판별 목록은 그 게시판의 글만 돌려준다.
+    name = "fake"
+
+    def __init__(self, per_page=5):
+        self.per_page = per_page
+        self.posts = []
+        self.board_requests = 0
+        self.combined_requests = 0
+        self.combined_error = None
+
+    def post(self, menuid):
+        article_id = 100 + len(self.posts)
+        self.posts.append((menuid, PostRow(article_id, "w", f"t{article_id}")))
+        return article_id
+
+    def fetch_cafe_entries(self, clubid, state=None):
+        self.combined_requests += 1
+        if self.combined_error is not None:
+            raise self.combined_error
+        return list(reversed(self.posts))[:self.per_page]
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        self.board_requests += 1
+        menuid = url.rsplit("=", 1)[1]
+        return [row for m, row in reversed(self.posts) if m == menuid and (min_id is None or row.article_id > min_id)]
+
+
+class CafeAggregateFetchBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.cafe = FakeCafe(per_page=20)
+        self.last = {"1": self.cafe.post("1"), "2": self.cafe.post("2")}
+
+    def poll(self, backend, menuid):
+        rows = backend.fetch_rows(board_url(menuid), {}, self.last[menuid])
+        if rows:
+            self.last[menuid] = rows[0].article_id
+        return rows
+
+    def test_single_board_is_fetched_directly(self):
+        backend = CafeAggregateFetchBackend(self.cafe, self.cafe, ttl=60)
+        self.poll(backend, "1")
+        self.poll(backend, "1")
+        self.assertEqual(self.cafe.combined_requests, 0)
+        self.assertEqual(self.cafe.board_requests, 2)
+
+    def test_listing_is_split_by_menu(self):
+        backend = CafeAggregateFetchBackend(self.cafe, self.cafe, ttl=0, verify_every=1000)
+        self.poll(backend, "1")
+        self.poll(backend, "2")
+        requests = self.cafe.board_requests
+
+        new_1 = self.cafe.post("1")
+        new_2 = self.cafe.post("2")
+        self.assertEqual([r.article_id for r in self.poll(backend, "1")], [new_1])
+        self.assertEqual([r.article_id for r in self.poll(backend, "2")], [new_2])
+        self.assertEqual(self.cafe.board_requests, requests)
+        self.assertEqual(backend.stats()["served_combined"], 3)
+
+    def test_listing_is_shared_within_ttl(self):
+        backend = CafeAggregateFetchBackend(self.cafe, self.cafe, ttl=60, verify_every=1000)
+        self.poll(backend, "1")
+        self.poll(backend, "2")
+        self.cafe.post("1")
+        # TTL 안에서는 다른 게시판이 받아 둔 목록을 다시 쓴다.
+        self.assertIsNone(self.poll(backend, "1"))
+        self.assertEqual(self.cafe.combined_requests, 1)
+
+    def test_baseline_and_catch_up_use_board_requests(self):
+        backend = CafeAggregateFetchBackend(self.cafe, self.cafe, ttl=0)
+        self.poll(backend, "1")
+        self.poll(backend, "2")
+        backend.fetch_rows(board_url("1"), {}, None)
+        backend.fetch_rows(board_url("1"), None, None, 2)
+        self.assertEqual(self.cafe.board_requests, 3)
+
+    def test_verify_every_checks_board_directly(self):
+        backend = CafeAggregateFetchBackend(self.cafe, self.cafe, ttl=0, verify_every=3)
+        self.poll(backend, "1")
+        self.poll(backend, "2")
+        requests = self.cafe.board_requests
+        self.poll(backend, "1")
+        self.poll(backend, "1")
+        self.assertEqual(self.cafe.board_requests, requests + 1)
+
+    def test_rejected_listing_disables_aggregation(self):
+        self.cafe.combined_error = FetchError("HTTP 403")
+        backend = CafeAggregateFetchBackend(self.cafe, self.cafe, ttl=0, verify_every=1000)
+        self.poll(backend, "1")
+        self.poll(backend, "2")
+        new_id = self.cafe.post("2")
+        self.assertEqual([r.article_id for r in self.poll(backend, "2")], [new_id])
+        self.poll(backend, "1")
+        self.assertEqual(self.cafe.combined_requests, 1)
+
+
+class CafeAggregateCoverageTest(unittest.TestCase):
+    def test_quiet_board_is_served_from_window_in_busy_cafe(self):
+        cafe = FakeCafe()
+        quiet_last = cafe.post("2")
+        for _ in range(10):
+            cafe.post("1")
+        backend = CafeAggregateFetchBackend(cafe, cafe, ttl=0, verify_every=1000)
+        states = {"1": {}, "2": {}}
+        last = {"1": backend.fetch_rows(board_url("1"), states["1"])[0].article_id, "2": quiet_last}
+        backend.fetch_rows(board_url("2"), states["2"])
+
+        for _ in range(6):
+            for menuid in ("1", "2"):
+                rows = backend.fetch_rows(board_url(menuid), states[menuid], last[menuid])
+                if rows:
+                    last[menuid] = rows[0].article_id
+            cafe.post("1")
+            cafe.post("1")
+        requests = cafe.board_requests
+
+        # 조용한 게시판의 마지막 글은 전체 목록(최신 5개) 밖이지만, 창이 이어져 있으므로 따로 요청하지 않는다.
+        for _ in range(3):
+            for menuid in ("1", "2"):
+                rows = backend.fetch_rows(board_url(menuid), states[menuid], last[menuid])
+                if rows:
+                    last[menuid] = rows[0].article_id
+            cafe.post("1")
+        self.assertEqual(cafe.board_requests, requests)
+
+        new_id = cafe.post("2")
+        rows = backend.fetch_rows(board_url("2"), states["2"], last["2"])
+        self.assertEqual([r.article_id for r in rows], [new_id])
+
+    def test_gap_between_listings_falls_back_to_board_request(self):
+        cafe = FakeCafe()
+        cafe.post("2")
+        for _ in range(3):
+            cafe.post("1")
+        backend = CafeAggregateFetchBackend(cafe, cafe, ttl=0, verify_every=1000)
+        states = {"1": {}, "2": {}}
+        last = {menuid: backend.fetch_rows(board_url(menuid), states[menuid])[0].article_id for menuid in ("1", "2")}
+        for menuid in ("1", "2"):
+            backend.fetch_rows(board_url(menuid), states[menuid], last[menuid])
+
+        # 다음 목록까지 한 페이지(5개)보다 많이 올라오면 창이 끊기므로 게시판별로 확인해야 한다.
+        hidden = cafe.post("2")
+        for _ in range(6):
+            cafe.post("1")
+        requests = cafe.board_requests
+        rows = backend.fetch_rows(board_url("2"), states["2"], last["2"])
+        self.assertEqual([r.article_id for r in rows], [hidden])
+        self.assertEqual(cafe.board_requests, requests + 1)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nCafePostAlarm
+from nCafePostAlarm import ConfigManager, ConfigWriter
+
+
+class ConfigFileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self._config_path = nCafePostAlarm.CONFIG_FILE_PATH
+        nCafePostAlarm.CONFIG_FILE_PATH = os.path.join(self.tmpdir, "config.json")
+
+    def tearDown(self):
+        nCafePostAlarm.CONFIG_FILE_PATH = self._config_path
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+
+class SaveConfigTest(ConfigFileTest):
+    def test_round_trip(self):
+        ConfigManager.save_config([{"id": "a", "name": "게시판"}])
+        self.assertEqual(ConfigManager.load_config(), [{"id": "a", "name": "게시판"}])
+        self.assertEqual(os.listdir(self.tmpdir), ["config.json"])
+
+    def test_failed_write_keeps_old_file(self):
+        ConfigManager.save_config([{"id": "a"}])
+        with mock.patch("nCafePostAlarm.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                ConfigManager.save_config([{"id": "b"}])
+        self.assertEqual(ConfigManager.load_config(), [{"id": "a"}])
+
+    def test_corrupt_file_is_moved_aside(self):
+        with open(nCafePostAlarm.CONFIG_FILE_PATH, "w", encoding="utf-8") as f:
+            f.write("{broken")
+        self.assertEqual(ConfigManager.load_config(), [])
+        names = os.listdir(self.tmpdir)
+        self.assertNotIn("config.json", names)
+        self.assertTrue(any(name.startswith("config.json.corrupt-") for name in names))
+
+    def test_locked_file_is_retried_not_moved(self):
+        ConfigManager.save_config([{"id": "a"}])
+        real_open = open
+        failures = []
+
+        def flaky_open(path, *args, **kwargs):
+            # 처음 한 번은 다른 프로그램이 잠근 것처럼 실패한다.
+            if path == nCafePostAlarm.CONFIG_FILE_PATH and not failures:
+                failures.append(path)
+                raise PermissionError("locked")
+            return real_open(path, *args, **kwargs)
+
+        with mock.patch("builtins.open", side_effect=flaky_open):
+            self.assertEqual(ConfigManager.load_config(retry_delay=0), [{"id": "a"}])
+        self.assertEqual(os.listdir(self.tmpdir), ["config.json"])
+
+    def test_unreadable_file_raises_and_stays(self):
+        ConfigManager.save_config([{"id": "a"}])
+        with mock.patch("builtins.open", side_effect=PermissionError("denied")):
+            with self.assertRaises(PermissionError):
+                ConfigManager.load_config(retries=2, retry_delay=0)
+        self.assertEqual(os.listdir(self.tmpdir), ["config.json"])
+
+
+class ConfigWriterTest(ConfigFileTest):
+    def test_burst_is_written_once(self):
+        items = []
+        writer = ConfigWriter(lambda: items, debounce=0.2)
+        for volume in range(10):
+            items[:] = [{"id": "a", "volume": volume}]
+            writer.request_save()
+        self.assertFalse(os.path.exists(nCafePostAlarm.CONFIG_FILE_PATH))
+
+        time.sleep(0.5)
+        self.assertEqual(ConfigManager.load_config(), [{"id": "a", "volume": 9}])
+        self.assertEqual(writer.stats(), {"requested": 10, "written": 1, "failed": 0, "coalesced": 9})
+
+    def test_flush_writes_pending_changes(self):
+        writer = ConfigWriter(lambda: [{"id": "a"}], debounce=60)
+        writer.request_save()
+        writer.flush()
+        self.assertEqual(ConfigManager.load_config(), [{"id": "a"}])
+        writer.flush()
+        self.assertEqual(writer.stats()["written"], 1)
+
+    def test_writes_off_calling_thread(self):
+        threads = []
+
+        def get_data():
+            threads.append(threading.current_thread())
+            return []
+
+        writer = ConfigWriter(get_data, debounce=0.05)
+        writer.request_save()
+        time.sleep(0.3)
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import http.client
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nCafePostAlarm
+from nCafePostAlarm import DEFAULT_SETTINGS, ControlServer, MonitorEngine
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BOARD_URL = "https://cafe.naver.com/f-e/cafes/10050146/menus/12"
+
+
+class ControlApiTest(unittest.TestCase):
+    # 엔진은 시작하지 않는다. (폴링 없이 항목 관리와 API 만 확인)
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self._paths = (nCafePostAlarm.CONFIG_FILE_PATH, nCafePostAlarm.STATE_DB_PATH)
+        nCafePostAlarm.CONFIG_FILE_PATH = os.path.join(self.tmpdir, "config.json")
+        nCafePostAlarm.STATE_DB_PATH = os.path.join(self.tmpdir, "state.db")
+
+        self.engine = MonitorEngine(settings=dict(DEFAULT_SETTINGS), items=[])
+        self.server = ControlServer(self.engine, port=0)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.engine.stop()
+        nCafePostAlarm.CONFIG_FILE_PATH, nCafePostAlarm.STATE_DB_PATH = self._paths
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def request(self, method, path, payload=None):
+        host, port = self.server.address
+        conn = http.client.HTTPConnection(host, port, timeout=5)
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body else {}
+        conn.request(method, path, body=body, headers=headers)
+        resp = conn.getresponse()
+        data = json.loads(resp.read().decode("utf-8"))
+        conn.close()
+        return resp.status, data
+
+    def test_board_lifecycle(self):
+        status, created = self.request("POST", "/boards", {"url": BOARD_URL, "name": "공지", "interval": 20})
+        self.assertEqual(status, 201)
+        self.assertEqual(created["name"], "공지")
+        item_id = created["id"]
+
+        status, boards = self.request("GET", "/boards")
+        self.assertEqual(status, 200)
+        self.assertEqual([b["id"] for b in boards], [item_id])
+
+        status, updated = self.request("PATCH", f"/boards/{item_id}", {"interval": 45, "nickname_filter": "운영자"})
+        self.assertEqual(status, 200)
+        self.assertEqual(updated["interval"], 45)
+        self.assertEqual(self.engine.scheduler.boards[item_id].nickname_filter, "운영자")
+
+        status, view = self.request("GET", f"/boards/{item_id}")
+        self.assertEqual(status, 200)
+        self.assertIsNotNone(view["state"])
+
+        status, _ = self.request("DELETE", f"/boards/{item_id}")
+        self.assertEqual(status, 200)
+        self.assertEqual(len(self.engine.items), 0)
+        self.assertNotIn(item_id, self.engine.scheduler.boards)
+
+        self.engine.config_writer.flush()
+        with open(nCafePostAlarm.CONFIG_FILE_PATH, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), [])
+
+    def test_bad_input_is_rejected(self):
+        self.assertEqual(self.request("POST", "/boards", {"url": "https://example.com"})[0], 400)
+        self.assertEqual(self.request("POST", "/boards", {"url": BOARD_URL, "interval": 0})[0], 400)
+        self.assertEqual(self.request("POST", "/boards", {"url": BOARD_URL, "owner": "x"})[0], 400)
+        self.assertEqual(self.request("POST", "/boards", {"url": 12})[0], 400)
+
+        _, created = self.request("POST", "/boards", {"url": BOARD_URL})
+        self.assertEqual(self.request("PATCH", f"/boards/{created['id']}", {"volume": "loud"})[0], 400)
+        self.assertEqual(self.request("PATCH", f"/boards/{created['id']}", {"url": [BOARD_URL]})[0], 400)
+        self.assertEqual(self.request("PATCH", f"/boards/{created['id']}", {"priority": "high"})[0], 400)
+        self.assertEqual(self.request("PATCH", f"/boards/{created['id']}", {"priority": True})[0], 400)
+        self.assertEqual(self.request("PATCH", f"/boards/{created['id']}", {"loop": "yes"})[0], 400)
+        self.assertEqual(self.request("PATCH", f"/boards/{created['id']}", {"sound": 3})[0], 400)
+        status, updated = self.request("PATCH", f"/boards/{created['id']}", {"priority": 2, "loop": False, "sound": None})
+        self.assertEqual(status, 200)
+        self.assertEqual((updated["priority"], updated["loop"]), (2, False))
+        self.assertEqual(self.request("PATCH", f"/boards/{created['id']}", {"interval_mode": "fast"})[0], 400)
+        self.assertEqual(self.request("PATCH", f"/boards/{created['id']}", {"filters": {"include_regex": ["("]}})[0], 400)
+        self.assertEqual(self.request("PATCH", "/boards/unknown", {"interval": 10})[0], 404)
+        self.assertEqual(self.request("DELETE", "/boards/unknown")[0], 404)
+
+    def test_stats(self):
+        status, stats = self.request("GET", "/stats")
+        self.assertEqual(status, 200)
+        self.assertIn("scheduler", stats)
+
+    def test_metrics_text(self):
+        host, port = self.server.address
+        conn = http.client.HTTPConnection(host, port, timeout=5)
+        conn.request("GET", "/metrics")
+        resp = conn.getresponse()
+        text = resp.read().decode("utf-8")
+        conn.close()
+        self.assertEqual(resp.status, 200)
+        self.assertTrue(resp.getheader("Content-Type").startswith("text/plain; version=0.0.4"))
+        self.assertIn("# TYPE ncafe_poll_phase_seconds histogram", text)
+        self.assertIn("ncafe_boards 0", text)
+
+
+class WithoutTkinterTest(unittest.TestCase):
+    def test_engine_imports_without_tkinter(self):
+        # tkinter 를 막아도 엔진(데몬 모드)은 불러올 수 있고, GUI 모듈만 ImportError 가 난다.
+        code = ("import sys; sys.modules['tkinter'] = None\n"
+                "import nCafePostAlarm\n"
+                "try:\n"
+                "    import nCafePostAlarm_gui\n"
+                "except ImportError:\n"
+                "    print('no gui')\n")
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "no gui")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import DriverPool, webdriver
+
+
+class FakeDriver:
+    def __init__(self, number):
+        self.number = number
+        self.alive = True
+        self.quit_called = False
+        self.rss = 100 * 1024 * 1024
+
+    def execute_script(self, script, *args):
+        if not self.alive:
+            raise RuntimeError("chrome not reachable")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeDriverPool(DriverPool):
+    # 크롬 대신 FakeDriver 를 띄운다.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.launched = []
+        self.measured = 0
+
+    def _create_driver(self):
+        driver = FakeDriver(len(self.launched) + 1)
+        self.launched.append(driver)
+        with self._lock:
+            self._drivers[driver] = {"born": time.time(), "rss": None, "checked": 0.0}
+        return driver
+
+    def driver_usage(self, driver):
+        # psutil 대신 FakeDriver.rss 를 잰 값으로 쓴다.
+        self.measured += 1
+        with self._lock:
+            self._drivers[driver].update(rss=driver.rss, checked=time.time())
+        return driver.rss, 0.0
+
+    def age(self, driver, seconds):
+        self._drivers[driver]["born"] -= seconds
+
+    def wait_warmup(self):
+        if self._warmup_thread is not None:
+            self._warmup_thread.join(5)
+
+
+class DriverPoolTest(unittest.TestCase):
+    def test_idle_driver_is_reused(self):
+        pool = FakeDriverPool(2)
+        with pool.lease() as first:
+            pass
+        with pool.lease() as second:
+            self.assertEqual(pool.stats()["in_use"], 1)
+        self.assertIs(first, second)
+        self.assertEqual(len(pool.launched), 1)
+        self.assertEqual(pool.stats()["lease_count"], 2)
+
+    def test_pool_never_launches_more_than_size(self):
+        pool = FakeDriverPool(2, lease_timeout=0.2)
+        with pool.lease(), pool.lease():
+            self.assertEqual(pool.stats()["occupancy"], 1.0)
+            with self.assertRaises(TimeoutError):
+                with pool.lease():
+                    pass
+        self.assertEqual(len(pool.launched), 2)
+        self.assertEqual(pool.stats()["lease_timeouts"], 1)
+
+    def test_waiting_lease_gets_released_driver(self):
+        pool = FakeDriverPool(1, lease_timeout=5)
+        got = []
+
+        def wait_for_driver():
+            with pool.lease() as driver:
+                got.append(driver)
+
+        with pool.lease() as held:
+            waiter = threading.Thread(target=wait_for_driver)
+            waiter.start()
+            waiter.join(0.2)
+            self.assertEqual(got, [])
+        waiter.join(5)
+        self.assertEqual(got, [held])
+
+    def test_broken_driver_is_recycled(self):
+        pool = FakeDriverPool(1)
+        with self.assertRaises(ValueError):
+            with pool.lease() as driver:
+                driver.alive = False
+                raise ValueError("page error")
+        self.assertTrue(driver.quit_called)
+        with pool.lease() as replacement:
+            self.assertIsNot(replacement, driver)
+        self.assertEqual(pool.stats()["recycled"], 1)
+
+    def test_healthy_driver_survives_page_error(self):
+        pool = FakeDriverPool(1)
+        with self.assertRaises(ValueError):
+            with pool.lease() as driver:
+                raise ValueError("page error")
+        with pool.lease() as again:
+            self.assertIs(again, driver)
+        self.assertEqual(pool.stats()["recycled"], 0)
+
+    def test_idle_driver_is_health_checked_before_reuse(self):
+        pool = FakeDriverPool(1, health_check_idle=0)
+        with pool.lease() as driver:
+            pass
+        driver.alive = False
+        with pool.lease() as replacement:
+            self.assertIsNot(replacement, driver)
+        self.assertEqual(pool.stats()["recycled"], 1)
+
+    def test_shutdown_quits_idle_drivers(self):
+        pool = FakeDriverPool(1)
+        with pool.lease() as driver:
+            pass
+        pool.shutdown()
+        self.assertTrue(driver.quit_called)
+        with self.assertRaises(RuntimeError):
+            with pool.lease():
+                pass
+
+
+class DriverRecycleTest(unittest.TestCase):
+    def test_driver_over_memory_limit_is_replaced(self):
+        pool = FakeDriverPool(1, max_rss_mb=200, rss_check_interval=0)
+        with pool.lease() as driver:
+            pass
+        with pool.lease() as again:
+            self.assertIs(again, driver)
+            driver.rss = 300 * 1024 * 1024
+        self.assertTrue(driver.quit_called)
+
+        # 대신할 드라이버는 다음 대여 전에 백그라운드에서 미리 띄운다.
+        pool.wait_warmup()
+        self.assertEqual(len(pool.launched), 2)
+        with pool.lease() as replacement:
+            self.assertIs(replacement, pool.launched[1])
+        stats = pool.stats()
+        self.assertEqual((stats["recycled"], stats["recycled_rss"], stats["recycled_age"]), (1, 1, 0))
+        self.assertEqual(stats["rss"], 100 * 1024 * 1024)
+
+    def test_memory_is_measured_at_most_once_per_interval(self):
+        pool = FakeDriverPool(1, max_rss_mb=200, rss_check_interval=3600)
+        for _ in range(3):
+            with pool.lease():
+                pass
+        self.assertEqual(pool.measured, 1)
+
+    def test_driver_over_age_is_replaced_on_release(self):
+        pool = FakeDriverPool(1, max_age_min=10)
+        with pool.lease() as driver:
+            pool.age(driver, 11 * 60)
+        self.assertTrue(driver.quit_called)
+        pool.wait_warmup()
+        self.assertEqual(pool.stats()["recycled_age"], 1)
+        self.assertLess(pool.stats()["oldest_age"], 60)
+
+    def test_expired_idle_driver_is_replaced_before_lease(self):
+        pool = FakeDriverPool(1, max_age_min=10)
+        with pool.lease() as driver:
+            pass
+        pool.age(driver, 11 * 60)
+        with pool.lease() as replacement:
+            self.assertIsNot(replacement, driver)
+        self.assertTrue(driver.quit_called)
+        self.assertEqual(pool.stats()["recycled_age"], 1)
+
+    def test_no_limits_keeps_driver(self):
+        pool = FakeDriverPool(1)
+        with pool.lease() as driver:
+            pool.age(driver, 30 * 24 * 3600)
+            driver.rss = 10 * 1024 * 1024 * 1024
+        with pool.lease() as again:
+            self.assertIs(again, driver)
+        self.assertEqual(pool.measured, 0)
+        self.assertEqual(pool.stats()["recycled"], 0)
+
+
+class LeanOptionsTest(unittest.TestCase):
+    @unittest.skipIf(webdriver is None, "selenium 이 설치되어 있지 않습니다")
+    def test_lean_disables_images_and_extensions(self):
+        options = DriverPool(1, lean=True)._build_options()
+        self.assertIn("--blink-settings=imagesEnabled=false", options.arguments)
+        self.assertIn("--disable-extensions", options.arguments)
+        self.assertNotIn("--disable-extensions", DriverPool(1, lean=False)._build_options().arguments)
+
+    def test_extra_blocked_urls_are_appended(self):
+        pool = DriverPool(1, blocked_urls=["*ads.example.com*"])
+        self.assertEqual(pool.blocked_urls[-1], "*ads.example.com*")
+        self.assertIn("*.woff2", pool.blocked_urls)
+
+
+if __name__ == "__main__":
+    unittest.main()
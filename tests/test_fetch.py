@@ -0,0 +1,151 @@
+import gzip
+import json
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import (
+    FallbackFetchBackend, FetchError, HttpFetchBackend, HttpResponse, PostRow, SeleniumFetchBackend,
+    decode_body, parse_article_list_json, parse_board_html, parse_board_url, webdriver,
+)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+BOARD_URL = "https://cafe.naver.com/f-e/cafes/10050146/menus/12"
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+class FakeConnPool:
+    # 요청 주소를 기록하고 정해진 응답을 돌려준다.
+    def __init__(self, response):
+        self.response = response
+        self.urls = []
+
+    def request(self, method, url, headers=None, body=None):
+        self.urls.append(url)
+        return self.response
+
+
+class FakeBackend:
+    def __init__(self, name, rows=None, error=None):
+        self.name = name
+        self.rows = rows
+        self.error = error
+        self.calls = 0
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.rows
+
+
+class ParseTest(unittest.TestCase):
+    def test_board_url_forms(self):
+        self.assertEqual(parse_board_url(BOARD_URL), {"clubid": "10050146", "menuid": "12"})
+        iframe = "https://cafe.naver.com/mycafe?iframe_url=/ArticleList.nhn%3Fsearch.clubid=7%26search.menuid=3"
+        self.assertEqual(parse_board_url(iframe), {"clubid": "7", "menuid": "3"})
+        self.assertIsNone(parse_board_url("https://cafe.naver.com/mycafe"))
+
+    def test_html_skips_notices(self):
+        rows = parse_board_html(read_fixture("board_list.html").decode("utf-8"))
+        self.assertEqual(len(rows), 50)
+        self.assertEqual(rows[0][:3], (48210, "하늘정원", "팬아트 올려요 #1"))
+
+    def test_json_matches_html(self):
+        html_rows = parse_board_html(read_fixture("board_list.html").decode("utf-8"))
+        json_rows = parse_article_list_json(read_fixture("article_list.json").decode("utf-8"))
+        # 작성 시각은 JSON 은 타임스탬프, HTML 은 "HH:MM" 이라 서로 다르므로 비교하지 않는다.
+        self.assertEqual([r[:3] for r in json_rows], [r[:3] for r in html_rows])
+
+    def test_json_error_status(self):
+        text = json.dumps({"message": {"status": "500", "error": {"msg": "boom"}}})
+        with self.assertRaises(FetchError):
+            parse_article_list_json(text)
+
+    def test_decode_body_falls_back_to_cp949(self):
+        resp = HttpResponse(200, {"content-type": "text/html"}, "한글".encode("cp949"))
+        self.assertEqual(decode_body(resp), "한글")
+
+
+class HttpFetchBackendTest(unittest.TestCase):
+    def test_json_request(self):
+        pool = FakeConnPool(HttpResponse(200, {"content-type": "application/json; charset=utf-8"}, read_fixture("article_list.json")))
+        rows = HttpFetchBackend(pool, mode="json").fetch_rows(BOARD_URL)
+        self.assertEqual(rows[0].article_id, 48210)
+        self.assertIn("search.clubid=10050146&search.menuid=12", pool.urls[0])
+
+    def test_html_request(self):
+        pool = FakeConnPool(HttpResponse(200, {}, read_fixture("board_list.html")))
+        rows = HttpFetchBackend(pool, mode="html").fetch_rows(BOARD_URL)
+        self.assertEqual(len(rows), 50)
+        self.assertIn("ArticleList.nhn", pool.urls[0])
+
+    def test_bad_status_raises(self):
+        pool = FakeConnPool(HttpResponse(403, {}, gzip.compress(b"")))
+        with self.assertRaises(FetchError):
+            HttpFetchBackend(pool).fetch_rows(BOARD_URL)
+
+    def test_unknown_url_raises(self):
+        with self.assertRaises(FetchError):
+            HttpFetchBackend(FakeConnPool(None)).fetch_rows("https://cafe.naver.com/mycafe")
+
+
+class ScriptDriver:
+    # execute_script 한 번으로 행 배열을 돌려주는 드라이버
+    def __init__(self, rows):
+        self.rows = rows
+        self.scripts = 0
+
+    def execute_script(self, script, *args):
+        self.scripts += 1
+        return self.rows
+
+
+class SeleniumExtractTest(unittest.TestCase):
+    def test_single_round_trip(self):
+        driver = ScriptDriver([["공지", "운영자", "규칙", ""], ["12", "작성자", "제목", "2024.01.02."],
+                               ["11", "", "", ""], ["10", "옛글", "", ""]])
+        rows = SeleniumFetchBackend(None).extract_rows(driver, min_id=10)
+        self.assertEqual(rows, [PostRow(12, "작성자", "제목"), PostRow(11, "", "")])
+        self.assertEqual(driver.scripts, 1)
+
+    def test_empty_result(self):
+        self.assertEqual(SeleniumFetchBackend(None).extract_rows(ScriptDriver(None)), [])
+
+    @unittest.skipIf(webdriver is None, "selenium 이 설치되어 있지 않습니다")
+    def test_loaded_page_without_list_is_ready(self):
+        # 글 목록이 없는 빈 게시판도 문서 로드가 끝나면 ready_timeout 을 기다리지 않는다.
+        driver = ScriptDriver(True)
+        backend = SeleniumFetchBackend(None, ready_timeout=5)
+        started = time.monotonic()
+        backend.wait_until_ready(driver, switch_frame=False)
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(driver.scripts, 1)
+
+
+class FallbackFetchBackendTest(unittest.TestCase):
+    def test_primary_success(self):
+        rows = [PostRow(1, "a", "b")]
+        primary, fallback = FakeBackend("http", rows=rows), FakeBackend("selenium", rows=[])
+        backend = FallbackFetchBackend(primary, fallback)
+        self.assertEqual(backend.fetch_rows(BOARD_URL), rows)
+        self.assertEqual(fallback.calls, 0)
+        self.assertEqual(backend.stats(), {"primary_ok": 1, "fallback_used": 0})
+
+    def test_fallback_on_error(self):
+        rows = [PostRow(2, "a", "b")]
+        primary, fallback = FakeBackend("http", error=FetchError("HTTP 500")), FakeBackend("selenium", rows=rows)
+        backend = FallbackFetchBackend(primary, fallback)
+        self.assertEqual(backend.fetch_rows(BOARD_URL), rows)
+        self.assertEqual(backend.stats(), {"primary_ok": 0, "fallback_used": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
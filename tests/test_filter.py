@@ -0,0 +1,108 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import AhoCorasick, MonitorScheduler, PostFilter, PostRow, compile_regex_list, normalize_filters
+
+
+def title_matches(patterns, title):
+    return any(r.search(title) for r in compile_regex_list(patterns))
+
+
+class AhoCorasickTest(unittest.TestCase):
+    def test_finds_any_pattern(self):
+        automaton = AhoCorasick(["he", "she", "his", "hers"])
+        self.assertTrue(automaton.search("ushers"))
+        self.assertTrue(automaton.search("ahis"))
+        self.assertFalse(automaton.search("hx shx"))
+
+    def test_overlapping_failure_links(self):
+        automaton = AhoCorasick(["abcd", "bc"])
+        self.assertTrue(automaton.search("xabcx"))
+        self.assertFalse(automaton.search("abdc"))
+
+    def test_case_insensitive_korean_and_latin(self):
+        automaton = AhoCorasick(["판매", "WTS"])
+        self.assertTrue(automaton.search("[wts] 중고"))
+        self.assertTrue(automaton.search("무료 판매합니다"))
+        self.assertFalse(automaton.search("구매합니다"))
+
+
+class PostFilterTest(unittest.TestCase):
+    def test_empty_filter_passes_everything(self):
+        self.assertTrue(PostFilter({}).matches(PostRow(1, "누구", "아무 글")))
+
+    def test_exclude_wins(self):
+        post_filter = PostFilter({"include_keywords": ["나눔"], "exclude_writers": ["광고봇"]})
+        self.assertTrue(post_filter.matches(PostRow(1, "이웃", "책 나눔")))
+        self.assertFalse(post_filter.matches(PostRow(2, "광고봇3", "책 나눔")))
+
+    def test_every_include_category_must_match(self):
+        post_filter = PostFilter({"include_writers": ["운영자"], "include_regex": [r"\[공지\]", r"^긴급"]})
+        self.assertTrue(post_filter.matches(PostRow(1, "운영자", "[공지] 점검")))
+        self.assertTrue(post_filter.matches(PostRow(2, "부운영자", "긴급 안내")))
+        self.assertFalse(post_filter.matches(PostRow(3, "회원", "[공지] 점검")))
+        self.assertFalse(post_filter.matches(PostRow(4, "운영자", "잡담")))
+
+    def test_exclude_regex(self):
+        post_filter = PostFilter({"exclude_regex": [r"\d+만원", "광고"]})
+        self.assertFalse(post_filter.matches(PostRow(1, "w", "10만원에 팝니다")))
+        self.assertTrue(post_filter.matches(PostRow(2, "w", "후기")))
+
+
+class NormalizeFiltersTest(unittest.TestCase):
+    def test_legacy_nickname_becomes_include_writer(self):
+        self.assertEqual(normalize_filters(None, "운영자"), {"include_writers": ["운영자"]})
+        self.assertEqual(normalize_filters({"include_writers": ["운영자"]}, "운영자"), {"include_writers": ["운영자"]})
+
+    def test_strips_blank_and_accepts_string(self):
+        self.assertEqual(normalize_filters({"include_keywords": "나눔", "exclude_keywords": [" ", " 광고 "]}),
+                         {"include_keywords": ["나눔"], "exclude_keywords": ["광고"]})
+
+    def test_invalid_rules(self):
+        for filters in (["나눔"], {"title": ["x"]}, {"include_keywords": [1]}, {"include_regex": ["("]}):
+            with self.assertRaises(ValueError):
+                normalize_filters(filters)
+
+
+class BoardFilterTest(unittest.TestCase):
+    def test_update_board_recompiles_filter(self):
+        scheduler = MonitorScheduler(None)
+        board = scheduler.add_board("a", "url", 30, filters={"include_keywords": ["나눔"]})
+        board.last_article_id = 1
+        rows = [PostRow(3, "w", "책 나눔"), PostRow(2, "w", "판매")]
+        self.assertEqual([r.article_id for r in board.check_new_posts(rows)], [3])
+
+        scheduler.update_board("a", filters={"include_keywords": ["판매"]})
+        board.last_article_id = 1
+        self.assertEqual([r.article_id for r in board.check_new_posts(rows)], [2])
+
+    def test_broken_config_falls_back_to_nickname(self):
+        board = MonitorScheduler(None).add_board("a", "url", 30, nickname_filter="운영자", filters={"include_regex": ["("]})
+        self.assertEqual(board.post_filter.filters, {"include_writers": ["운영자"]})
+
+
+class CompileRegexListTest(unittest.TestCase):
+    def test_backreferences_keep_their_own_groups(self):
+        # 합치면 두 번째 정규식의 \1 이 첫 번째 정규식의 그룹을 가리키게 된다.
+        patterns = [r"(a)\1", r"(b)\1"]
+        self.assertTrue(title_matches(patterns, "bb"))
+        self.assertTrue(title_matches(patterns, "aa"))
+        self.assertFalse(title_matches(patterns, "ab"))
+
+    def test_plain_patterns_are_combined(self):
+        compiled = compile_regex_list([r"\d+원", "나눔", r"(x)\1"])
+        self.assertEqual(len(compiled), 2)
+        self.assertTrue(title_matches([r"\d+원", "나눔", r"(x)\1"], "3000원에 팝니다"))
+
+    def test_post_filter_with_grouped_exclude(self):
+        post_filter = PostFilter({"exclude_regex": ["광고", r"(ㅋ)\1\1"]})
+        self.assertFalse(post_filter.matches(PostRow(1, "w", "ㅋㅋㅋ 웃긴 글")))
+        self.assertTrue(post_filter.matches(PostRow(2, "w", "ㅋ 한 번")))
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import FetchError, HttpFetchBackend, HttpResponse, parse_article_list_json, parse_board_html
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+BOARD_URL = "https://cafe.naver.com/f-e/cafes/10050146/menus/12"
+ERROR_BODY = json.dumps({"message": {"status": "500", "error": {"code": "9999", "msg": "일시 오류"}}}).encode("utf-8")
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+def article_list(*article_ids):
+    return json.dumps({"message": {"status": "200", "result": {"articleList": [
+        {"articleId": i, "menuId": 12, "subject": f"글 {i}", "writerNickname": "작성자"} for i in article_ids
+    ]}}}).encode("utf-8")
+
+
+class ScriptedConnPool:
+    # 미리 정한 응답을 차례대로 돌려주고 요청 헤더를 기록한다.
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.headers = []
+
+    def request(self, method, url, headers=None, body=None):
+        self.headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+class EtagConnPool:
+    # 준비한 (status, body, etag) 를 차례로 돌려주되, 보낸 If-None-Match 가 같으면 304 로 답한다.
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.headers = []
+
+    def request(self, method, url, headers=None, body=None):
+        headers = dict(headers or {})
+        self.headers.append(headers)
+        status, body, etag = self.responses.pop(0)
+        if status == 304 or headers.get("If-None-Match") == etag:
+            return HttpResponse(304, {"etag": etag}, b"")
+        return HttpResponse(status, {"etag": etag, "content-type": "application/json; charset=UTF-8"}, body)
+
+
+class ConditionalFetchTest(unittest.TestCase):
+    def test_not_modified_sends_validators(self):
+        ok = HttpResponse(200, {"etag": '"v1"', "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, read_fixture("article_list.json"))
+        pool = ScriptedConnPool([ok, HttpResponse(304, {}, b"")])
+        backend = HttpFetchBackend(pool)
+        state = {}
+
+        self.assertEqual(len(backend.fetch_rows(BOARD_URL, state)), 50)
+        self.assertIsNone(backend.fetch_rows(BOARD_URL, state))
+        self.assertEqual(pool.headers[1]["If-None-Match"], '"v1"')
+        self.assertEqual(pool.headers[1]["If-Modified-Since"], "Mon, 01 Jan 2024 00:00:00 GMT")
+
+    def test_unchanged_signature_skips_parsing(self):
+        # 조회수만 바뀐 목록은 글 번호 순서가 같으므로 "변경 없음"이다.
+        body = read_fixture("board_list.html")
+        changed_views = body.replace(b'<td class="td_view">10234</td>', b'<td class="td_view">10235</td>')
+        pool = ScriptedConnPool([HttpResponse(200, {}, body), HttpResponse(200, {}, changed_views)])
+        backend = HttpFetchBackend(pool, mode="html")
+        state = {}
+
+        self.assertEqual(len(backend.fetch_rows(BOARD_URL, state)), 50)
+        self.assertIsNone(backend.fetch_rows(BOARD_URL, state))
+        self.assertNotIn("If-None-Match", pool.headers[1])
+
+    def test_min_id_returns_only_new_rows(self):
+        pool = ScriptedConnPool([HttpResponse(200, {}, read_fixture("article_list.json"))])
+        rows = HttpFetchBackend(pool).fetch_rows(BOARD_URL, {}, min_id=48205)
+        self.assertEqual([r.article_id for r in rows], [48210, 48208])
+
+
+class ValidatorStateTest(unittest.TestCase):
+    def test_error_payload_is_not_remembered(self):
+        # 200 으로 온 오류 응답 뒤에도 매 폴링마다 오류가 드러나야 한다. (ETag/서명이 저장되면 None 으로 가려진다)
+        pool = EtagConnPool([(200, article_list(10, 9), '"a"'), (200, ERROR_BODY, '"err"'), (200, ERROR_BODY, '"err"')])
+        backend = HttpFetchBackend(pool)
+        state = {}
+
+        rows = backend.fetch_rows(BOARD_URL, state, None)
+        self.assertEqual([r.article_id for r in rows], [10, 9])
+        remembered = dict(state)
+
+        for _ in range(2):
+            with self.assertRaises(FetchError):
+                backend.fetch_rows(BOARD_URL, state, 10)
+            self.assertEqual(state, remembered)
+        self.assertEqual(pool.headers[-1].get("If-None-Match"), '"a"')
+
+    def test_unchanged_list_is_short_circuited_after_success(self):
+        pool = EtagConnPool([(200, article_list(10, 9), '"a"'), (200, article_list(10, 9), '"b"'),
+                             (200, article_list(11, 10, 9), '"c"')])
+        backend = HttpFetchBackend(pool)
+        state = {}
+        backend.fetch_rows(BOARD_URL, state, None)
+        self.assertIsNone(backend.fetch_rows(BOARD_URL, state, 10))
+        self.assertEqual([r.article_id for r in backend.fetch_rows(BOARD_URL, state, 10)], [11])
+        self.assertEqual(state["etag"], '"c"')
+
+    def test_cafe_entries_error_keeps_previous_etag(self):
+        pool = EtagConnPool([(200, article_list(10), '"a"'), (200, ERROR_BODY, '"err"'), (200, ERROR_BODY, '"err"')])
+        backend = HttpFetchBackend(pool)
+        state = {}
+        backend.fetch_cafe_entries("10050146", state)
+        for _ in range(2):
+            with self.assertRaises(FetchError):
+                backend.fetch_cafe_entries("10050146", state)
+        self.assertEqual(state["etag"], '"a"')
+
+
+class StopAtIdTest(unittest.TestCase):
+    def test_html_stops_at_known_id(self):
+        html = read_fixture("board_list.html").decode("utf-8")
+        self.assertEqual([r.article_id for r in parse_board_html(html, stop_at_id=48205)], [48210, 48208])
+        self.assertEqual(parse_board_html(html, stop_at_id=48210), [])
+
+    def test_json_matches_html(self):
+        html = read_fixture("board_list.html").decode("utf-8")
+        text = read_fixture("article_list.json").decode("utf-8")
+        self.assertEqual([r[:3] for r in parse_article_list_json(text, 48100)],
+                         [r[:3] for r in parse_board_html(html, 48100)])
+
+
+if __name__ == "__main__":
+    unittest.main()
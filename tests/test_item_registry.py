@@ -0,0 +1,44 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import ItemRegistry
+
+
+class ItemRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = ItemRegistry([{"id": "a"}, {"id": "b"}, {"id": "c"}])
+
+    def test_keeps_insertion_order(self):
+        self.registry.add({"id": "d"})
+        self.assertEqual(self.registry.ids(), ["a", "b", "c", "d"])
+        self.assertEqual([d["id"] for d in self.registry.to_list()], ["a", "b", "c", "d"])
+
+    def test_lookup(self):
+        self.assertEqual(self.registry.get("b"), {"id": "b"})
+        self.assertIsNone(self.registry.get("x"))
+        self.assertIn("c", self.registry)
+        self.assertNotIn("x", self.registry)
+        self.assertEqual(len(self.registry), 3)
+
+    def test_remove(self):
+        self.assertEqual(self.registry.remove("b"), {"id": "b"})
+        self.assertIsNone(self.registry.remove("b"))
+        self.assertEqual(self.registry.ids(), ["a", "c"])
+
+    def test_iteration_allows_removal(self):
+        # 순회 중에 항목을 지워도 RuntimeError 가 나지 않는다.
+        for data in self.registry:
+            self.registry.remove(data["id"])
+        self.assertEqual(len(self.registry), 0)
+
+    def test_replacing_keeps_position(self):
+        self.registry.add({"id": "a", "name": "새 이름"})
+        self.assertEqual(self.registry.ids(), ["a", "b", "c"])
+        self.assertEqual(self.registry.get("a")["name"], "새 이름")
+
+
+if __name__ == "__main__":
+    unittest.main()
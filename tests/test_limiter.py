@@ -0,0 +1,197 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import (
+    BlockedError, CircuitBreaker, CircuitOpenError, HttpFetchBackend, HttpResponse, MonitorScheduler,
+    PostRow, RateLimitError, RequestLimiter, SeleniumFetchBackend, TokenBucket, looks_blocked,
+)
+
+BOARD_URL = "https://cafe.naver.com/f-e/cafes/10050146/menus/12"
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=2.0, burst=2)
+        now = bucket.updated
+        for _ in range(2):
+            self.assertEqual(bucket.delay(now), 0.0)
+            bucket.take()
+        self.assertAlmostEqual(bucket.delay(now), 0.5)
+        self.assertEqual(bucket.delay(now + 0.5), 0.0)
+
+    def test_no_rate_means_no_limit(self):
+        bucket = TokenBucket(rate=0, burst=1)
+        for _ in range(10):
+            bucket.take()
+        self.assertEqual(bucket.delay(time.monotonic()), 0.0)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def test_open_half_open_closed(self):
+        breaker = CircuitBreaker(threshold=2, cooldown=10, ramp_steps=2)
+        breaker.failure(0)
+        self.assertEqual(breaker.state, "closed")
+        breaker.failure(0)
+        self.assertEqual(breaker.state, "open")
+        self.assertGreater(breaker.check(1), 0)
+
+        # 쿨다운(지터 포함 최대 12초)이 지나면 시험 요청 하나를 허용한다.
+        now = 13
+        self.assertEqual(breaker.check(now), 0.0)
+        self.assertEqual(breaker.state, "half_open")
+        self.assertGreater(breaker.check(now), 0)
+        breaker.success()
+
+        now += breaker.current_cooldown / 2
+        self.assertEqual(breaker.check(now), 0.0)
+        breaker.success()
+        self.assertEqual(breaker.state, "closed")
+        self.assertEqual(breaker.check(now), 0.0)
+
+    def test_half_open_failure_reopens_longer(self):
+        breaker = CircuitBreaker(threshold=1, cooldown=10, ramp_steps=3)
+        breaker.failure(0)
+        first = breaker.current_cooldown
+        breaker.check(13)
+        breaker.failure(13)
+        self.assertEqual(breaker.state, "open")
+        self.assertEqual(breaker.trips, 2)
+        self.assertGreater(breaker.current_cooldown, first)
+
+
+class RequestLimiterTest(unittest.TestCase):
+    def test_delay_within_max_wait(self):
+        limiter = RequestLimiter(per_host=10, host_burst=1, per_cafe=0, max_wait=5)
+        self.assertEqual(limiter.acquire("h", "1"), 0.0)
+        self.assertGreater(limiter.acquire("h", "1"), 0.0)
+        self.assertEqual(limiter.stats()["delayed"], 1)
+
+    def test_defers_beyond_max_wait(self):
+        limiter = RequestLimiter(per_host=0, per_cafe=0.1, cafe_burst=1, max_wait=1)
+        limiter.acquire("h", "1")
+        with self.assertRaises(RateLimitError) as ctx:
+            limiter.acquire("h", "1")
+        self.assertGreater(ctx.exception.retry_after, 1)
+        # 다른 카페는 영향이 없다.
+        self.assertEqual(limiter.acquire("h", "2"), 0.0)
+
+    def test_block_backs_off_whole_host(self):
+        limiter = RequestLimiter(per_host=0, per_cafe=0, max_wait=1, backoff_base=5)
+        limiter.record("h", "1", "blocked", retry_after=30)
+        with self.assertRaises(RateLimitError) as ctx:
+            limiter.acquire("h", "2")
+        self.assertGreaterEqual(ctx.exception.retry_after, 29)
+        self.assertEqual(limiter.stats()["hosts"]["h"]["backoff_level"], 1)
+
+    def test_failures_open_cafe_breaker(self):
+        limiter = RequestLimiter(per_host=0, per_cafe=0, breaker_threshold=2)
+        limiter.record("h", "1", "error")
+        limiter.record("h", "1", "error")
+        with self.assertRaises(CircuitOpenError):
+            limiter.acquire("h", "1")
+        self.assertEqual(limiter.acquire("h", "2"), 0.0)
+        self.assertEqual(limiter.stats()["paused_cafes"], 1)
+
+
+class FakeConnPool:
+    def __init__(self, response):
+        self.response = response
+
+    def request(self, method, url, headers=None, body=None):
+        return self.response
+
+
+class BlockDetectionTest(unittest.TestCase):
+    def test_429_with_retry_after(self):
+        limiter = RequestLimiter(per_host=0, per_cafe=0, max_wait=1)
+        backend = HttpFetchBackend(FakeConnPool(HttpResponse(429, {"retry-after": "60"}, b"")), limiter=limiter)
+        with self.assertRaises(BlockedError):
+            backend.fetch_rows(BOARD_URL)
+        with self.assertRaises(RateLimitError) as ctx:
+            backend.fetch_rows(BOARD_URL)
+        self.assertGreaterEqual(ctx.exception.retry_after, 59)
+
+    def test_block_page(self):
+        self.assertTrue(looks_blocked("<html>비정상적인 접근이 감지되었습니다</html>", '"articleList"'))
+        self.assertFalse(looks_blocked('{"articleList": [], "msg": "captcha"}', '"articleList"'))
+        backend = HttpFetchBackend(FakeConnPool(HttpResponse(200, {}, "자동입력 방지 문자를 입력하세요".encode("utf-8"))))
+        with self.assertRaises(BlockedError):
+            backend.fetch_rows(BOARD_URL)
+
+
+class BrokenPageDriver:
+    def get(self, url):
+        raise RuntimeError("page crashed")
+
+
+class FakeLeasePool:
+    # lease_error 가 있으면 드라이버를 빌려주지 못하고(대기 시간 초과 등), 없으면 페이지 오류가 나는 드라이버를 준다.
+    def __init__(self, lease_error=None):
+        self.lease_error = lease_error
+
+    @contextmanager
+    def lease(self):
+        if self.lease_error is not None:
+            raise self.lease_error
+        yield BrokenPageDriver()
+
+
+class SeleniumLimiterTest(unittest.TestCase):
+    def test_lease_timeout_is_not_a_cafe_failure(self):
+        limiter = RequestLimiter(per_host=0, per_cafe=0, breaker_threshold=1)
+        backend = SeleniumFetchBackend(FakeLeasePool(TimeoutError("드라이버 대기 시간 초과")), limiter=limiter)
+        for _ in range(3):
+            with self.assertRaises(TimeoutError):
+                backend.fetch_rows(BOARD_URL)
+        self.assertEqual(limiter.stats()["paused_cafes"], 0)
+
+    def test_page_error_counts_against_cafe(self):
+        limiter = RequestLimiter(per_host=0, per_cafe=0, breaker_threshold=1)
+        backend = SeleniumFetchBackend(FakeLeasePool(), limiter=limiter)
+        with self.assertRaises(RuntimeError):
+            backend.fetch_rows(BOARD_URL)
+        with self.assertRaises(CircuitOpenError):
+            backend.fetch_rows(BOARD_URL)
+
+
+class DeferringFetcher:
+    # 첫 요청은 요청 제한으로 미루고, 이후에는 정상 목록을 돌려준다.
+    def __init__(self, retry_after):
+        self.retry_after = retry_after
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        with self._lock:
+            self.calls.append(time.monotonic())
+            first = len(self.calls) == 1
+        if first:
+            raise RateLimitError("요청 제한", self.retry_after)
+        return [PostRow(1, "w", "t")]
+
+
+class SchedulerDeferTest(unittest.TestCase):
+    def test_limited_poll_is_deferred_not_error(self):
+        fetcher = DeferringFetcher(retry_after=0.5)
+        scheduler = MonitorScheduler(fetcher)
+        scheduler.start()
+        self.addCleanup(scheduler.stop)
+        scheduler.add_board("a", "url", 0.05)
+
+        deadline = time.monotonic() + 5
+        while len(fetcher.calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertGreaterEqual(len(fetcher.calls), 2)
+        self.assertGreaterEqual(fetcher.calls[1] - fetcher.calls[0], 0.45)
+        stats = scheduler.stats()
+        self.assertEqual((stats["limited"], stats["errors"]), (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import (LatencyStat, MonitorScheduler, PollMetrics, PollTrace, PostRow, parse_list_date,
+                            trace_phase, trace_value)
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+class TracingFetcher:
+    # 백엔드처럼 실행기 스레드에서 단계 시간을 남기고, 두 번째 조회부터 새 글을 돌려준다.
+    def __init__(self, posted_at):
+        self.posted_at = posted_at
+        self.calls = 0
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        self.calls += 1
+        with trace_phase("network"):
+            time.sleep(0.01)
+        trace_value("driver_rss", 1234)
+        if self.calls == 1:
+            return [PostRow(10, "작성자", "기준 글")]
+        return [PostRow(11, "작성자", "새 글", self.posted_at), PostRow(10, "작성자", "기준 글")]
+
+
+class LatencyStatTest(unittest.TestCase):
+    def test_quantiles_use_bucket_bounds(self):
+        stat = LatencyStat(buckets=(1, 5, 10))
+        for value in (0.5, 0.7, 3, 8):
+            stat.add(value)
+        self.assertEqual(stat.counts, [2, 1, 1])
+        self.assertEqual(stat.quantile(0.5), 1)
+        self.assertEqual(stat.quantile(0.95), 8)
+
+    def test_over_last_bucket_reports_max(self):
+        stat = LatencyStat(buckets=(1,))
+        stat.add(30)
+        self.assertEqual(stat.counts, [0])
+        self.assertEqual(stat.snapshot()["p95"], 30)
+        self.assertEqual(LatencyStat().snapshot()["avg"], 0.0)
+
+
+class PollTraceTest(unittest.TestCase):
+    def test_phases_accumulate(self):
+        trace = PollTrace()
+        trace.add("parse", 0.25)
+        trace.add("parse", 0.5)
+        with trace.phase("network"):
+            pass
+        self.assertEqual(trace.phases["parse"], 0.75)
+        self.assertIn("network", trace.phases)
+
+    def test_outside_poll_is_noop(self):
+        with trace_phase("network"):
+            trace_value("driver_rss", 1)
+
+
+class PollMetricsTest(unittest.TestCase):
+    def test_record_and_snapshot(self):
+        metrics = PollMetrics()
+        trace = PollTrace()
+        trace.add("network", 0.2)
+        trace.add("total", 0.3)
+        trace.values.update(driver_rss=2048, driver_cpu=0.5)
+        metrics.record_poll("a", trace)
+        metrics.record_poll("a", trace)
+        metrics.record_lag("a", 12)
+        metrics.record_error("a", "TimeoutException: 느림")
+
+        board = metrics.board_snapshot("a")
+        self.assertEqual(board["poll"]["count"], 2)
+        self.assertEqual(board["driver_rss"], 2048)
+        self.assertEqual(board["driver_cpu"], 1.0)
+        self.assertEqual(board["lag"]["last"], 12)
+        self.assertEqual(metrics.last_error("a")[0], "TimeoutException: 느림")
+        self.assertEqual(set(metrics.snapshot()["phases"]), {"network", "total"})
+
+        metrics.forget("a")
+        self.assertIsNone(metrics.board_snapshot("a"))
+        self.assertEqual(metrics.last_error("a"), (None, None))
+
+    def test_prometheus_text(self):
+        metrics = PollMetrics()
+        trace = PollTrace()
+        trace.add("total", 0.3)
+        metrics.record_poll("a", trace)
+        metrics.record_error("a", "오류")
+
+        text = metrics.prometheus({"a": '공지 "1"'}, gauges=[("ncafe_boards", "gauge", "게시판 수", 1),
+                                                         ("ncafe_skipped", "gauge", "값 없음", None)])
+        self.assertIn("# TYPE ncafe_poll_phase_seconds histogram", text)
+        self.assertIn('ncafe_poll_phase_seconds_bucket{phase="total",le="0.5"} 1', text)
+        self.assertIn('ncafe_poll_phase_seconds_bucket{phase="total",le="+Inf"} 1', text)
+        self.assertIn('ncafe_board_errors_total{board="a",name="공지 \\"1\\""} 1', text)
+        self.assertIn("ncafe_boards 1", text)
+        self.assertNotIn("ncafe_skipped", text)
+        self.assertTrue(text.endswith("\n"))
+
+
+class ParseListDateTest(unittest.TestCase):
+    def test_today_time(self):
+        now = time.mktime((2024, 5, 1, 15, 0, 0, 0, 0, -1))
+        self.assertEqual(parse_list_date("14:30", now), now - 30 * 60)
+
+    def test_just_after_midnight_is_yesterday(self):
+        now = time.mktime((2024, 5, 1, 0, 5, 0, 0, 0, -1))
+        self.assertEqual(parse_list_date(" 23:50 ", now), now - 15 * 60)
+
+    def test_older_dates_are_unknown(self):
+        self.assertIsNone(parse_list_date("2024.04.30."))
+        self.assertIsNone(parse_list_date(""))
+        self.assertIsNone(parse_list_date(None))
+
+
+class SchedulerMetricsTest(unittest.TestCase):
+    def test_poll_records_phases_and_lag(self):
+        fetcher = TracingFetcher(posted_at=time.time() - 30)
+        scheduler = MonitorScheduler(fetcher)
+        scheduler.start()
+        try:
+            scheduler.add_board("a", "url", 0.2)
+            self.assertTrue(wait_until(lambda: scheduler.metrics.board_snapshot("a") is not None
+                                       and scheduler.metrics.board_snapshot("a")["lag"]["count"] == 1))
+        finally:
+            scheduler.stop()
+
+        board = scheduler.metrics.board_snapshot("a")
+        self.assertGreaterEqual(board["lag"]["last"], 30)
+        self.assertEqual(board["driver_rss"], 1234)
+        for name in ("queue_wait", "network", "fetch", "filter", "dispatch", "total"):
+            self.assertIn(name, board["last_phases"])
+        self.assertGreaterEqual(board["last_phases"]["network"], 0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import FileSink, NotifierHub, SinkChannel
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def post_event(n):
+    return {"type": "post", "item_id": "a", "article_id": n, "time": time.time()}
+
+
+class RecordingSink:
+    # send 호출마다 묶음을 기록한다. fail_times 번까지는 실패, delay 만큼 느리게 보낸다.
+    instances = []
+
+    def __init__(self, fail_times=0, delay=0.0):
+        self.fail_times = fail_times
+        self.delay = delay
+        self.batches = []
+        self.calls = 0
+        self.closed = False
+        RecordingSink.instances.append(self)
+
+    def send(self, events):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.calls <= self.fail_times:
+            raise ConnectionError("sink down")
+        self.batches.append([e["article_id"] for e in events])
+
+    def close(self):
+        self.closed = True
+
+
+class SinkChannelTest(unittest.TestCase):
+    def test_full_queue_drops_oldest(self):
+        channel = SinkChannel("c", None, queue_size=3, batch_size=2)
+        for n in range(5):
+            channel.put(post_event(n))
+        self.assertEqual(channel.stats()["dropped"], 2)
+        self.assertEqual([e["article_id"] for e in channel.take()], [2, 3])
+        self.assertEqual([e["article_id"] for e in channel.take()], [4])
+
+
+class NotifierHubTest(unittest.TestCase):
+    def setUp(self):
+        RecordingSink.instances = []
+        patcher = mock.patch.dict("nCafePostAlarm.SINK_TYPES", {"recording": RecordingSink})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def start_hub(self, *configs):
+        hub = NotifierHub([dict(config, type="recording") for config in configs])
+        hub.start()
+        self.addCleanup(hub.stop, 1)
+        return hub
+
+    def test_events_are_batched_in_order(self):
+        hub = self.start_hub({"batch_size": 3, "batch_delay": 0.1})
+        for n in range(7):
+            hub.publish(post_event(n))
+        hub.publish({"type": "error", "item_id": "a"})
+        sink = RecordingSink.instances[0]
+
+        self.assertTrue(wait_until(lambda: hub.stats()["recording-0"]["delivered"] == 7))
+        self.assertEqual([n for batch in sink.batches for n in batch], list(range(7)))
+        self.assertTrue(all(len(batch) <= 3 for batch in sink.batches))
+        self.assertLessEqual(len(sink.batches), 4)
+
+    def test_failed_send_is_retried(self):
+        hub = self.start_hub({"fail_times": 2, "backoff": 0.01, "batch_delay": 0})
+        hub.publish(post_event(1))
+        self.assertTrue(wait_until(lambda: hub.stats()["recording-0"]["delivered"] == 1))
+        stats = hub.stats()["recording-0"]
+        self.assertEqual((stats["retried"], stats["failed"]), (2, 0))
+        self.assertEqual(stats["last_error"], "sink down")
+
+    def test_gives_up_after_retries(self):
+        hub = self.start_hub({"fail_times": 10, "retries": 1, "backoff": 0.01, "batch_delay": 0})
+        hub.publish(post_event(1))
+        self.assertTrue(wait_until(lambda: hub.stats()["recording-0"]["failed"] == 1))
+        self.assertEqual(hub.stats()["recording-0"]["delivered"], 0)
+
+    def test_slow_sink_does_not_block_others(self):
+        hub = self.start_hub({"name": "slow", "delay": 1.0, "batch_delay": 0}, {"name": "fast", "batch_delay": 0})
+        started = time.monotonic()
+        hub.publish(post_event(1))
+        hub.publish(post_event(2))
+        self.assertTrue(wait_until(lambda: hub.stats()["fast"]["delivered"] == 2, timeout=0.8))
+        self.assertLess(time.monotonic() - started, 0.8)
+
+    def test_publish_does_not_wait_for_sinks(self):
+        hub = self.start_hub({"delay": 0.5, "batch_delay": 0})
+        started = time.monotonic()
+        for n in range(20):
+            hub.publish(post_event(n))
+        self.assertLess(time.monotonic() - started, 0.2)
+
+    def test_bad_config_is_skipped(self):
+        hub = NotifierHub([{"type": "pager"}, {"type": "recording"}])
+        self.assertEqual([c.name for c in hub.channels], ["recording-1"])
+
+    def test_stop_closes_sinks(self):
+        hub = NotifierHub([{"type": "recording", "batch_delay": 0}])
+        hub.start()
+        hub.publish(post_event(1))
+        hub.stop(1)
+        self.assertTrue(RecordingSink.instances[0].closed)
+        self.assertEqual(RecordingSink.instances[0].batches, [[1]])
+
+
+class FileSinkTest(unittest.TestCase):
+    def test_appends_ndjson(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir, True)
+        sink = FileSink(os.path.join(tmpdir, "posts.ndjson"))
+        sink.send([{"article_id": 1, "title": "첫 글"}])
+        sink.send([{"article_id": 2}, {"article_id": 3}])
+        with open(sink.path, encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual([e["article_id"] for e in lines], [1, 2, 3])
+        self.assertEqual(lines[0]["title"], "첫 글")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from nCafePostAlarm import (DEFAULT_SETTINGS, DriverPool, HttpConnectionPool, MonitorScheduler, create_fetch_backend,
+                            parse_board_html)
+from replay_server import ReplayCafe, start_replay_server
+
+
+def wait_until(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+class ReplayCafeTest(unittest.TestCase):
+    def test_boards_share_id_counter(self):
+        cafe = ReplayCafe(3, seed=5, initial_posts=20)
+        ids = [p["id"] for p in cafe.listing(1, per_page=100)]
+        self.assertEqual(ids, sorted(ids, reverse=True))
+        # 다른 게시판/건너뛴 번호 때문에 한 게시판 안에서는 번호가 이어지지 않는다.
+        self.assertTrue(any(a - b > 1 for a, b in zip(ids, ids[1:])))
+
+    def test_paging_and_deletion(self):
+        cafe = ReplayCafe(1, seed=5, initial_posts=30)
+        page1 = cafe.listing(1, page=1, per_page=10)
+        page2 = cafe.listing(1, page=2, per_page=10)
+        self.assertGreater(page1[-1]["id"], page2[0]["id"])
+
+        deleted = cafe.delete_recent()
+        self.assertIn(deleted, cafe.deleted)
+        self.assertNotIn(deleted, [p["id"] for p in cafe.listing(1, per_page=100)])
+
+    def test_cafe_wide_listing_mixes_boards(self):
+        cafe = ReplayCafe(3, seed=5, initial_posts=10)
+        posts = cafe.listing(0, per_page=30)
+        self.assertEqual({p["menuid"] for p in posts}, {1, 2, 3})
+        self.assertEqual([p["id"] for p in posts], sorted((p["id"] for p in posts), reverse=True))
+
+
+class ReplayServerTest(unittest.TestCase):
+    def setUp(self):
+        self.cafe = ReplayCafe(2, seed=3, initial_posts=60)
+        self.server = start_replay_server(self.cafe)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.http_pool = HttpConnectionPool(2, 5)
+        self.driver_pool = DriverPool(1)
+
+    def tearDown(self):
+        self.driver_pool.shutdown()
+        self.http_pool.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def board_url(self, menuid):
+        return f"{self.base}/ArticleList.nhn?search.clubid=1&search.menuid={menuid}"
+
+    def fetcher(self, **settings):
+        settings = dict(DEFAULT_SETTINGS, naver_api_base=self.base, naver_web_base=self.base,
+                        selenium_fallback=False, **settings)
+        return create_fetch_backend(settings, self.driver_pool, self.http_pool)
+
+    def test_html_frame_parses_like_recorded_page(self):
+        response = self.http_pool.request("GET", self.board_url(1) + "&userDisplay=50")
+        rows = parse_board_html(response.body.decode("utf-8"))
+        self.assertEqual([r.article_id for r in rows], [p["id"] for p in self.cafe.listing(1)])
+        # 녹화한 페이지의 공지 행은 글 목록에 섞이지 않는다.
+        self.assertTrue(all(r.writer for r in rows))
+
+    def test_json_and_html_backends_agree(self):
+        state = {}
+        json_rows = self.fetcher(fetch_backend="http", http_mode="json", cafe_aggregation=False).fetch_rows(
+            self.board_url(1), state)
+        html_rows = self.fetcher(fetch_backend="http", http_mode="html", cafe_aggregation=False).fetch_rows(
+            self.board_url(1), {})
+        self.assertEqual([r[:3] for r in json_rows], [r[:3] for r in html_rows])
+
+        # 새 글이 없으면 ETag 로 304 를 받는다.
+        fetcher = self.fetcher(fetch_backend="http", http_mode="json", cafe_aggregation=False)
+        self.assertIsNone(fetcher.fetch_rows(self.board_url(1), state))
+        self.assertEqual(self.server.not_modified, 1)
+
+    def test_scheduler_alarms_each_new_post_once(self):
+        alarms = []
+        ready = threading.Event()
+        scheduler = MonitorScheduler(
+            self.fetcher(fetch_backend="http", http_mode="json", cafe_aggregation=False),
+            callback_init=lambda item_id, last_id: ready.set(),
+            callback_found=lambda item_id, row: alarms.append(row.article_id),
+        )
+        scheduler.add_board("m1", self.board_url(1), 0.2)
+        scheduler.start()
+        try:
+            self.assertTrue(ready.wait(10))
+            posted = [self.cafe.add_post(menuid=1)["id"] for _ in range(3)]
+            self.cafe.add_post(menuid=2)
+            self.assertTrue(wait_until(lambda: len(alarms) >= 3))
+            time.sleep(0.5)
+        finally:
+            scheduler.stop()
+        self.assertEqual(sorted(alarms), posted)
+
+
+if __name__ == "__main__":
+    unittest.main()
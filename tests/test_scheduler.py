@@ -0,0 +1,85 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import BoardMonitor, MonitorScheduler, PostRow
+
+
+class FakeFetcher:
+    # 호출될 때마다 글 번호가 하나씩 늘어난 목록을 돌려준다.
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls += 1
+            top = 100 + self.calls
+        return [PostRow(top, "작성자", "제목"), PostRow(top - 1, "다른사람", "제목")]
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+class BoardMonitorTest(unittest.TestCase):
+    def test_check_new_posts_with_filter(self):
+        board = BoardMonitor("a", "url", 1, "작성")
+        board.last_article_id = 10
+        rows = [PostRow(13, "작성자", ""), PostRow(12, "남", ""), PostRow(11, "작성자2", ""), PostRow(10, "작성자", "")]
+        self.assertEqual([r.article_id for r in board.check_new_posts(rows)], [13, 11])
+        self.assertEqual(board.last_article_id, 13)
+
+
+class MonitorSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.inits = []
+        self.found = []
+        self.fetcher = FakeFetcher(delay=0.05)
+        self.scheduler = MonitorScheduler(
+            self.fetcher,
+            callback_init=lambda item_id, last_id: self.inits.append((item_id, last_id)),
+            callback_found=lambda item_id, row: self.found.append((item_id, row.article_id)),
+        )
+        self.scheduler.start()
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+    def test_single_in_flight_board_keeps_polling(self):
+        # 유일한 게시판이 폴링 중이면 큐가 비므로, 폴링이 끝난 뒤 루프가 깨어나야 다음 예약이 돈다.
+        self.scheduler.add_board("a", "url", 0.1)
+        self.assertTrue(wait_until(lambda: self.fetcher.calls >= 4))
+        self.assertEqual(self.inits, [("a", 101)])
+        self.assertIn(("a", 102), self.found)
+
+    def test_removed_board_stops_polling(self):
+        self.scheduler.add_board("a", "url", 0.1)
+        self.assertTrue(wait_until(lambda: self.fetcher.calls >= 1))
+        self.scheduler.remove_board("a")
+        time.sleep(0.2)
+        calls = self.fetcher.calls
+        time.sleep(0.3)
+        self.assertEqual(self.fetcher.calls, calls)
+
+    def test_interval_update_reschedules(self):
+        self.scheduler.add_board("a", "url", 60)
+        self.assertTrue(wait_until(lambda: self.fetcher.calls >= 1))
+        time.sleep(0.1)
+        self.scheduler.update_board("a", interval=0.1)
+        self.assertTrue(wait_until(lambda: self.fetcher.calls >= 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
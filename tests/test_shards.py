@@ -0,0 +1,294 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nCafePostAlarm
+from nCafePostAlarm import (DEFAULT_SETTINGS, SHARD_EMPTY_STATS, DriverPool, HttpConnectionPool, MonitorEngine,
+                            MonitorScheduler, PostRow, ShardSupervisor, merge_stats, shard_worker_settings)
+
+
+def board_url(clubid, menuid):
+    return f"https://cafe.naver.com/f-e/cafes/{clubid}/menus/{menuid}"
+
+
+class FakeProcess:
+    pid = 1234
+    exitcode = None
+
+    def __init__(self):
+        self.alive = True
+
+    def is_alive(self):
+        return self.alive
+
+
+class RecordingQueue:
+    def __init__(self):
+        self.items = []
+
+    def put(self, item):
+        self.items.append(item)
+
+
+class FakeSupervisor(ShardSupervisor):
+    # 작업 프로세스를 띄우지 않고, 프로세스별로 보낸 명령을 기록한다.
+    def __init__(self, workers=2, **kwargs):
+        super().__init__(dict(DEFAULT_SETTINGS), workers, **kwargs)
+        for index in range(self.workers):
+            self._start_worker(index)
+
+    def _start_worker(self, index):
+        shard = self.shards[index]
+        shard.update(process=FakeProcess(), commands=RecordingQueue(), restart_at=None)
+        for item_id in shard["boards"]:
+            self._send_add(item_id)
+
+    def sent(self, index):
+        return self.shards[index]["commands"].items
+
+
+class MergeStatsTest(unittest.TestCase):
+    def test_sum_max_and_average(self):
+        merged = merge_stats([
+            {"polls": 3, "lag_max": 1.0, "wait_avg": 2.0, "occupancy": 0.5, "budget_factor": 1.0, "backend": "http",
+             "hosts": {"a": 1}},
+            {"polls": 4, "lag_max": 3.0, "wait_avg": 4.0, "occupancy": 1.0, "budget_factor": 2.0, "backend": "http",
+             "hosts": {"b": 2}},
+            {},
+        ])
+        self.assertEqual(merged["polls"], 7)
+        self.assertEqual(merged["lag_max"], 3.0)
+        self.assertEqual(merged["wait_avg"], 3.0)
+        self.assertEqual(merged["occupancy"], 0.75)
+        self.assertEqual(merged["budget_factor"], 2.0)
+        self.assertEqual(merged["backend"], "http")
+        self.assertEqual(merged["hosts"], {"a": 1, "b": 2})
+        self.assertEqual(merge_stats([]), {})
+
+    def test_empty_stats_match_real_keys(self):
+        # 작업 프로세스가 보낼 통계와 같은 키여야 합쳐진 값이 어긋나지 않는다.
+        self.assertEqual(set(SHARD_EMPTY_STATS["scheduler"]), set(MonitorScheduler(None).stats()))
+        self.assertEqual(set(SHARD_EMPTY_STATS["http_pool"]), set(HttpConnectionPool().stats()))
+        self.assertEqual(set(SHARD_EMPTY_STATS["driver_pool"]), set(DriverPool(1).stats()))
+
+
+class WorkerSettingsTest(unittest.TestCase):
+    def test_limits_are_divided(self):
+        settings = dict(DEFAULT_SETTINGS, shard_workers=4, rate_limit_per_host=8.0, rate_limit_host_burst=8,
+                        request_budget_per_min=120, notifiers=[{"type": "file"}])
+        worker = shard_worker_settings(settings, 4)
+        self.assertEqual(worker["shard_workers"], 0)
+        self.assertEqual(worker["notifiers"], [])
+        self.assertEqual(worker["rate_limit_per_host"], 2.0)
+        self.assertEqual(worker["rate_limit_host_burst"], 2)
+        self.assertEqual(worker["request_budget_per_min"], 30)
+
+
+class PlacementTest(unittest.TestCase):
+    def test_same_cafe_shares_a_worker(self):
+        supervisor = FakeSupervisor(workers=2)
+        supervisor.add_board("a1", board_url(1, 1), 10)
+        supervisor.add_board("b1", board_url(2, 1), 10)
+        supervisor.add_board("a2", board_url(1, 2), 10)
+        supervisor.add_board("c1", board_url(3, 1), 10)
+
+        shard_of = {item_id: board["shard"] for item_id, board in supervisor.boards.items()}
+        self.assertEqual(shard_of["a1"], shard_of["a2"])
+        self.assertNotEqual(shard_of["a1"], shard_of["b1"])
+        # 새 카페는 게시판이 적은 쪽으로 간다.
+        self.assertEqual(shard_of["c1"], shard_of["b1"])
+        self.assertEqual([c[1] for c in supervisor.sent(shard_of["a1"]) if c[0] == "add"], ["a1", "a2"])
+
+    def test_rebalance_moves_one_cafe(self):
+        supervisor = FakeSupervisor(workers=2)
+        for menuid in range(3):
+            supervisor.add_board(f"a{menuid}", board_url(1, menuid), 10)
+        supervisor.add_board("b0", board_url(2, 0), 10)
+        supervisor.add_board("b1", board_url(2, 1), 10)
+        # 한 프로세스에 몰린 상황을 만든다.
+        for item_id in ("b0", "b1"):
+            supervisor.shards[1]["boards"].discard(item_id)
+            supervisor.shards[0]["boards"].add(item_id)
+            supervisor.boards[item_id]["shard"] = 0
+        supervisor.add_board("c0", board_url(3, 0), 10)
+
+        supervisor.rebalance()
+        self.assertEqual(supervisor.moved, 2)
+        self.assertEqual(supervisor.shards[1]["boards"], {"c0", "b0", "b1"})
+        self.assertIn(("remove", "b0"), supervisor.sent(0))
+
+        # 이전 프로세스가 놓아 준 번호부터 새 프로세스가 이어서 감시한다.
+        supervisor._handle_event(0, ("removed", "b0", 700, True))
+        self.assertEqual(supervisor.sent(1)[-1][:2], ("add", "b0"))
+        self.assertEqual(supervisor.sent(1)[-1][2]["resume_from"], 700)
+
+    def test_balanced_shards_stay_put(self):
+        supervisor = FakeSupervisor(workers=2)
+        supervisor.add_board("a", board_url(1, 1), 10)
+        supervisor.add_board("b", board_url(2, 1), 10)
+        supervisor.rebalance()
+        self.assertEqual(supervisor.moved, 0)
+
+
+class EventForwardingTest(unittest.TestCase):
+    def test_events_reach_callbacks(self):
+        found = []
+        errors = []
+        supervisor = FakeSupervisor(workers=2, callback_found=lambda item_id, row: found.append((item_id, row)),
+                                    callback_error=lambda item_id, msg: errors.append(msg))
+        supervisor.add_board("a", board_url(1, 1), 10, resume_from=100)
+        index = supervisor.boards["a"]["shard"]
+
+        supervisor._handle_event(index, ("found", "a", (105, "작성자", "제목", None)))
+        supervisor._handle_event(index, ("error", "a", "timeout"))
+        supervisor._handle_event(index, ("poll", "a", {"total": 0.2}, {}))
+        self.assertEqual(found[0][1].article_id, 105)
+        self.assertEqual(errors, ["timeout"])
+        self.assertEqual(supervisor.get_last_article_id("a"), 105)
+        self.assertEqual(supervisor.metrics.board_snapshot("a")["poll"]["count"], 1)
+
+        # 게시판을 맡지 않은 프로세스가 보낸 이벤트는 버린다.
+        supervisor._handle_event(1 - index, ("found", "a", (106, "작성자", "제목", None)))
+        self.assertEqual(len(found), 1)
+
+    def test_restart_resumes_from_last_seen_id(self):
+        supervisor = FakeSupervisor(workers=2)
+        supervisor.add_board("a", board_url(1, 1), 10)
+        index = supervisor.boards["a"]["shard"]
+        supervisor._handle_event(index, ("init", "a", 300))
+
+        supervisor._restart_worker(index)
+        add = [c for c in supervisor.sent(index) if c[0] == "add"][-1]
+        self.assertEqual(add[2]["resume_from"], 300)
+        self.assertEqual(supervisor.stats()["worker_restarts"], 1)
+
+
+class ShardHandoverTest(unittest.TestCase):
+    def setUp(self):
+        self.found = []
+        self.supervisor = FakeSupervisor(workers=2, callback_found=lambda item_id, row: self.found.append((item_id, row.article_id)))
+        for n in range(4):
+            self.supervisor.add_board(f"b{n}", board_url(n, 1), 30)
+        self.supervisor.remove_board("b1")
+        self.supervisor.remove_board("b3")
+        self.supervisor.rebalance()
+        self.moved = next(item_id for item_id, b in self.supervisor.boards.items() if b["move_from"] is not None)
+        self.src, self.dst = self.supervisor.boards[self.moved]["move_from"], self.supervisor.boards[self.moved]["shard"]
+
+    def test_found_from_old_shard_before_ack_is_delivered(self):
+        # 이전 프로세스가 101 을 찾고 곧바로 게시판을 놓아 준 경우: 101 알림이 사라지면 안 된다.
+        self.supervisor._handle_event(self.src, ("found", self.moved, tuple(PostRow(101, "w", "t"))))
+        self.supervisor._handle_event(self.src, ("removed", self.moved, 101, True))
+        self.assertEqual(self.found, [(self.moved, 101)])
+
+        board = self.supervisor.boards[self.moved]
+        self.assertIsNone(board["move_from"])
+        add = self.supervisor.sent(self.dst)[-1]
+        self.assertEqual(add[:2], ("add", self.moved))
+        self.assertEqual(add[2]["resume_from"], 101)
+
+    def test_new_shard_refinding_a_post_does_not_alarm_twice(self):
+        self.supervisor._handle_event(self.src, ("found", self.moved, tuple(PostRow(101, "w", "t"))))
+        self.supervisor._handle_event(self.src, ("removed", self.moved, 100, True))
+        self.supervisor._handle_event(self.dst, ("found", self.moved, tuple(PostRow(101, "w", "t"))))
+        self.supervisor._handle_event(self.dst, ("found", self.moved, tuple(PostRow(102, "w", "t"))))
+        self.assertEqual(self.found, [(self.moved, 101), (self.moved, 102)])
+
+    def test_release_timeout_still_hands_over(self):
+        # 이전 프로세스의 폴링이 끝나지 않았어도 알린 번호부터 넘긴다. (늦은 결과는 이전 프로세스가 버린다)
+        self.supervisor._handle_event(self.src, ("removed", self.moved, 100, False))
+        self.assertIsNone(self.supervisor.boards[self.moved]["move_from"])
+        self.assertEqual(self.supervisor.sent(self.dst)[-1][2]["resume_from"], 100)
+
+    def test_events_from_old_shard_after_ack_are_ignored(self):
+        self.supervisor._handle_event(self.src, ("removed", self.moved, 100, True))
+        self.supervisor._handle_event(self.src, ("found", self.moved, tuple(PostRow(103, "w", "t"))))
+        self.assertEqual(self.found, [])
+
+
+class SlowFetcher:
+    # 첫 조회(기준 글)는 바로, 두 번째 조회는 go 가 설정될 때까지 붙잡아 둔다.
+    name = "slow"
+
+    def __init__(self):
+        self.calls = 0
+        self.entered = threading.Event()
+        self.go = threading.Event()
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        self.calls += 1
+        if self.calls == 1:
+            return [PostRow(100, "w", "t")]
+        self.entered.set()
+        self.go.wait(5)
+        return [PostRow(101, "w", "t"), PostRow(100, "w", "t")]
+
+
+class ReleaseBoardTest(unittest.TestCase):
+    def test_release_waits_for_the_poll_in_flight(self):
+        fetcher = SlowFetcher()
+        scheduler = MonitorScheduler(fetcher)
+        scheduler.add_board("b", board_url(1, 1), 1)
+        scheduler.start()
+        try:
+            self.assertTrue(fetcher.entered.wait(5))
+            result = []
+            releaser = threading.Thread(target=lambda: result.append(scheduler.release_board("b")))
+            releaser.start()
+            time.sleep(0.2)
+            self.assertEqual(result, [])
+            fetcher.go.set()
+            releaser.join(5)
+            self.assertEqual(result, [(100, True)])
+            self.assertEqual(fetcher.calls, 2)
+        finally:
+            scheduler.stop()
+
+    def test_release_reports_timeout(self):
+        fetcher = SlowFetcher()
+        found = []
+        scheduler = MonitorScheduler(fetcher, callback_found=lambda item_id, row: found.append(row.article_id))
+        scheduler.add_board("b", board_url(1, 1), 1)
+        scheduler.start()
+        try:
+            self.assertTrue(fetcher.entered.wait(5))
+            self.assertEqual(scheduler.release_board("b", timeout=0.1), (100, False))
+            # 놓아 준 뒤 끝난 폴링의 새 글은 알리지 않는다.
+            fetcher.go.set()
+            time.sleep(0.3)
+            self.assertEqual(found, [])
+            self.assertEqual(scheduler.release_board("b"), (0, True))
+        finally:
+            scheduler.stop()
+
+
+class ShardEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.saved = nCafePostAlarm.CONFIG_FILE_PATH, nCafePostAlarm.STATE_DB_PATH
+        nCafePostAlarm.CONFIG_FILE_PATH = os.path.join(self.tmpdir, "config.json")
+        nCafePostAlarm.STATE_DB_PATH = os.path.join(self.tmpdir, "state.db")
+
+    def tearDown(self):
+        nCafePostAlarm.CONFIG_FILE_PATH, nCafePostAlarm.STATE_DB_PATH = self.saved
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_no_fetch_stack_in_supervisor_process(self):
+        engine = MonitorEngine(settings=dict(DEFAULT_SETTINGS, shard_workers=2), items=[])
+        self.assertIsNone(engine.driver_pool)
+        self.assertIsNone(engine.http_pool)
+        self.assertIsNone(engine.fetcher)
+        stats = engine.stats()
+        self.assertEqual(stats["driver_pool"]["in_use"], 0)
+        self.assertEqual(stats["http_pool"]["requests"], 0)
+        engine.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
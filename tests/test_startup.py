@@ -0,0 +1,153 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nCafePostAlarm
+from nCafePostAlarm import MonitorScheduler, PostRow, resolve_driver_path
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+class FakeManager:
+    installs = 0
+    path = None
+    error = None
+
+    def install(self):
+        FakeManager.installs += 1
+        if FakeManager.error is not None:
+            raise FakeManager.error
+        return FakeManager.path
+
+
+class DriverPathCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.driver = os.path.join(self.tmpdir, "chromedriver")
+        open(self.driver, "w").close()
+        FakeManager.installs, FakeManager.path, FakeManager.error = 0, self.driver, None
+
+        self._cache_path = nCafePostAlarm.DRIVER_CACHE_PATH
+        nCafePostAlarm.DRIVER_CACHE_PATH = os.path.join(self.tmpdir, "driver_cache.json")
+        nCafePostAlarm._driver_path = None
+        patcher = mock.patch("nCafePostAlarm.ChromeDriverManager", FakeManager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        nCafePostAlarm.DRIVER_CACHE_PATH = self._cache_path
+        nCafePostAlarm._driver_path = None
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def write_cache(self, age_days):
+        with open(nCafePostAlarm.DRIVER_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"path": self.driver, "resolved_at": time.time() - age_days * 86400}, f)
+
+    def test_installs_once_per_process(self):
+        threads = [threading.Thread(target=resolve_driver_path) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(resolve_driver_path(), self.driver)
+        self.assertEqual(FakeManager.installs, 1)
+
+    def test_fresh_cache_skips_install(self):
+        self.write_cache(age_days=1)
+        self.assertEqual(resolve_driver_path(max_age_days=7), self.driver)
+        self.assertEqual(FakeManager.installs, 0)
+
+    def test_stale_cache_used_when_offline(self):
+        self.write_cache(age_days=30)
+        FakeManager.error = OSError("offline")
+        self.assertEqual(resolve_driver_path(max_age_days=7), self.driver)
+        self.assertEqual(FakeManager.installs, 1)
+
+    def test_no_cache_and_offline_raises(self):
+        FakeManager.error = OSError("offline")
+        with self.assertRaises(OSError):
+            resolve_driver_path()
+
+
+class TrackingFetcher:
+    # 첫 조회 시각과 동시에 진행 중인 조회 수의 최대값을 기록한다.
+    def __init__(self, delay):
+        self.delay = delay
+        self.started = {}
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        with self._lock:
+            self.started.setdefault(url, time.monotonic())
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return [PostRow(1, "w", "t")]
+
+
+class EmptyBoardFetcher:
+    # 빈 게시판: 글 번호가 없어 첫 조회부터 "변경 없음"(None)이 돌아온다.
+    def __init__(self):
+        self.calls = 0
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        self.calls += 1
+        return None
+
+
+class StartupStaggerTest(unittest.TestCase):
+    def run_boards(self, fetcher, count, **options):
+        scheduler = MonitorScheduler(fetcher, max_concurrency=4, **options)
+        scheduler.start()
+        self.addCleanup(scheduler.stop)
+        for i in range(count):
+            scheduler.add_board(str(i), f"url{i}", 60)
+        self.assertTrue(wait_until(lambda: scheduler.stats()["startup_pending"] == 0))
+        return scheduler
+
+    def test_first_polls_are_spaced(self):
+        fetcher = TrackingFetcher(delay=0.0)
+        scheduler = self.run_boards(fetcher, 4, startup_concurrency=4, startup_ramp=0.1)
+        times = [fetcher.started[f"url{i}"] for i in range(4)]
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        self.assertTrue(all(gap >= 0.08 for gap in gaps), gaps)
+        self.assertIsNotNone(scheduler.board_stats("3")["time_to_baseline"])
+
+    def test_startup_concurrency_limit(self):
+        fetcher = TrackingFetcher(delay=0.1)
+        self.run_boards(fetcher, 4, startup_concurrency=1, startup_ramp=0.0)
+        self.assertEqual(fetcher.max_active, 1)
+
+    def test_empty_board_leaves_startup_after_first_fetch(self):
+        fetcher = EmptyBoardFetcher()
+        inits = []
+        scheduler = MonitorScheduler(fetcher, callback_init=lambda item_id, last_id: inits.append(last_id))
+        scheduler.start()
+        self.addCleanup(scheduler.stop)
+        scheduler.add_board("empty", "url", 60)
+        self.assertTrue(wait_until(lambda: scheduler.stats()["startup_pending"] == 0))
+        self.assertEqual(inits, [0])
+        self.assertEqual(fetcher.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import MonitorScheduler, PostRow, StateStore
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+class PagedFetcher:
+    # 글 번호 100..71 을 10개씩 페이지로 나눠 돌려준다.
+    def __init__(self, top=100, per_page=10):
+        self.top = top
+        self.per_page = per_page
+        self.pages = []
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        self.pages.append(page)
+        first = self.top - (page - 1) * self.per_page
+        rows = [PostRow(i, f"작성자{i}", f"제목{i}") for i in range(first, first - self.per_page, -1)]
+        if min_id is not None:
+            rows = [r for r in rows if r.article_id > min_id]
+        return rows
+
+
+class BlockingFetcher:
+    # 첫 요청은 release 될 때까지 붙잡아 둔다.
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def fetch_rows(self, url, state=None, min_id=None, page=1):
+        self.calls += 1
+        if self.calls == 1:
+            self.started.set()
+            self.release.wait(5)
+            return [PostRow(500, "옛 게시판", "")]
+        return [PostRow(10, "새 게시판", "")]
+
+
+class StateStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "state.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_survives_reopen(self):
+        store = StateStore(self.path, recent_per_board=3)
+        store.record_poll("a", 105, [PostRow(i, "w", "t") for i in range(101, 106)])
+        store.record_poll("b", 7)
+        store.close()
+
+        store = StateStore(self.path, recent_per_board=3)
+        self.assertEqual(store.load_all(), {"a": 105, "b": 7})
+        self.assertEqual([p["article_id"] for p in store.recent_posts("a")], [105, 104, 103])
+        store.close()
+
+    def test_forget_and_retain(self):
+        store = StateStore(self.path)
+        store.record_poll("a", 1, [PostRow(1, "w", "t")])
+        store.record_poll("b", 2)
+        store.record_poll("c", 3)
+        store.forget("a")
+        store.retain(["b"])
+        self.assertEqual(store.load_all(), {"b": 2})
+        self.assertEqual(store.recent_posts("a"), [])
+        store.close()
+
+
+class CatchUpTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.store = StateStore(os.path.join(self.tmpdir, "state.db"))
+        self.inits = []
+        self.found = []
+
+    def tearDown(self):
+        self.scheduler.stop()
+        self.store.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def start(self, fetcher, max_pages=5):
+        self.scheduler = MonitorScheduler(
+            fetcher,
+            callback_init=lambda item_id, last_id: self.inits.append(last_id),
+            callback_found=lambda item_id, row: self.found.append(row.article_id),
+            state_store=self.store,
+            catchup_max_pages=max_pages,
+        )
+        self.scheduler.start()
+
+    def test_missed_posts_across_pages(self):
+        fetcher = PagedFetcher()
+        self.start(fetcher)
+        self.scheduler.add_board("a", "url", 60, resume_from=85)
+
+        self.assertTrue(wait_until(lambda: self.store.load_all().get("a") == 100))
+        self.assertEqual(self.inits, [85])
+        self.assertEqual(self.found, list(range(100, 85, -1)))
+        self.assertEqual(fetcher.pages, [1, 2])
+
+    def test_catch_up_is_bounded(self):
+        fetcher = PagedFetcher()
+        self.start(fetcher, max_pages=2)
+        self.scheduler.add_board("a", "url", 60, resume_from=50)
+
+        self.assertTrue(wait_until(lambda: len(self.found) == 20))
+        self.assertEqual(fetcher.pages, [1, 2])
+
+    def test_replaced_board_drops_old_poll(self):
+        # 같은 id 로 주소가 바뀐 뒤 끝난 이전 폴링은 알림도, 저장도 하지 않는다.
+        fetcher = BlockingFetcher()
+        self.start(fetcher)
+        self.scheduler.add_board("a", "old-url", 60, resume_from=1)
+        self.assertTrue(fetcher.started.wait(5))
+
+        self.scheduler.remove_board("a")
+        self.store.forget("a")
+        self.scheduler.add_board("a", "new-url", 60)
+        self.assertTrue(wait_until(lambda: self.inits == [10]))
+
+        fetcher.release.set()
+        time.sleep(0.3)
+        self.assertEqual(self.inits, [10])
+        self.assertEqual(self.found, [])
+        self.assertEqual(self.store.load_all(), {"a": 10})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nCafePostAlarm import UiEventBatcher
+
+
+class FakeRoot:
+    # Tk 없이 root.after 예약만 기록한다.
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, callback):
+        self.scheduled.append((ms, callback))
+
+    def run_pending(self):
+        scheduled, self.scheduled = self.scheduled, []
+        for _, callback in scheduled:
+            callback()
+
+
+class UiEventBatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeRoot()
+        self.batches = []
+        self.batcher = UiEventBatcher(self.root, self.batches.append, frame_ms=16)
+
+    def test_one_flush_per_frame(self):
+        for i in range(100):
+            self.batcher.push(i)
+        self.assertEqual([ms for ms, _ in self.root.scheduled], [16])
+
+        self.root.run_pending()
+        self.assertEqual(self.batches, [list(range(100))])
+
+    def test_next_event_schedules_new_frame(self):
+        self.batcher.push("a")
+        self.root.run_pending()
+        self.batcher.push("b")
+        self.batcher.push("c")
+        self.assertEqual(len(self.root.scheduled), 1)
+        self.root.run_pending()
+        self.assertEqual(self.batches, [["a"], ["b", "c"]])
+
+    def test_push_from_worker_threads(self):
+        def worker(n):
+            for i in range(50):
+                self.batcher.push((n, i))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(self.root.scheduled), 1)
+        self.root.run_pending()
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(len(self.batches[0]), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()